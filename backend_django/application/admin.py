@@ -4,9 +4,12 @@ from django.contrib import admin
 from .models import (
     Application,
     ApplicationAttachment,
+    BatchOperationJob,
     InterviewCandidate,
     InterviewRoundRecord,
+    InterviewSmsJob,
     Job,
+    OAPushJob,
     Region,
     RegionField,
     UserProfile,
@@ -100,3 +103,57 @@ class InterviewRoundRecordAdmin(admin.ModelAdmin):
     )
     list_filter = ("round_no", "result")
     search_fields = ("candidate__application__name", "candidate__application__phone", "interviewer")
+
+
+@admin.register(OAPushJob)
+class OAPushJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "candidate",
+        "status",
+        "is_retry",
+        "error_code",
+        "locked_by",
+        "created_at",
+        "finished_at",
+    )
+    list_filter = ("status", "is_retry")
+    search_fields = ("candidate__application__name", "candidate__application__phone", "request_id")
+    raw_id_fields = ("candidate", "requested_by")
+
+
+@admin.register(InterviewSmsJob)
+class InterviewSmsJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "candidate",
+        "status",
+        "provider",
+        "is_retry",
+        "error_code",
+        "locked_by",
+        "created_at",
+        "finished_at",
+    )
+    list_filter = ("status", "provider", "is_retry")
+    search_fields = ("candidate__application__name", "candidate__application__phone", "request_id")
+    raw_id_fields = ("candidate", "requested_by")
+
+
+@admin.register(BatchOperationJob)
+class BatchOperationJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "action",
+        "status",
+        "total",
+        "processed",
+        "error_code",
+        "locked_by",
+        "created_at",
+        "finished_at",
+    )
+    list_filter = ("action", "status")
+    search_fields = ("request_id", "requested_by__username")
+    raw_id_fields = ("requested_by",)
+    exclude = ("item_ids", "outcomes")
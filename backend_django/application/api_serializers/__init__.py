@@ -2,8 +2,8 @@
 
 from .shared import build_public_file_url
 from .public import RegionFieldSerializer, RegionSerializer, JobSerializer, ApplicationCreateSerializer, ApplicationSerializer, ApplicationAttachmentSerializer, ApplicationAttachmentUploadSerializer
-from .admin import RegionAdminSerializer, RegionFieldAdminSerializer, JobAdminSerializer, JobBatchStatusSerializer, ApplicationAdminPhotoMixin, ApplicationAdminListSerializer, ApplicationAdminSerializer
-from .interview import InterviewCandidateBatchAddSerializer, InterviewCandidateBatchRemoveSerializer, InterviewCandidateBatchConfirmHireSerializer, InterviewCandidateListSerializer, InterviewPassedCandidateListSerializer, InterviewCandidateScheduleSerializer, InterviewCandidateCancelScheduleSerializer, InterviewCandidateResultSerializer, InterviewCandidateResendSmsSerializer, PassedCandidateOfferStatusSerializer, PassedCandidateRetryOAPushSerializer
+from .admin import RegionAdminSerializer, RegionFieldAdminSerializer, JobAdminSerializer, JobBatchStatusSerializer, ApplicationAdminPhotoMixin, ApplicationAdminListSerializer, ApplicationSearchResultSerializer, ApplicationAdminSerializer
+from .interview import InterviewCandidateBatchAddSerializer, InterviewCandidateBatchRemoveSerializer, InterviewCandidateBatchConfirmHireSerializer, InterviewCandidateListSerializer, InterviewPassedCandidateListSerializer, InterviewOutcomeFastSerializer, InterviewCandidateScheduleSerializer, InterviewCandidateCancelScheduleSerializer, InterviewCandidateResultSerializer, InterviewCandidateResendSmsSerializer, PassedCandidateOfferStatusSerializer, PassedCandidateRetryOAPushSerializer, BatchOperationJobCreateSerializer, BatchOperationJobSerializer
 from .logs import OperationLogListSerializer, OperationLogDetailSerializer, OperationLogQuerySerializer
 from .auth import RegisterSerializer, LoginSerializer, UserProfileSerializer, MeSerializer, AdminUserSerializer, AdminPasswordResetSerializer, ChangePasswordSerializer
 
@@ -22,18 +22,22 @@ __all__ = [
     "JobBatchStatusSerializer",
     "ApplicationAdminPhotoMixin",
     "ApplicationAdminListSerializer",
+    "ApplicationSearchResultSerializer",
     "ApplicationAdminSerializer",
     "InterviewCandidateBatchAddSerializer",
     "InterviewCandidateBatchRemoveSerializer",
     "InterviewCandidateBatchConfirmHireSerializer",
     "InterviewCandidateListSerializer",
     "InterviewPassedCandidateListSerializer",
+    "InterviewOutcomeFastSerializer",
     "InterviewCandidateScheduleSerializer",
     "InterviewCandidateCancelScheduleSerializer",
     "InterviewCandidateResultSerializer",
     "InterviewCandidateResendSmsSerializer",
     "PassedCandidateOfferStatusSerializer",
     "PassedCandidateRetryOAPushSerializer",
+    "BatchOperationJobCreateSerializer",
+    "BatchOperationJobSerializer",
     "OperationLogListSerializer",
     "OperationLogDetailSerializer",
     "OperationLogQuerySerializer",
@@ -59,6 +59,10 @@ class ApplicationAdminPhotoMixin(serializers.ModelSerializer):
 
     def get_photo_url(self, obj):
         attachments = getattr(obj, "photo_attachments", None)
+        if not isinstance(attachments, list):
+            ordered = getattr(obj, "ordered_attachments", None)
+            if isinstance(ordered, list):
+                attachments = [item for item in ordered if item.category == "photo"]
         attachment = None
         if isinstance(attachments, list):
             attachment = attachments[0] if attachments else None
@@ -88,6 +92,30 @@ class ApplicationAdminListSerializer(ApplicationAdminPhotoMixin):
             "created_at",
         ]
 
+class ApplicationSearchResultSerializer(ApplicationAdminListSerializer):
+    """全文检索结果：在列表字段基础上补充学校专业与所在人员池。"""
+
+    POOL_APPLICATIONS = "applications"
+    POOL_INTERVIEW = "interview"
+    POOL_PASSED = "passed"
+    POOL_TALENT = "talent_pool"
+
+    pool = serializers.SerializerMethodField()
+
+    class Meta(ApplicationAdminListSerializer.Meta):
+        fields = ApplicationAdminListSerializer.Meta.fields + ["graduate_school", "major", "pool"]
+
+    def get_pool(self, obj):
+        candidate = getattr(obj, "interview_candidate", None)
+        if candidate is None:
+            return self.POOL_APPLICATIONS
+        if candidate.status == InterviewCandidate.STATUS_COMPLETED:
+            if candidate.result == InterviewCandidate.RESULT_PASS:
+                return self.POOL_PASSED
+            if candidate.result == InterviewCandidate.RESULT_REJECT:
+                return self.POOL_TALENT
+        return self.POOL_INTERVIEW
+
 class ApplicationAdminSerializer(ApplicationAdminPhotoMixin):
     region_name = serializers.CharField(source="region.name", read_only=True)
     job_title = serializers.CharField(source="job.title", read_only=True)
@@ -149,8 +177,26 @@ class ApplicationAdminSerializer(ApplicationAdminPhotoMixin):
             "latest_interview_result",
         ]
 
+    @staticmethod
+    def prefetch_queryset(queryset):
+        """按 get_attachments / get_latest_interview_result / photo_url 的取值方式预取，查询数与行数无关。"""
+        return queryset.select_related("region", "job", "interview_candidate").prefetch_related(
+            Prefetch(
+                "attachments",
+                queryset=ApplicationAttachment.objects.order_by("-created_at", "-id"),
+                to_attr="ordered_attachments",
+            ),
+            Prefetch(
+                "interview_candidate__round_records",
+                queryset=InterviewRoundRecord.objects.exclude(result="").order_by("-round_no", "-id"),
+                to_attr="result_round_records",
+            ),
+        )
+
     def get_attachments(self, obj):
-        attachments = obj.attachments.all().order_by("-created_at", "-id")
+        attachments = getattr(obj, "ordered_attachments", None)
+        if not isinstance(attachments, list):
+            attachments = obj.attachments.all().order_by("-created_at", "-id")
         return [
             {
                 "id": attachment.id,
@@ -181,7 +227,11 @@ class ApplicationAdminSerializer(ApplicationAdminPhotoMixin):
         if not candidate:
             return None
 
-        latest_record = candidate.round_records.exclude(result="").order_by("-round_no", "-id").first()
+        result_records = getattr(candidate, "result_round_records", None)
+        if isinstance(result_records, list):
+            latest_record = result_records[0] if result_records else None
+        else:
+            latest_record = candidate.round_records.exclude(result="").order_by("-round_no", "-id").first()
         round_no = latest_record.round_no if latest_record else candidate.interview_round
         interviewer_names = (
             self._normalize_interviewer_names(
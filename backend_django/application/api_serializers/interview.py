@@ -1,5 +1,7 @@
 """按职责拆分的序列化器模块。"""
 from .shared import *
+from ..batch_jobs import batch_job_max_items
+from ..pagination import iter_keyset_batches, keyset_ordering
 
 class InterviewCandidateBatchAddSerializer(serializers.Serializer):
     """批量加入拟面试人员入参。"""
@@ -254,6 +256,91 @@ class InterviewPassedCandidateListSerializer(serializers.ModelSerializer):
     def get_third_round_interviewer_scores(self, obj):
         return self._round_interviewer_scores(obj, 3)
 
+class InterviewOutcomeFastSerializer:
+    """
+    结果池列表快速输出：候选人走 values() 行，轮次快照按批次一次分组查询，
+    输出与 InterviewPassedCandidateListSerializer 逐字段一致，省去逐行实例化模型与方法字段调用。
+    字段清单与取值路径直接读取 DRF 序列化器定义，两者不会漂移。
+    """
+
+    ROUND_NUMBERS = {"first": 1, "second": 2, "third": 3}
+    ROUND_DEFAULTS = {"at": None, "score": None, "interviewer": "", "interviewer_scores": []}
+    ROUND_COLUMNS = {
+        "at": "interview_at",
+        "score": "score",
+        "interviewer": "interviewer",
+        "interviewer_scores": "interviewer_scores",
+    }
+    batch_size = 1000
+
+    def __init__(self, context=None):
+        reference = InterviewPassedCandidateListSerializer(context=context or {})
+        fields = reference.fields
+        self._steps = []
+        value_paths = []
+        for name in InterviewPassedCandidateListSerializer.Meta.fields:
+            field = fields[name]
+            if isinstance(field, serializers.SerializerMethodField):
+                prefix, _, attr = name.partition("_round_")
+                self._steps.append((name, None, self.ROUND_NUMBERS[prefix], attr, None))
+                continue
+            path = field.source.replace(".", "__")
+            value_paths.append(path)
+            # values() 已按模型字段完成类型转换，只有时间字段需按 DRF 规则转本地时区并格式化。
+            converter = field.to_representation if isinstance(field, serializers.DateTimeField) else None
+            self._steps.append((name, path, None, None, converter))
+        self._value_paths = list(dict.fromkeys(value_paths))
+
+    def _round_records(self, candidate_ids):
+        records = {}
+        queryset = (
+            InterviewRoundRecord.objects.filter(
+                candidate_id__in=candidate_ids,
+                round_no__in=self.ROUND_NUMBERS.values(),
+            )
+            .order_by("round_no", "id")
+            .values("candidate_id", "round_no", *self.ROUND_COLUMNS.values())
+        )
+        for record in queryset:
+            records.setdefault((record["candidate_id"], record["round_no"]), record)
+        return records
+
+    def _build(self, rows):
+        records = self._round_records([row["id"] for row in rows])
+        for row in rows:
+            item = {}
+            for name, path, round_no, attr, converter in self._steps:
+                if path is None:
+                    record = records.get((row["id"], round_no))
+                    if record is None:
+                        value = self.ROUND_DEFAULTS[attr]
+                        item[name] = list(value) if isinstance(value, list) else value
+                    else:
+                        value = record[self.ROUND_COLUMNS[attr]]
+                        item[name] = (value or []) if attr == "interviewer_scores" else value
+                    continue
+                value = row[path]
+                item[name] = converter(value) if converter is not None and value is not None else value
+            yield item
+
+    def iter_rows(self, queryset):
+        """按批读取并输出行，适合流式响应；未切片的查询按排序键 keyset 分批，避免 MySQL 整表缓冲。"""
+        queryset = queryset.prefetch_related(None)
+        if queryset.query.is_sliced:
+            # 切片查询本身有行数上限，一次读取即可。
+            rows = list(queryset.values(*self._value_paths))
+            for start in range(0, len(rows), self.batch_size):
+                yield from self._build(rows[start : start + self.batch_size])
+            return
+        ordering = keyset_ordering(queryset)
+        key_paths = [name.lstrip("-") for name in ordering]
+        values = queryset.values(*dict.fromkeys([*self._value_paths, *key_paths]))
+        for batch in iter_keyset_batches(values, batch_size=self.batch_size, ordering=ordering):
+            yield from self._build(batch)
+
+    def serialize(self, queryset) -> list[dict]:
+        return list(self.iter_rows(queryset))
+
 class InterviewCandidateScheduleSerializer(serializers.Serializer):
     """安排/改期面试入参。"""
 
@@ -355,3 +442,53 @@ class InterviewCandidateResendSmsSerializer(serializers.Serializer):
 
 class PassedCandidateRetryOAPushSerializer(serializers.Serializer):
     """失败重发 OA 推送入参。"""
+
+
+class BatchOperationJobCreateSerializer(serializers.Serializer):
+    """大批量操作任务入参：ids 按动作解释为应聘记录ID或拟面试人员ID。"""
+
+    action = serializers.ChoiceField(choices=[choice for choice, _ in BatchOperationJob.ACTION_CHOICES])
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+    )
+
+    def validate_ids(self, value):
+        unique_ids = list(dict.fromkeys(value))
+        max_items = batch_job_max_items()
+        if len(unique_ids) > max_items:
+            raise serializers.ValidationError(f"单次最多提交 {max_items} 条记录")
+        return unique_ids
+
+
+class BatchOperationJobSerializer(serializers.ModelSerializer):
+    """批量操作任务进度输出；逐条结果仅在详情中按需返回。"""
+
+    action_label = serializers.CharField(source="get_action_display", read_only=True)
+    status_label = serializers.CharField(source="get_status_display", read_only=True)
+    requested_by_username = serializers.CharField(source="requested_by.username", read_only=True, default="")
+
+    class Meta:
+        model = BatchOperationJob
+        fields = [
+            "id",
+            "action",
+            "action_label",
+            "status",
+            "status_label",
+            "total",
+            "processed",
+            "outcome_counts",
+            "outcomes",
+            "requested_by_username",
+            "error_code",
+            "error_message",
+            "created_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+    def __init__(self, *args, include_outcomes: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not include_outcomes:
+            self.fields.pop("outcomes")
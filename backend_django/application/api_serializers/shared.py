@@ -5,6 +5,7 @@ from django.contrib.auth import authenticate, get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.conf import settings
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Prefetch
 from django.utils import timezone
 from rest_framework import serializers
 from rest_framework.authtoken.models import Token
@@ -12,7 +13,9 @@ from rest_framework.authtoken.models import Token
 from ..models import (
     Application,
     ApplicationAttachment,
+    BatchOperationJob,
     InterviewCandidate,
+    InterviewRoundRecord,
     Job,
     OperationLog,
     Region,
@@ -1,17 +1,20 @@
 """application 视图拆分包：对外导出与旧 views.py 等价的符号。"""
 
-from .shared import HealthCheckView, AdminResultListPagination, OperationLogCursorPagination, AdminScopedMixin
+from .shared import HealthCheckView, AdminResultListPagination, OperationLogCursorPagination, InterviewPoolCursorPagination, InterviewOutcomeCursorPagination, AdminScopedMixin
 from .public import RegionListView, JobListView, JobDetailView, ApplicationCreateView, ApplicationSubmitView, ApplicationTokenAccessMixin, ApplicationAttachmentListCreateView, ApplicationDiscardView
 from .auth import RegisterView, LoginView, OALoginEntryView, OALoginExchangeView, MeView, AdminUserListView, AdminUserPasswordView, AdminUserDetailView, ChangePasswordView, LogoutView
 from .admin_regions_jobs import _RegionAdminQuerysetMixin, AdminRegionListView, AdminRegionDetailView, AdminRegionFieldListView, AdminRegionFieldDetailView, AdminJobListView, AdminJobDetailView, AdminJobBatchStatusView
-from .admin_applications import _ApplicationAdminQuerysetMixin, AdminApplicationListView, AdminApplicationDetailView
+from .admin_applications import _ApplicationAdminQuerysetMixin, AdminApplicationListView, AdminApplicationDetailView, AdminApplicationSearchView
 from .admin_logs import operation_log_base_queryset, AdminOperationLogListView, AdminOperationLogDetailView, AdminOperationLogMetaView
-from .admin_interviews import _InterviewCandidateAdminQuerysetMixin, AdminInterviewCandidateListView, AdminInterviewMetaView, _InterviewOutcomeCandidateListView, AdminPassedCandidateListView, AdminTalentPoolCandidateListView, AdminInterviewCandidateDetailView, AdminInterviewCandidateScheduleView, AdminInterviewCandidateCancelScheduleView, AdminInterviewCandidateResultView, AdminInterviewCandidateResendSmsView, AdminInterviewCandidateBatchAddView, AdminInterviewCandidateBatchRemoveView, AdminTalentPoolCandidateBatchAddView, AdminTalentPoolCandidateBatchToInterviewView, AdminPassedCandidateBatchConfirmHireView, AdminPassedCandidateBatchConfirmOnboardView, AdminPassedCandidateOfferStatusView, AdminPassedCandidateRetryOAPushView
+from .admin_system import AdminIntegrationMetaView, MetricsView
+from .admin_interviews import _InterviewCandidateAdminQuerysetMixin, AdminInterviewCandidateListView, AdminInterviewMetaView, _InterviewOutcomeCandidateListView, AdminPassedCandidateListView, AdminTalentPoolCandidateListView, AdminInterviewCandidateDetailView, AdminInterviewCandidateScheduleView, AdminInterviewCandidateCancelScheduleView, AdminInterviewCandidateResultView, AdminInterviewCandidateResendSmsView, AdminInterviewCandidateBatchAddView, AdminInterviewCandidateBatchRemoveView, AdminTalentPoolCandidateBatchAddView, AdminTalentPoolCandidateBatchToInterviewView, AdminPassedCandidateBatchConfirmHireView, AdminPassedCandidateBatchConfirmOnboardView, AdminPassedCandidateOfferStatusView, AdminPassedCandidateRetryOAPushView, AdminBatchOperationJobListView, AdminBatchOperationJobDetailView
 
 __all__ = [
     "HealthCheckView",
     "AdminResultListPagination",
     "OperationLogCursorPagination",
+    "InterviewPoolCursorPagination",
+    "InterviewOutcomeCursorPagination",
     "AdminScopedMixin",
     "RegionListView",
     "JobListView",
@@ -42,10 +45,13 @@ __all__ = [
     "_ApplicationAdminQuerysetMixin",
     "AdminApplicationListView",
     "AdminApplicationDetailView",
+    "AdminApplicationSearchView",
     "operation_log_base_queryset",
     "AdminOperationLogListView",
     "AdminOperationLogDetailView",
     "AdminOperationLogMetaView",
+    "AdminIntegrationMetaView",
+    "MetricsView",
     "_InterviewCandidateAdminQuerysetMixin",
     "AdminInterviewCandidateListView",
     "AdminInterviewMetaView",
@@ -65,4 +71,6 @@ __all__ = [
     "AdminPassedCandidateBatchConfirmOnboardView",
     "AdminPassedCandidateOfferStatusView",
     "AdminPassedCandidateRetryOAPushView",
+    "AdminBatchOperationJobListView",
+    "AdminBatchOperationJobDetailView",
 ]
@@ -1,5 +1,6 @@
 """按职责拆分的视图模块。"""
 from .shared import *
+from ..search_index import highlight_application, query_text, rank_applications
 
 class _ApplicationAdminQuerysetMixin(AdminScopedMixin):
     """共享 Application 查询集逻辑。"""
@@ -14,8 +15,19 @@ class _ApplicationAdminQuerysetMixin(AdminScopedMixin):
         )
         return self._scope_queryset(queryset)
 
-class AdminApplicationListView(_ApplicationAdminQuerysetMixin, generics.ListAPIView):
+class AdminApplicationListView(
+    ConditionalListMixin, StreamingListMixin, _ApplicationAdminQuerysetMixin, generics.ListAPIView
+):
     serializer_class = ApplicationAdminListSerializer
+    # 应聘记录提交后不再修改；附件集合反映照片变化，地区名/岗位名随目录版本变化。
+    fingerprint_fields = ("id",)
+    fingerprint_related_ids = ("attachments__id",)
+    fingerprint_catalog = True
+
+    def list(self, request: Request, *args, **kwargs):
+        if self.wants_stream(request):
+            return self.stream_list(self.filter_queryset(self.get_queryset()))
+        return super().list(request, *args, **kwargs)
 
     def get_queryset(self):
         # 应聘记录列表仅展示尚未进入拟面试池的记录。
@@ -41,3 +53,56 @@ class AdminApplicationListView(_ApplicationAdminQuerysetMixin, generics.ListAPIV
 
 class AdminApplicationDetailView(_ApplicationAdminQuerysetMixin, generics.RetrieveAPIView):
     serializer_class = ApplicationAdminSerializer
+
+    def get_queryset(self):
+        # 详情按序列化器取值方式整体预取，照片从全部附件中筛选，不再单独预取。
+        return ApplicationAdminSerializer.prefetch_queryset(self._scope_queryset(Application.objects.all()))
+
+class AdminApplicationSearchView(_ApplicationAdminQuerysetMixin, APIView):
+    """
+    应聘记录全文检索：按姓名、手机号、院校、专业、工作经历、自我评价检索倒排索引，
+    结果按命中权重排序并附高亮片段；pool 参数可限定应聘记录/拟面试/通过/人才库。
+    """
+
+    POOL_FILTERS = {
+        ApplicationSearchResultSerializer.POOL_APPLICATIONS: Q(interview_candidate__isnull=True),
+        ApplicationSearchResultSerializer.POOL_INTERVIEW: Q(interview_candidate__isnull=False)
+        & ~Q(
+            interview_candidate__status=InterviewCandidate.STATUS_COMPLETED,
+            interview_candidate__result__in=[InterviewCandidate.RESULT_PASS, InterviewCandidate.RESULT_REJECT],
+        ),
+        ApplicationSearchResultSerializer.POOL_PASSED: Q(
+            interview_candidate__status=InterviewCandidate.STATUS_COMPLETED,
+            interview_candidate__result=InterviewCandidate.RESULT_PASS,
+        ),
+        ApplicationSearchResultSerializer.POOL_TALENT: Q(
+            interview_candidate__status=InterviewCandidate.STATUS_COMPLETED,
+            interview_candidate__result=InterviewCandidate.RESULT_REJECT,
+        ),
+    }
+
+    def get(self, request: Request):
+        keyword = str(request.query_params.get("q", "") or "").strip()
+        if not query_text(keyword):
+            return Response({"error": "请输入检索关键词"}, status=status.HTTP_400_BAD_REQUEST)
+        pool = str(request.query_params.get("pool", "") or "").strip()
+        if pool and pool not in self.POOL_FILTERS:
+            return Response({"error": "无效的人员池"}, status=status.HTTP_400_BAD_REQUEST)
+
+        scoped = self._scope_queryset(Application.objects.all())
+        if pool:
+            scoped = scoped.filter(self.POOL_FILTERS[pool])
+        paginator = AdminResultListPagination()
+        rows = paginator.paginate_queryset(rank_applications(scoped, keyword), request, view=self)
+        app_map = self.get_queryset().in_bulk([row["application_id"] for row in rows])
+
+        results = []
+        for row in rows:
+            application = app_map.get(row["application_id"])
+            if application is None:
+                continue
+            payload = ApplicationSearchResultSerializer(application, context={"request": request}).data
+            payload["score"] = row["score"]
+            payload["highlights"] = highlight_application(application, keyword)
+            results.append(payload)
+        return paginator.get_paginated_response(results)
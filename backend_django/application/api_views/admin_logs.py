@@ -25,11 +25,13 @@ def operation_log_base_queryset():
         "region",
     )
 
-class AdminOperationLogListView(AdminScopedMixin, generics.ListAPIView):
+class AdminOperationLogListView(ConditionalListMixin, AdminScopedMixin, generics.ListAPIView):
     """管理端操作日志查询接口。"""
 
     serializer_class = OperationLogListSerializer
     pagination_class = OperationLogCursorPagination
+    # 日志只增不改，最大主键即可反映新增。
+    fingerprint_fields = ("id",)
 
     def get_queryset(self):
         queryset = operation_log_base_queryset()
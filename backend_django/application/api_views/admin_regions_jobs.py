@@ -1,5 +1,6 @@
 """按职责拆分的视图模块。"""
 from .shared import *
+from ..catalog_cache import bump_catalog_version
 
 class _RegionAdminQuerysetMixin(AdminScopedMixin):
     """共享 Region 查询集逻辑。"""
@@ -242,6 +243,8 @@ class AdminJobBatchStatusView(AdminScopedMixin, APIView):
             )
 
         updated = queryset.update(is_active=is_active)
+        # queryset.update 不触发模型信号，需手动让公开目录缓存失效。
+        bump_catalog_version()
         action = "BATCH_DEACTIVATE_JOB" if not is_active else "BATCH_ACTIVATE_JOB"
         self._write_operation_log(
             request,
@@ -0,0 +1,46 @@
+"""按职责拆分的视图模块。"""
+from .shared import *
+from django.http import HttpResponse
+
+from ..circuit_breaker import CIRCUIT_STATE_LABELS, circuit_breaker_config, circuit_breaker_states
+from ..metrics import metrics_auth_token, metrics_enabled, render_metrics
+
+
+class AdminIntegrationMetaView(AdminScopedMixin, APIView):
+    """管理端外部依赖元信息：OA/短信各端点的熔断状态与熔断配置，仅全局账号可见。"""
+
+    def get(self, request: Request):
+        if self._user_region_scope() is not None:
+            return Response({"error": "无权限访问"}, status=status.HTTP_403_FORBIDDEN)
+        return Response(
+            {
+                "circuit_breakers": circuit_breaker_states(),
+                "circuit_breaker_config": circuit_breaker_config(),
+                "state_labels": CIRCUIT_STATE_LABELS,
+            }
+        )
+
+
+class MetricsView(AdminScopedMixin, APIView):
+    """
+    Prometheus 抓取端点：汇总全部进程的请求/OA/短信/登录指标与队列积压。
+    配置 METRICS_AUTH_TOKEN 时抓取方用 Authorization: Bearer <token>；否则需全局管理员 Token。
+    """
+
+    permission_classes = [AllowAny]
+
+    def _scrape_token_valid(self, request: Request) -> bool:
+        expected = metrics_auth_token()
+        header = str(request.META.get("HTTP_AUTHORIZATION", "") or "")
+        scheme, _, provided = header.partition(" ")
+        return bool(expected) and scheme.lower() == "bearer" and constant_time_compare(provided.strip(), expected)
+
+    def get(self, request: Request):
+        if not metrics_enabled():
+            return Response({"error": "指标未启用"}, status=status.HTTP_404_NOT_FOUND)
+        if not self._scrape_token_valid(request):
+            if not request.user or not request.user.is_authenticated:
+                self.permission_denied(request)
+            if self._user_region_scope() is not None:
+                return Response({"error": "无权限访问"}, status=status.HTTP_403_FORBIDDEN)
+        return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -7,6 +7,8 @@ from .actions import (
     AdminInterviewCandidateScheduleView,
 )
 from .batch import (
+    AdminBatchOperationJobDetailView,
+    AdminBatchOperationJobListView,
     AdminInterviewCandidateBatchAddView,
     AdminInterviewCandidateBatchRemoveView,
     AdminTalentPoolCandidateBatchAddView,
@@ -48,4 +50,6 @@ __all__ = [
     "AdminPassedCandidateBatchConfirmOnboardView",
     "AdminPassedCandidateOfferStatusView",
     "AdminPassedCandidateRetryOAPushView",
+    "AdminBatchOperationJobListView",
+    "AdminBatchOperationJobDetailView",
 ]
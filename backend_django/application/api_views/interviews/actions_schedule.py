@@ -2,6 +2,7 @@
 from .shared import *
 from .query import _InterviewCandidateAdminQuerysetMixin
 from ...interview_sms import SmsDispatchResult, dispatch_interview_schedule_sms
+from ...interview_sms_queue import enqueue_interview_sms, interview_sms_queue_enabled, queued_sms_payload
 
 
 class AdminInterviewCandidateScheduleView(_InterviewCandidateAdminQuerysetMixin, APIView):
@@ -17,6 +18,8 @@ class AdminInterviewCandidateScheduleView(_InterviewCandidateAdminQuerysetMixin,
 
         data = serializer.validated_data
         should_send_sms = bool(data.get("send_sms", False))
+        queue_sms = should_send_sms and interview_sms_queue_enabled()
+        sms_job = None
         was_scheduled = False
         before_round = 1
         candidate = None
@@ -57,11 +60,18 @@ class AdminInterviewCandidateScheduleView(_InterviewCandidateAdminQuerysetMixin,
                             "updated_at",
                         ]
                     )
+                if queue_sms:
+                    # 与面试安排同事务入队，安排回滚时不会留下孤立短信任务。
+                    candidate, sms_job = enqueue_interview_sms(
+                        candidate.id,
+                        user=request.user,
+                        request_id=request_id_from_request(request),
+                    )
         except InterviewFlowError as err:
             return self.flow_error_response(err)
 
         sms_result = None
-        if should_send_sms:
+        if should_send_sms and not queue_sms:
             try:
                 candidate, sms_result = dispatch_interview_schedule_sms(candidate.id, is_retry=False)
             except InterviewFlowError as err:
@@ -77,7 +87,10 @@ class AdminInterviewCandidateScheduleView(_InterviewCandidateAdminQuerysetMixin,
 
         action = "RESCHEDULE_INTERVIEW" if was_scheduled else "SCHEDULE_INTERVIEW"
         application = candidate.application
-        sms_payload = sms_result.to_payload() if sms_result else {}
+        if sms_job is not None:
+            sms_payload = queued_sms_payload(sms_job)
+        else:
+            sms_payload = sms_result.to_payload() if sms_result else {}
         self._write_operation_log(
             request,
             user=request.user,
@@ -103,7 +116,9 @@ class AdminInterviewCandidateScheduleView(_InterviewCandidateAdminQuerysetMixin,
         )
         output = InterviewCandidateListSerializer(candidate, context={"request": request})
         message = "面试安排已保存"
-        if should_send_sms:
+        if sms_job is not None:
+            message = "面试安排已保存，短信已加入发送队列"
+        elif should_send_sms:
             message = "面试安排已保存，短信已发送" if sms_result and sms_result.success else "面试安排已保存，短信发送失败"
         return Response(
             {
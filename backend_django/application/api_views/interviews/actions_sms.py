@@ -2,6 +2,7 @@
 from .shared import *
 from .query import _InterviewCandidateAdminQuerysetMixin
 from ...interview_sms import dispatch_interview_schedule_sms
+from ...interview_sms_queue import enqueue_interview_sms, interview_sms_queue_enabled, queued_sms_payload
 
 
 class AdminInterviewCandidateResendSmsView(_InterviewCandidateAdminQuerysetMixin, APIView):
@@ -15,6 +16,9 @@ class AdminInterviewCandidateResendSmsView(_InterviewCandidateAdminQuerysetMixin
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        if interview_sms_queue_enabled():
+            return self._enqueue_resend(request, pk)
+
         try:
             candidate, sms_result = dispatch_interview_schedule_sms(pk, is_retry=True)
         except InterviewFlowError as err:
@@ -53,3 +57,46 @@ class AdminInterviewCandidateResendSmsView(_InterviewCandidateAdminQuerysetMixin
                 "sms": sms_payload,
             }
         )
+
+    def _enqueue_resend(self, request: Request, pk: int) -> Response:
+        """队列模式：只做校验与入队，由 run_interview_sms_worker 后台发送。"""
+        try:
+            with transaction.atomic():
+                self.get_locked_candidate(pk)
+                candidate, job = enqueue_interview_sms(
+                    pk,
+                    is_retry=True,
+                    user=request.user,
+                    request_id=request_id_from_request(request),
+                )
+        except InterviewFlowError as err:
+            return self.flow_error_response(err)
+
+        application = candidate.application
+        sms_payload = queued_sms_payload(job)
+        self._write_operation_log(
+            request,
+            user=request.user,
+            module="interviews",
+            action="RESEND_INTERVIEW_SMS",
+            target_type="interview_candidate",
+            target_id=candidate.id,
+            target_label=application.name,
+            summary=f"重发面试短信：{application.name}",
+            details={
+                "interview_candidate_id": candidate.id,
+                "application_id": application.id,
+                "sms": sms_payload,
+            },
+            application=application,
+            interview_candidate=candidate,
+            region=application.region,
+        )
+        output = InterviewCandidateListSerializer(candidate, context={"request": request})
+        return Response(
+            {
+                "message": "短信已加入重发队列",
+                "candidate": output.data,
+                "sms": sms_payload,
+            }
+        )
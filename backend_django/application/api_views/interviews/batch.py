@@ -4,12 +4,18 @@ from .batch_interview_pool import (  # noqa: F401
     AdminInterviewCandidateBatchAddView,
     AdminInterviewCandidateBatchRemoveView,
 )
+from .batch_jobs import (  # noqa: F401
+    AdminBatchOperationJobDetailView,
+    AdminBatchOperationJobListView,
+)
 from .batch_talent_pool import (  # noqa: F401
     AdminTalentPoolCandidateBatchAddView,
     AdminTalentPoolCandidateBatchToInterviewView,
 )
 
 __all__ = [
+    "AdminBatchOperationJobListView",
+    "AdminBatchOperationJobDetailView",
     "AdminInterviewCandidateBatchAddView",
     "AdminInterviewCandidateBatchRemoveView",
     "AdminTalentPoolCandidateBatchAddView",
@@ -19,8 +19,8 @@ class AdminInterviewCandidateBatchAddView(AdminScopedMixin, APIView):
         if region_id:
             app_queryset = app_queryset.filter(region_id=region_id)
 
-        allowed_ids = set(app_queryset.values_list("id", flat=True))
-        missing_ids = sorted(set(application_ids) - allowed_ids)
+        app_map = {app.id: app for app in app_queryset}
+        missing_ids = sorted(set(application_ids) - set(app_map))
         if missing_ids:
             return Response(
                 {
@@ -50,7 +50,6 @@ class AdminInterviewCandidateBatchAddView(AdminScopedMixin, APIView):
             )
         )
         added_count = len(existing_after - existing_before)
-        app_map = {app.id: app for app in app_queryset}
         for application_id in application_ids:
             application = app_map.get(application_id)
             if not application:
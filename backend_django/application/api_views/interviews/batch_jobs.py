@@ -0,0 +1,60 @@
+"""大批量操作任务接口：提交后返回任务ID，前端轮询进度与逐条结果。"""
+from .shared import *
+from ...batch_jobs import batch_job_queue_enabled, enqueue_batch_job, run_batch_job
+from ...models import BatchOperationJob
+from ...serializers import BatchOperationJobCreateSerializer, BatchOperationJobSerializer
+
+# 任务列表只返回最近的若干条，进度详情通过任务ID查询。
+BATCH_JOB_LIST_LIMIT = 20
+
+
+class _BatchOperationJobQuerysetMixin(AdminScopedMixin):
+    def get_job_queryset(self):
+        queryset = BatchOperationJob.objects.select_related("requested_by")
+        # 全局账号可查看全部任务，其余账号只能查看自己发起的任务。
+        if self._user_region_scope() is None:
+            return queryset
+        return queryset.filter(requested_by=self.request.user)
+
+
+class AdminBatchOperationJobListView(_BatchOperationJobQuerysetMixin, APIView):
+    """提交大批量操作（批量加入/移出拟面试、批量发放offer），按块分事务在后台执行。"""
+
+    def get(self, request: Request):
+        jobs = self.get_job_queryset().order_by("-id")[:BATCH_JOB_LIST_LIMIT]
+        return Response(BatchOperationJobSerializer(jobs, many=True, include_outcomes=False).data)
+
+    def post(self, request: Request):
+        serializer = BatchOperationJobCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": "参数校验失败", "details": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        queue_enabled = batch_job_queue_enabled()
+        job = enqueue_batch_job(
+            action=serializer.validated_data["action"],
+            item_ids=serializer.validated_data["ids"],
+            region_scope=self._user_region_scope(),
+            user=request.user,
+            request_id=request_id_from_request(request),
+            inline=not queue_enabled,
+        )
+        if not queue_enabled:
+            # 未启用队列时在当前请求内逐块执行，仍保持每块短事务。
+            job = run_batch_job(job.id)
+            return Response(BatchOperationJobSerializer(job).data)
+        return Response(
+            BatchOperationJobSerializer(job, include_outcomes=False).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class AdminBatchOperationJobDetailView(_BatchOperationJobQuerysetMixin, APIView):
+    """查询批量操作任务进度；include_outcomes=0 时不返回逐条结果，适合高频轮询。"""
+
+    def get(self, request: Request, pk: int):
+        job = get_object_or_404(self.get_job_queryset(), pk=pk)
+        include_outcomes = str(request.query_params.get("include_outcomes", "1")).strip() not in {"0", "false"}
+        return Response(BatchOperationJobSerializer(job, include_outcomes=include_outcomes).data)
@@ -19,8 +19,8 @@ class AdminTalentPoolCandidateBatchAddView(AdminScopedMixin, APIView):
         if region_id:
             app_queryset = app_queryset.filter(region_id=region_id)
 
-        allowed_ids = set(app_queryset.values_list("id", flat=True))
-        missing_ids = sorted(set(application_ids) - allowed_ids)
+        app_map = {app.id: app for app in app_queryset}
+        missing_ids = sorted(set(application_ids) - set(app_map))
         if missing_ids:
             return Response(
                 {
@@ -31,76 +31,78 @@ class AdminTalentPoolCandidateBatchAddView(AdminScopedMixin, APIView):
             )
 
         now = timezone.now()
-        moved = 0
-        existing = 0
         blocked_ids = []
         default_note = "简历初筛未通过"
         moved_ids = set()
         existing_ids = set()
+        created_ids = []
+        transition_ids = []
 
+        # 集合化处理：锁定已有候选人后一次 bulk_create 新建、一次 UPDATE 迁移，查询数不随批量大小增长。
         with transaction.atomic():
-            candidates = {
-                item.application_id: item
-                for item in InterviewCandidate.objects.select_for_update().filter(
-                    application_id__in=application_ids
+            candidate_states = {
+                application_id: (candidate_id, candidate_status, candidate_result)
+                for candidate_id, application_id, candidate_status, candidate_result in (
+                    InterviewCandidate.objects.select_for_update()
+                    .filter(application_id__in=application_ids)
+                    .values_list("id", "application_id", "status", "result")
                 )
             }
             for app_id in application_ids:
-                candidate = candidates.get(app_id)
-                if candidate is None:
-                    InterviewCandidate.objects.create(
-                        application_id=app_id,
-                        status=InterviewCandidate.STATUS_COMPLETED,
-                        result=InterviewCandidate.RESULT_REJECT,
-                        result_at=now,
-                        note=default_note,
-                    )
-                    moved += 1
+                state = candidate_states.get(app_id)
+                if state is None:
+                    created_ids.append(app_id)
                     moved_ids.add(app_id)
                     continue
-
+                candidate_id, candidate_status, candidate_result = state
                 if (
-                    candidate.status == InterviewCandidate.STATUS_COMPLETED
-                    and candidate.result == InterviewCandidate.RESULT_PASS
+                    candidate_status == InterviewCandidate.STATUS_COMPLETED
+                    and candidate_result == InterviewCandidate.RESULT_PASS
                 ):
                     blocked_ids.append(app_id)
                     continue
-
                 if (
-                    candidate.status == InterviewCandidate.STATUS_COMPLETED
-                    and candidate.result == InterviewCandidate.RESULT_REJECT
+                    candidate_status == InterviewCandidate.STATUS_COMPLETED
+                    and candidate_result == InterviewCandidate.RESULT_REJECT
                 ):
-                    existing += 1
                     existing_ids.add(app_id)
                     continue
+                transition_ids.append(candidate_id)
+                moved_ids.add(app_id)
 
-                candidate.status = InterviewCandidate.STATUS_COMPLETED
-                candidate.result = InterviewCandidate.RESULT_REJECT
-                candidate.result_at = now
-                candidate.interview_at = None
-                candidate.interviewer = ""
-                candidate.interview_location = ""
-                candidate.score = None
-                candidate.result_note = candidate.result_note or ""
-                candidate.note = candidate.note or default_note
-                candidate.save(
-                    update_fields=[
-                        "status",
-                        "result",
-                        "result_at",
-                        "interview_at",
-                        "interviewer",
-                        "interview_location",
-                        "score",
-                        "result_note",
-                        "note",
-                        "updated_at",
+            if created_ids:
+                InterviewCandidate.objects.bulk_create(
+                    [
+                        InterviewCandidate(
+                            application_id=app_id,
+                            status=InterviewCandidate.STATUS_COMPLETED,
+                            result=InterviewCandidate.RESULT_REJECT,
+                            result_at=now,
+                            note=default_note,
+                        )
+                        for app_id in created_ids
                     ]
                 )
-                moved += 1
-                moved_ids.add(app_id)
+            if transition_ids:
+                InterviewCandidate.objects.filter(id__in=transition_ids).update(
+                    status=InterviewCandidate.STATUS_COMPLETED,
+                    result=InterviewCandidate.RESULT_REJECT,
+                    result_at=now,
+                    interview_at=None,
+                    interviewer="",
+                    interview_location="",
+                    score=None,
+                    # 保留已有备注，空备注补默认原因。
+                    note=Case(
+                        When(note="", then=Value(default_note)),
+                        default=F("note"),
+                        output_field=TextField(),
+                    ),
+                    updated_at=now,
+                )
+        moved = len(moved_ids)
+        existing = len(existing_ids)
 
-        app_map = {app.id: app for app in app_queryset}
         blocked_set = set(blocked_ids)
         for application_id in application_ids:
             application = app_map.get(application_id)
@@ -4,7 +4,8 @@ from ...offer_status_transition import (
     OfferStatusTransitionError,
     OfferStatusTransitionService,
 )
-from ...oa_push import dispatch_oa_push
+from ...oa_push import already_pushed_result, dispatch_oa_push, dispatch_oa_push_many
+from ...oa_push_queue import enqueue_oa_push, oa_push_queue_enabled
 
 
 class AdminPassedCandidateBatchConfirmHireView(AdminScopedMixin, APIView):
@@ -241,11 +242,48 @@ class AdminPassedCandidateBatchConfirmOnboardView(AdminScopedMixin, APIView):
             },
         )
 
+        if oa_push_queue_enabled():
+            oa_push_payload = self._enqueue_oa_push(request, confirmed_candidate_ids)
+        else:
+            oa_push_payload = self._dispatch_oa_push_inline(request, confirmed_candidate_ids)
+
+        return Response(
+            {
+                "confirmed": confirmed,
+                "total": len(interview_candidate_ids),
+                "oa_push": oa_push_payload,
+            }
+        )
+
+    def _enqueue_oa_push(self, request: Request, candidate_ids: list[int]) -> dict:
+        """入队后立即返回，推送结果由 run_oa_push_worker 回写并记录审计日志。"""
+        queued_job_ids = []
+        already_success = 0
+        for candidate_id in candidate_ids:
+            _, job = enqueue_oa_push(
+                candidate_id,
+                is_retry=False,
+                user=request.user,
+                request_id=request_id_from_request(request),
+            )
+            if job is None:
+                already_success += 1
+                continue
+            queued_job_ids.append(job.id)
+        return {
+            "queued": len(queued_job_ids),
+            "job_ids": queued_job_ids,
+            "success": already_success,
+            "failed": 0,
+            "failed_items": [],
+        }
+
+    def _dispatch_oa_push_inline(self, request: Request, candidate_ids: list[int]) -> dict:
+        """队列关闭时同步推送：并发调用 OA，总耗时约等于最慢的一次调用。"""
         oa_push_success = 0
         oa_push_failed = 0
         oa_push_failed_items = []
-        for candidate_id in confirmed_candidate_ids:
-            pushed_candidate, push_result = dispatch_oa_push(candidate_id, is_retry=False)
+        for pushed_candidate, push_result in dispatch_oa_push_many(candidate_ids, is_retry=False):
             application = pushed_candidate.application
             if push_result.success:
                 oa_push_success += 1
@@ -302,17 +340,13 @@ class AdminPassedCandidateBatchConfirmOnboardView(AdminScopedMixin, APIView):
                 region=application.region,
             )
 
-        return Response(
-            {
-                "confirmed": confirmed,
-                "total": len(interview_candidate_ids),
-                "oa_push": {
-                    "success": oa_push_success,
-                    "failed": oa_push_failed,
-                    "failed_items": oa_push_failed_items,
-                },
-            }
-        )
+        return {
+            "queued": 0,
+            "job_ids": [],
+            "success": oa_push_success,
+            "failed": oa_push_failed,
+            "failed_items": oa_push_failed_items,
+        }
 
 
 class AdminPassedCandidateRetryOAPushView(AdminScopedMixin, APIView):
@@ -339,6 +373,9 @@ class AdminPassedCandidateRetryOAPushView(AdminScopedMixin, APIView):
             queryset = queryset.filter(application__region_id=region_id)
         candidate = get_object_or_404(queryset)
 
+        if oa_push_queue_enabled():
+            return self._enqueue_retry(request, candidate)
+
         pushed_candidate, push_result = dispatch_oa_push(candidate.id, is_retry=True)
         application = pushed_candidate.application
         self._write_operation_log(
@@ -375,6 +412,55 @@ class AdminPassedCandidateRetryOAPushView(AdminScopedMixin, APIView):
             }
         )
 
+    def _enqueue_retry(self, request: Request, candidate: InterviewCandidate) -> Response:
+        queued_candidate, job = enqueue_oa_push(
+            candidate.id,
+            is_retry=True,
+            user=request.user,
+            request_id=request_id_from_request(request),
+        )
+        application = queued_candidate.application
+        if job is None:
+            skipped = already_pushed_result(queued_candidate)
+            oa_push_payload = {**skipped.to_payload(), "queued": False, "job_id": None}
+            message = "已推送成功，无需重发"
+        else:
+            oa_push_payload = {
+                "success": False,
+                "retryable": True,
+                "queued": True,
+                "job_id": job.id,
+                "job_status": job.status,
+            }
+            message = "已加入OA推送队列"
+        self._write_operation_log(
+            request,
+            user=request.user,
+            module="interviews",
+            action="OA_PUSH_RETRY",
+            target_type="interview_candidate",
+            target_id=queued_candidate.id,
+            target_label=application.name,
+            summary=f"重发OA推送：{application.name}",
+            details={
+                "interview_candidate_id": queued_candidate.id,
+                "application_id": application.id,
+                "queued": job is not None,
+                "oa_push_job_id": job.id if job else None,
+            },
+            application=application,
+            interview_candidate=queued_candidate,
+            region=application.region,
+        )
+        output = InterviewPassedCandidateListSerializer(queued_candidate, context={"request": request})
+        return Response(
+            {
+                "message": message,
+                "oa_push": oa_push_payload,
+                "candidate": output.data,
+            }
+        )
+
 
 class AdminPassedCandidateOfferStatusView(AdminScopedMixin, APIView):
     """更新面试通过人员的 Offer 状态。"""
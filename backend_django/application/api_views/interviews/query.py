@@ -41,21 +41,75 @@ class _InterviewCandidateAdminQuerysetMixin(AdminScopedMixin):
         """统一输出流程层业务错误。"""
         return Response(error.to_payload(), status=error.status_code)
 
-class AdminInterviewCandidateListView(_InterviewCandidateAdminQuerysetMixin, generics.ListAPIView):
+class _CandidatePoolListMixin(StreamingListMixin):
+    """
+    候选人列表返回模式：
+    - 传 cursor 或 pagination=cursor：keyset 游标分页，深翻页不退化；
+    - 传 page/page_size：页码分页；
+    - 传 stream=1：流式输出完整数组；
+    - 都不传：兼容历史的数组返回，最多 ADMIN_UNPAGINATED_LIST_MAX_ROWS 行，超出时响应头标记截断。
+    """
+
+    cursor_pagination_class = None
+    # 设置后列表输出改走 values() 快速序列化，输出须与 serializer_class 一致。
+    fast_serializer_class = None
+
+    def get_fast_serializer(self):
+        return self.fast_serializer_class(context=self.get_serializer_context())
+
+    def stream_rows(self, queryset):
+        if self.fast_serializer_class is None:
+            return super().stream_rows(queryset)
+        return self.get_fast_serializer().iter_rows(queryset), lambda row: row
+
+    def _serialize_rows(self, queryset, *, limit: int):
+        """最多序列化 limit 行，返回 (数据, 是否还有更多)。"""
+        if self.fast_serializer_class is not None:
+            data = self.get_fast_serializer().serialize(queryset[: limit + 1])
+        else:
+            data = self.get_serializer(list(queryset[: limit + 1]), many=True).data
+        return data[:limit], len(data) > limit
+
+    def _fast_paginated_list(self, queryset):
+        # 分页器只需排序键与主键，先取轻量实例定位本页，再按主键批量组装输出。
+        key_fields = {"pk", *(name.lstrip("-") for name in self.cursor_pagination_class.ordering)}
+        key_queryset = queryset.prefetch_related(None).select_related(None).only(*key_fields - {"pk"})
+        page = self.paginate_queryset(key_queryset)
+        page_ids = [obj.pk for obj in page]
+        rows = {row["id"]: row for row in self.get_fast_serializer().serialize(queryset.filter(pk__in=page_ids))}
+        return self.get_paginated_response([rows[pk] for pk in page_ids if pk in rows])
+
+    def list(self, request: Request, *args, **kwargs):
+        params = request.query_params
+        use_cursor = self.cursor_pagination_class and ("cursor" in params or params.get("pagination") == "cursor")
+        if use_cursor:
+            self.pagination_class = self.cursor_pagination_class
+        elif self.wants_stream(request):
+            return self.stream_list(self.filter_queryset(self.get_queryset()))
+        elif "page" not in params and "page_size" not in params:
+            max_rows = admin_unpaginated_list_max_rows()
+            data, truncated = self._serialize_rows(self.filter_queryset(self.get_queryset()), limit=max_rows)
+            response = Response(data)
+            response["X-Result-Limit"] = str(max_rows)
+            if truncated:
+                response["X-Result-Truncated"] = "true"
+            return response
+        if self.fast_serializer_class is not None:
+            return self._fast_paginated_list(self.filter_queryset(self.get_queryset()))
+        return super().list(request, *args, **kwargs)
+
+class AdminInterviewCandidateListView(
+    ConditionalListMixin, _CandidatePoolListMixin, _InterviewCandidateAdminQuerysetMixin, generics.ListAPIView
+):
     serializer_class = InterviewCandidateListSerializer
+    fingerprint_related_ids = ("application__attachments__id",)
+    fingerprint_catalog = True
     pagination_class = AdminResultListPagination
+    cursor_pagination_class = InterviewPoolCursorPagination
 
     def get_queryset(self):
         # 拟面试池仅展示流程中的候选人，已出结果（已完成）移出该列表。
-        return super().get_queryset().exclude(status=InterviewCandidate.STATUS_COMPLETED)
-
-    def list(self, request: Request, *args, **kwargs):
-        """兼容历史返回：仅当前端传 page/page_size 时启用分页结构。"""
-        if "page" not in request.query_params and "page_size" not in request.query_params:
-            queryset = self.filter_queryset(self.get_queryset())
-            serializer = self.get_serializer(queryset, many=True)
-            return Response(serializer.data)
-        return super().list(request, *args, **kwargs)
+        return super().get_queryset().filter(status__in=InterviewCandidate.IN_PROGRESS_STATUSES)
 
 class AdminInterviewMetaView(AdminScopedMixin, APIView):
     """输出面试模块元数据，供前端统一常量和选项。"""
@@ -87,11 +141,18 @@ class AdminInterviewMetaView(AdminScopedMixin, APIView):
             }
         )
 
-class _InterviewOutcomeCandidateListView(_InterviewCandidateAdminQuerysetMixin, generics.ListAPIView):
+class _InterviewOutcomeCandidateListView(
+    ConditionalListMixin, _CandidatePoolListMixin, _InterviewCandidateAdminQuerysetMixin, generics.ListAPIView
+):
     """面试结果池列表基类：按最终结果筛选并输出轮次快照。"""
 
     serializer_class = InterviewPassedCandidateListSerializer
+    # 轮次快照随候选人结果一起保存，候选人 updated_at 已能反映其变化。
+    fingerprint_related_ids = ("application__attachments__id",)
+    fingerprint_catalog = True
     pagination_class = AdminResultListPagination
+    cursor_pagination_class = InterviewOutcomeCursorPagination
+    fast_serializer_class = InterviewOutcomeFastSerializer
     outcome_result: str = ""
 
     def get_queryset(self):
@@ -106,14 +167,6 @@ class _InterviewOutcomeCandidateListView(_InterviewCandidateAdminQuerysetMixin,
             )
         ).order_by("-result_at", "-updated_at", "-id")
 
-    def list(self, request: Request, *args, **kwargs):
-        """兼容历史返回：仅当前端传 page/page_size 时启用分页结构。"""
-        if "page" not in request.query_params and "page_size" not in request.query_params:
-            queryset = self.filter_queryset(self.get_queryset())
-            serializer = self.get_serializer(queryset, many=True)
-            return Response(serializer.data)
-        return super().list(request, *args, **kwargs)
-
 class AdminPassedCandidateListView(_InterviewOutcomeCandidateListView):
     """面试通过人员列表，含各轮次快照信息。"""
 
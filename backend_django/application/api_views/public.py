@@ -3,30 +3,38 @@ import logging
 
 from . import shared as shared_views
 from .shared import *
+from ..catalog_cache import catalog_response
 
 logger = logging.getLogger(__name__)
 MULTI_FILE_ATTACHMENT_CATEGORIES = {"other", "interview_extra"}
 
 class RegionListView(APIView):
     def get(self, request: Request):
-        queryset = Region.objects.filter(is_active=True).prefetch_related("fields")
-        serializer = RegionSerializer(queryset, many=True)
-        return Response(serializer.data)
+        def build():
+            queryset = Region.objects.filter(is_active=True).prefetch_related("fields")
+            return RegionSerializer(queryset, many=True).data
+
+        return catalog_response(request, "regions", build)
 
 class JobListView(APIView):
     def get(self, request: Request):
-        queryset = Job.objects.filter(is_active=True, is_deleted=False)
         region_id = request.query_params.get("region_id")
-        if region_id:
-            queryset = queryset.filter(region_id=region_id)
-        serializer = JobSerializer(queryset, many=True)
-        return Response(serializer.data)
+
+        def build():
+            queryset = Job.objects.filter(is_active=True, is_deleted=False)
+            if region_id:
+                queryset = queryset.filter(region_id=region_id)
+            return JobSerializer(queryset, many=True).data
+
+        return catalog_response(request, f"jobs:{region_id or ''}", build)
 
 class JobDetailView(APIView):
     def get(self, request: Request, pk: int):
-        job = get_object_or_404(Job, pk=pk, is_active=True, is_deleted=False)
-        serializer = JobSerializer(job)
-        return Response(serializer.data)
+        def build():
+            job = get_object_or_404(Job, pk=pk, is_active=True, is_deleted=False)
+            return JobSerializer(job).data
+
+        return catalog_response(request, f"job:{pk}", build)
 
 class ApplicationCreateView(APIView):
     def _coerce_payload(self, data):
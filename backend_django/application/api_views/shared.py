@@ -1,14 +1,17 @@
 """共享视图基础能力：导入、常量、通用工具与公共基类。"""
 
 """后端 API 视图实现，承载后台管理与应聘流程业务接口。"""
+import hashlib
 import json
 from datetime import timedelta
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction
-from django.db.models import Prefetch, ProtectedError, Q
+from django.db.models import Case, Count, F, Max, Prefetch, ProtectedError, Q, Sum, TextField, Value, When
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
 from django.utils.crypto import constant_time_compare
 from django.utils import timezone
 from rest_framework import generics, status
@@ -36,6 +39,8 @@ from ..interview_flow import (
     schedule_interview,
 )
 from ..audit import request_id_from_request, write_operation_log
+from ..catalog_cache import catalog_version
+from ..region_scope import RegionScope, region_scope_for
 from ..throttles import LoginRateThrottle
 from ..operation_log_meta import (
     OPERATION_ACTION_LABELS,
@@ -44,7 +49,9 @@ from ..operation_log_meta import (
     OPERATION_MODULE_LABELS,
     OPERATION_RESULT_LABELS,
 )
+from ..pagination import KeysetCursorPagination, iter_keyset_batches
 from ..recruitment_lifecycle import summarize_interview_outcomes
+from ..streaming import iter_json_array
 from ..models import (
     Application,
     ApplicationAttachment,
@@ -58,6 +65,7 @@ from ..models import (
 from ..serializers import (
     ApplicationAdminListSerializer,
     ApplicationAdminSerializer,
+    ApplicationSearchResultSerializer,
     ApplicationAttachmentSerializer,
     ApplicationAttachmentUploadSerializer,
     ApplicationCreateSerializer,
@@ -70,6 +78,7 @@ from ..serializers import (
     InterviewCandidateCancelScheduleSerializer,
     InterviewCandidateListSerializer,
     InterviewPassedCandidateListSerializer,
+    InterviewOutcomeFastSerializer,
     InterviewCandidateResultSerializer,
     InterviewCandidateResendSmsSerializer,
     InterviewCandidateScheduleSerializer,
@@ -137,18 +146,125 @@ class OperationLogCursorPagination(CursorPagination):
     ordering = ("-created_at", "-id")
 
 
+class InterviewPoolCursorPagination(KeysetCursorPagination):
+    """拟面试池游标分页，与列表默认排序一致。"""
+
+    ordering = ("-created_at", "id")
+
+
+class InterviewOutcomeCursorPagination(KeysetCursorPagination):
+    """面试结果池（通过/人才库）游标分页，与结果池排序一致。"""
+
+    ordering = ("-result_at", "-updated_at", "-id")
+
+
+def admin_unpaginated_list_max_rows() -> int:
+    """未分页列表（兼容旧调用）最多返回的行数。"""
+    return max(int(getattr(settings, "ADMIN_UNPAGINATED_LIST_MAX_ROWS", 2000) or 2000), 1)
+
+
+def admin_list_stream_chunk_size() -> int:
+    """流式列表每批从数据库读取的行数。"""
+    return max(int(getattr(settings, "ADMIN_LIST_STREAM_CHUNK_SIZE", 500) or 500), 1)
+
+
+class StreamingListMixin:
+    """
+    列表流式输出（?stream=1）：按排序键 keyset 分批读取、逐行序列化并写出 JSON 数组，
+    返回结构与未分页数组一致，不受 ADMIN_UNPAGINATED_LIST_MAX_ROWS 限制。
+    """
+
+    stream_query_param = "stream"
+
+    def wants_stream(self, request: Request) -> bool:
+        return str(request.query_params.get(self.stream_query_param) or "").strip().lower() in {"1", "true", "yes"}
+
+    def stream_rows(self, queryset):
+        """返回 (行迭代器, 单行转换函数)，子类可替换为更轻量的实现。"""
+        serializer = self.get_serializer()
+        batches = iter_keyset_batches(queryset, batch_size=admin_list_stream_chunk_size())
+        return (obj for batch in batches for obj in batch), serializer.to_representation
+
+    def stream_list(self, queryset) -> StreamingHttpResponse:
+        rows, to_representation = self.stream_rows(queryset)
+        response = StreamingHttpResponse(
+            iter_json_array(rows, to_representation),
+            content_type="application/json",
+        )
+        # 告知反向代理不要缓冲整段响应。
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+def admin_list_etag_enabled() -> bool:
+    return bool(getattr(settings, "ADMIN_LIST_ETAG_ENABLED", True))
+
+
+class ConditionalListMixin:
+    """
+    列表条件请求：序列化前先用一次聚合查询算出结果集指纹（行数、主键和 + 各字段最大值 + 关联集合的行数与主键和），
+    与账号、地区范围、查询参数、目录版本一起生成 ETag；If-None-Match 命中时直接返回 304，不做序列化。
+    - fingerprint_fields：能反映行新增/修改的字段（如 updated_at、自增主键），取最大值；
+    - fingerprint_related_ids：输出中用到的一对多关联主键（如附件），取行数与主键和，删除任意一条都会改变指纹；
+    - fingerprint_catalog：输出含地区名/岗位名时为 True，地区/岗位变更递增的目录版本计入 ETag。
+    指纹未覆盖的关联数据不应出现在列表输出中。
+    """
+
+    fingerprint_fields: tuple[str, ...] = ("updated_at",)
+    fingerprint_related_ids: tuple[str, ...] = ()
+    fingerprint_catalog = False
+
+    def list_fingerprint(self, queryset) -> dict:
+        # 主键和能识别“移出一行、移入另一行”后行数不变的情况。
+        aggregates = {"count": Count("pk", distinct=True), "pk_sum": Sum("pk", distinct=True)}
+        for index, field in enumerate(self.fingerprint_fields):
+            aggregates[f"max_{index}"] = Max(field)
+        for index, field in enumerate(self.fingerprint_related_ids):
+            aggregates[f"related_count_{index}"] = Count(field, distinct=True)
+            aggregates[f"related_sum_{index}"] = Sum(field, distinct=True)
+        fingerprint = queryset.order_by().aggregate(**aggregates)
+        if self.fingerprint_catalog:
+            fingerprint["catalog"] = catalog_version()
+        return fingerprint
+
+    def list_etag(self, request: Request) -> str:
+        fingerprint = self.list_fingerprint(self.filter_queryset(self.get_queryset()))
+        params = sorted((key, sorted(values)) for key, values in request.query_params.lists())
+        source = json.dumps(
+            [
+                type(self).__name__,
+                getattr(request.user, "pk", None),
+                self._user_region_scope(),
+                params,
+                fingerprint,
+            ],
+            default=str,
+            ensure_ascii=False,
+        )
+        return f'W/"{hashlib.sha1(source.encode("utf-8")).hexdigest()}"'
+
+    def list(self, request: Request, *args, **kwargs):
+        if not admin_list_etag_enabled():
+            return super().list(request, *args, **kwargs)
+        etag = self.list_etag(request)
+        response = get_conditional_response(request, etag=etag) or super().list(request, *args, **kwargs)
+        response["ETag"] = etag
+        # 浏览器可缓存但每次轮询都带 If-None-Match 回源校验；指纹按账号区分，缓存随 Authorization 变化。
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ["Authorization"])
+        return response
+
+
 class AdminScopedMixin:
     authentication_classes = [ExpiringTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
+    @property
+    def region_scope(self) -> RegionScope:
+        return region_scope_for(self.request.user)
+
     def _user_region_scope(self):
-        user = self.request.user
-        profile = getattr(user, "profile", None)
-        if user.is_superuser:
-            return None
-        if profile and profile.can_view_all:
-            return None
-        return profile.region_id if profile else -1
+        return self.region_scope.filter_region_id
 
     def _scope_queryset(self, queryset):
         region_id = self._user_region_scope()
@@ -5,3 +5,6 @@ from django.apps import AppConfig
 class ApplicationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "application"
+
+    def ready(self):
+        from . import authentication, catalog_cache, checks, search_index  # noqa: F401
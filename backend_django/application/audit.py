@@ -1,22 +1,44 @@
 """审计日志工具：集中封装操作日志写入逻辑。"""
 from __future__ import annotations
 
+import atexit
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import close_old_connections, connection, transaction
 
 from .models import Application, InterviewCandidate, OperationLog, Region
+from .region_scope import region_scope_for
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
+
+_batch_state = threading.local()
+_async_lock = threading.Lock()
+_async_queue: queue.Queue | None = None
+
+
+def operation_log_async_enabled() -> bool:
+    return bool(getattr(settings, "OPERATION_LOG_ASYNC_ENABLED", False))
+
+
+def operation_log_async_queue_size() -> int:
+    return max(int(getattr(settings, "OPERATION_LOG_ASYNC_QUEUE_SIZE", 1000) or 1000), 1)
+
+
+def operation_log_async_exit_timeout_seconds() -> float:
+    return max(float(getattr(settings, "OPERATION_LOG_ASYNC_EXIT_TIMEOUT_SECONDS", 10) or 0), 0.0)
 
 
 def _safe_role_name(user) -> str:
     if not user:
         return ""
-    if getattr(user, "is_superuser", False):
-        return "superuser"
-    profile = getattr(user, "profile", None)
-    if profile and getattr(profile, "can_view_all", False):
-        return "global_admin"
-    return "regional_admin"
+    return region_scope_for(user).role_name
 
 
 def _safe_region(user, explicit_region=None):
@@ -24,10 +46,8 @@ def _safe_region(user, explicit_region=None):
         return explicit_region
     if not user:
         return None
-    profile = getattr(user, "profile", None)
-    if profile and getattr(profile, "region_id", None):
-        return getattr(profile, "region", None)
-    return None
+    # 复用请求内的地区范围，批量写日志时不会逐条读取 profile/地区。
+    return region_scope_for(user).region
 
 
 def request_id_from_request(request) -> str:
@@ -60,11 +80,11 @@ def write_operation_log(
     region: Region | None = None,
     request_id: str = "",
 ) -> None:
-    """写入操作日志，失败时不影响主业务流程。"""
+    """写入操作日志，失败时不影响主业务流程；处于 operation_log_batch 范围内时缓冲后批量写入。"""
     try:
         operator_username = getattr(user, "username", "") if user else ""
         target_region = _safe_region(user, explicit_region=region)
-        OperationLog.objects.create(
+        entry = OperationLog(
             operator=user if user and getattr(user, "pk", None) else None,
             operator_username=operator_username,
             operator_role=_safe_role_name(user),
@@ -82,6 +102,162 @@ def write_operation_log(
             details=details or {},
             request_id=request_id or "",
         )
+        batch = getattr(_batch_state, "batch", None)
+        if batch is None:
+            entry.save(force_insert=True)
+        else:
+            batch.add(entry)
     except Exception:
         # 审计写失败不阻断业务主流程，避免影响用户操作。
         return
+
+
+class _PendingEntry:
+    """缓冲中的日志：自身作为 on_commit 回调，所在事务提交时标记为可写入。"""
+
+    __slots__ = ("log", "committed")
+
+    def __init__(self, log: OperationLog, *, committed: bool):
+        self.log = log
+        self.committed = committed
+
+    def __call__(self):
+        self.committed = True
+
+
+class OperationLogBatch:
+    """
+    一次请求内的日志缓冲：
+    - 事务外写入的日志直接视为已提交；
+    - 事务内写入的日志以 transaction.on_commit 标记提交，所在事务/保存点回滚时回调被丢弃，日志随之丢弃，
+      与原先“日志与业务同事务写入”的语义一致；
+    - flush 时一次 bulk_create 写入全部可写日志；外层事务仍未结束（如外层 atomic、测试用例）时，
+      回调仍挂起的日志直接在该事务内写入，随外层事务一起提交或回滚。
+    """
+
+    def __init__(self):
+        self.entries: list[_PendingEntry] = []
+
+    def add(self, log: OperationLog):
+        entry = _PendingEntry(log, committed=not connection.in_atomic_block)
+        if not entry.committed:
+            transaction.on_commit(entry)
+        self.entries.append(entry)
+
+    def flush(self):
+        entries, self.entries = self.entries, []
+        if not entries:
+            return
+        pending = _pending_on_commit_callback_ids() if connection.in_atomic_block else set()
+        logs = [entry.log for entry in entries if entry.committed or id(entry) in pending]
+        if not logs:
+            return
+        if operation_log_async_enabled() and not connection.in_atomic_block:
+            _enqueue_async(logs)
+            return
+        _bulk_write(logs)
+
+
+def _pending_on_commit_callback_ids() -> set[int]:
+    """
+    当前连接上仍挂起（所在保存点未回滚）的提交回调。
+
+    connection.run_on_commit 是 Django 私有属性，与 TestCase.captureOnCommitCallbacks 的读法相同：
+    requirements 锁定的 Django 4.2 中每项为 (savepoint_ids, func, robust)，回调位于下标 1；
+    升级 Django 大版本时需核对该结构。
+    """
+    return {id(item[1]) for item in connection.run_on_commit}
+
+
+def _bulk_write(logs: list[OperationLog]):
+    """一次 bulk_create 写入；整体失败时逐条写入，单条失败不影响其他日志。"""
+    try:
+        with transaction.atomic():
+            OperationLog.objects.bulk_create(logs)
+        return
+    except Exception:
+        logger.warning("operation_log_bulk_write_failed count=%s", len(logs), exc_info=True)
+    for log in logs:
+        try:
+            with transaction.atomic():
+                log.pk = None
+                log.save(force_insert=True)
+        except Exception:
+            continue
+
+
+def _drain_async_queue(work_queue: queue.Queue):
+    while True:
+        logs = work_queue.get()
+        try:
+            close_old_connections()
+            _bulk_write(logs)
+        except Exception:
+            logger.warning("operation_log_async_write_failed count=%s", len(logs), exc_info=True)
+        finally:
+            work_queue.task_done()
+
+
+def _wait_async_queue(work_queue: queue.Queue, timeout: float) -> bool:
+    """等待队列中的日志全部写完；Queue.join 不支持超时，直接等待其 all_tasks_done 条件。"""
+    deadline = time.monotonic() + timeout
+    with work_queue.all_tasks_done:
+        while work_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            work_queue.all_tasks_done.wait(remaining)
+    return True
+
+
+def _drain_async_queue_at_exit(work_queue: queue.Queue):
+    """进程退出（gunicorn worker 回收/停止）时等待守护线程写完已排队的日志，超时则记录未写入批次数。"""
+    if not _wait_async_queue(work_queue, operation_log_async_exit_timeout_seconds()):
+        logger.error("operation_log_async_exit_timeout pending_batches=%s", work_queue.unfinished_tasks)
+
+
+def _enqueue_async(logs: list[OperationLog]):
+    """后台线程模式：放入有界队列由守护线程写入；队列已满时退回同步写入，进程退出前等待队列写完。"""
+    global _async_queue
+    with _async_lock:
+        if _async_queue is None:
+            _async_queue = queue.Queue(maxsize=operation_log_async_queue_size())
+            threading.Thread(
+                target=_drain_async_queue,
+                args=(_async_queue,),
+                name="operation-log-writer",
+                daemon=True,
+            ).start()
+            atexit.register(_drain_async_queue_at_exit, _async_queue)
+        work_queue = _async_queue
+    try:
+        work_queue.put_nowait(logs)
+    except queue.Full:
+        logger.warning("operation_log_async_queue_full count=%s", len(logs))
+        _bulk_write(logs)
+
+
+@contextmanager
+def operation_log_batch():
+    """在范围内缓冲 write_operation_log，退出时批量写入；嵌套使用时由最外层统一写入。"""
+    if getattr(_batch_state, "batch", None) is not None:
+        yield _batch_state.batch
+        return
+    batch = OperationLogBatch()
+    _batch_state.batch = batch
+    try:
+        yield batch
+    finally:
+        _batch_state.batch = None
+        batch.flush()
+
+
+class OperationLogBatchMiddleware:
+    """为每个请求开启日志缓冲，请求内的操作日志在响应返回前一次写入。"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with operation_log_batch():
+            return self.get_response(request)
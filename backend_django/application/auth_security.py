@@ -7,6 +7,8 @@ import time
 from django.conf import settings
 from django.core.cache import cache
 
+from . import metrics
+
 
 def normalize_login_username(username: str) -> str:
     """统一用户名输入格式，避免大小写/空格导致计数分散。"""
@@ -52,6 +54,7 @@ def register_login_failure(username: str) -> tuple[bool, int]:
     if not normalized:
         return False, 0
 
+    metrics.inc("hrm_login_failures_total")
     lock_remaining = get_lock_remaining_seconds(normalized)
     if lock_remaining > 0:
         return True, lock_remaining
@@ -68,6 +71,7 @@ def register_login_failure(username: str) -> tuple[bool, int]:
         cache.delete(fail_key)
         lock_seconds = lock_minutes * 60
         cache.set(_key("lock", normalized), time.time() + lock_seconds, timeout=lock_seconds)
+        metrics.inc("hrm_login_locks_total")
         return True, lock_seconds
 
     return False, 0
@@ -1,24 +1,128 @@
-"""认证相关扩展：为 Token 增加过期校验。"""
+"""认证相关扩展：为 Token 增加过期校验，并按 token 摘要短时缓存认证结果。"""
+import hashlib
 from datetime import timedelta
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from rest_framework import exceptions
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.authtoken.models import Token
 
+from .models import UserProfile
+from .region_scope import region_scope_for
+
+User = get_user_model()
+
+# 缓存命中时构造的账号只带这些字段，其余字段（如 password）访问时再按需读取。
+_CACHED_USER_FIELDS = ("id", "username", "first_name", "last_name", "is_active", "is_staff", "is_superuser")
+_CACHED_PROFILE_FIELDS = ("id", "user_id", "region_id", "can_view_all")
+
+
+def auth_token_cache_enabled() -> bool:
+    return bool(getattr(settings, "AUTH_TOKEN_CACHE_ENABLED", True))
+
+
+def auth_token_cache_seconds() -> int:
+    return max(int(getattr(settings, "AUTH_TOKEN_CACHE_SECONDS", 60) or 60), 1)
+
+
+def _cache_key(key: str) -> str:
+    # 缓存键只保存 token 摘要，共享缓存后端中不出现明文凭证。
+    return f"auth_token:{hashlib.sha256(key.encode('utf-8')).hexdigest()}"
+
+
+def _snapshot(token: Token) -> dict:
+    user = token.user
+    profile = getattr(user, "profile", None)
+    return {
+        "user": {field: getattr(user, field) for field in _CACHED_USER_FIELDS},
+        "created": token.created,
+        "profile": {field: getattr(profile, field) for field in _CACHED_PROFILE_FIELDS} if profile else None,
+    }
+
+
+def _from_cached(model, values: dict):
+    """按缓存字段构造已落库实例，未缓存字段标记为延迟加载。"""
+    names = [field.attname for field in model._meta.concrete_fields if field.attname in values]
+    return model.from_db(router.db_for_read(model), names, [values[name] for name in names])
+
+
+def _restore(key: str, snapshot: dict) -> Token:
+    user = _from_cached(User, snapshot["user"])
+    token = _from_cached(Token, {"key": key, "user_id": user.pk, "created": snapshot["created"]})
+    Token._meta.get_field("user").set_cached_value(token, user)
+    profile = _from_cached(UserProfile, snapshot["profile"]) if snapshot["profile"] else None
+    # 预置 user.profile（无 profile 时缓存 None），地区范围判断不再查询。
+    User._meta.get_field("profile").set_cached_value(user, profile)
+    if profile is not None:
+        UserProfile._meta.get_field("user").set_cached_value(profile, user)
+    return token
+
+
+def _forget(keys: list[str]):
+    cache.delete_many([_cache_key(key) for key in keys])
+
+
+def _forget_now_and_on_commit(keys: list[str]):
+    if not keys:
+        return
+    _forget(keys)
+    # 提交前的并发请求可能按旧数据重新写入缓存，提交后再清除一次。
+    transaction.on_commit(lambda: _forget(keys))
+
+
+def invalidate_user_auth_cache(user_id: int):
+    """账号或区域权限变更后清除该账号 token 的认证缓存。"""
+    _forget_now_and_on_commit(list(Token.objects.filter(user_id=user_id).values_list("key", flat=True)))
+
+
+@receiver(post_delete, sender=Token)
+def _invalidate_deleted_token(sender, instance, **kwargs):
+    # 退出登录、修改/重置密码、重新登录与删除账号都会删除 token。
+    _forget_now_and_on_commit([instance.key])
+
+
+@receiver(post_save, sender=User)
+def _invalidate_saved_user(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    invalidate_user_auth_cache(instance.pk)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def _invalidate_profile(sender, instance, **kwargs):
+    invalidate_user_auth_cache(instance.user_id)
+
 
 class ExpiringTokenAuthentication(TokenAuthentication):
-    """在 DRF TokenAuthentication 基础上增加 TTL 过期控制。"""
+    """在 DRF TokenAuthentication 基础上增加 TTL 过期控制；命中认证缓存时认证与地区范围判断均不查库。"""
 
     model = Token
 
-    def authenticate_credentials(self, key):
+    def _load_token(self, key):
+        cache_enabled = auth_token_cache_enabled()
+        if cache_enabled:
+            snapshot = cache.get(_cache_key(key))
+            if snapshot is not None:
+                return _restore(key, snapshot)
+
         model = self.get_model()
         try:
-            token = model.objects.select_related("user").get(key=key)
+            token = model.objects.select_related("user", "user__profile").get(key=key)
         except model.DoesNotExist:
             raise exceptions.AuthenticationFailed("无效的登录凭证")
+        if cache_enabled:
+            cache.set(_cache_key(key), _snapshot(token), timeout=auth_token_cache_seconds())
+        return token
+
+    def authenticate_credentials(self, key):
+        token = self._load_token(key)
 
         if not token.user.is_active:
             raise exceptions.AuthenticationFailed("账号已禁用")
@@ -30,4 +134,6 @@ class ExpiringTokenAuthentication(TokenAuthentication):
                 token.delete()
                 raise exceptions.AuthenticationFailed("登录已过期，请重新登录")
 
+        # 认证时解析一次地区范围，本次请求的视图、序列化器与审计写入共用。
+        region_scope_for(token.user)
         return (token.user, token)
@@ -0,0 +1,326 @@
+"""批量操作任务：大批量 ID 按块分事务执行，每块只短暂持有行锁，进度与逐条结果随块提交回写。"""
+from __future__ import annotations
+
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .audit import operation_log_batch, write_operation_log
+from .job_queue import claim_jobs, finish_job, requeue_stale_jobs
+from .models import Application, BatchOperationJob, InterviewCandidate, OperationLog
+from .offer_status_transition import OfferStatusTransitionError, OfferStatusTransitionService
+
+logger = logging.getLogger(__name__)
+
+BATCH_JOB_ERROR_RUNTIME = "BATCH_JOB_RUNTIME_ERROR"
+
+# 逐条结果取值。
+OUTCOME_ADDED = "added"
+OUTCOME_EXISTING = "existing"
+OUTCOME_REMOVED = "removed"
+OUTCOME_CONFIRMED = "confirmed"
+OUTCOME_MISSING = "missing"
+OUTCOME_INVALID_STATE = "invalid_state"
+OUTCOME_INVALID_OFFER_STATUS = "invalid_offer_status"
+
+
+class BatchJobOwnershipLost(RuntimeError):
+    """任务已超时回队并被其他 worker 重新领取，当前执行者须停止。"""
+
+
+def batch_job_queue_enabled() -> bool:
+    return bool(getattr(settings, "BATCH_JOB_QUEUE_ENABLED", True))
+
+
+def batch_job_worker_concurrency() -> int:
+    return max(int(getattr(settings, "BATCH_JOB_WORKER_CONCURRENCY", 2) or 2), 1)
+
+
+def batch_job_stale_seconds() -> int:
+    return max(int(getattr(settings, "BATCH_JOB_STALE_SECONDS", 600) or 600), 60)
+
+
+def batch_job_chunk_size() -> int:
+    return min(max(int(getattr(settings, "BATCH_JOB_CHUNK_SIZE", 100) or 100), 1), 1000)
+
+
+def batch_job_max_items() -> int:
+    return max(int(getattr(settings, "BATCH_JOB_MAX_ITEMS", 5000) or 5000), 1)
+
+
+def enqueue_batch_job(
+    *,
+    action: str,
+    item_ids: list[int],
+    region_scope: int | None,
+    user=None,
+    request_id: str = "",
+    inline: bool = False,
+) -> BatchOperationJob:
+    """创建批量任务；inline 为 True 时直接标记为执行中，由调用方在当前进程执行，不被 worker 领取。"""
+    now = timezone.now()
+    return BatchOperationJob.objects.create(
+        action=action,
+        status=BatchOperationJob.STATUS_RUNNING if inline else BatchOperationJob.STATUS_QUEUED,
+        locked_at=now if inline else None,
+        locked_by="inline" if inline else "",
+        item_ids=list(item_ids),
+        region_scope=region_scope,
+        chunk_size=batch_job_chunk_size(),
+        total=len(item_ids),
+        requested_by=user if user and getattr(user, "pk", None) else None,
+        request_id=request_id or "",
+    )
+
+
+def requeue_stale_batch_jobs(*, stale_seconds: int | None = None) -> int:
+    seconds = stale_seconds if stale_seconds is not None else batch_job_stale_seconds()
+    return requeue_stale_jobs(BatchOperationJob, stale_seconds=seconds)
+
+
+def claim_batch_jobs(*, limit: int, worker_name: str) -> list[int]:
+    return claim_jobs(BatchOperationJob, limit=limit, worker_name=worker_name)
+
+
+def _log(job: BatchOperationJob, **kwargs):
+    write_operation_log(user=job.requested_by, request_id=job.request_id, **kwargs)
+
+
+def _scope_applications(job: BatchOperationJob, queryset):
+    return queryset.filter(region_id=job.region_scope) if job.region_scope else queryset
+
+
+def _scope_candidates(job: BatchOperationJob, queryset):
+    return queryset.filter(application__region_id=job.region_scope) if job.region_scope else queryset
+
+
+def _run_interview_pool_add(job: BatchOperationJob, chunk: list[int]) -> dict[int, str]:
+    app_map = {
+        app.id: app
+        for app in _scope_applications(job, Application.objects.select_related("region").filter(id__in=chunk))
+    }
+    existing_before = set(
+        InterviewCandidate.objects.filter(application_id__in=app_map).values_list("application_id", flat=True)
+    )
+    InterviewCandidate.objects.bulk_create(
+        [InterviewCandidate(application_id=app_id) for app_id in app_map if app_id not in existing_before],
+        ignore_conflicts=True,
+    )
+    # 与同步批量加入接口一致，插入后重新读取：被并发写入抢先、因冲突被忽略的行不计为本任务新增。
+    existing_after = set(
+        InterviewCandidate.objects.filter(application_id__in=app_map).values_list("application_id", flat=True)
+    )
+    added_ids = existing_after - existing_before
+    outcomes = {}
+    for application_id in chunk:
+        application = app_map.get(application_id)
+        if application is None:
+            outcomes[application_id] = OUTCOME_MISSING
+            continue
+        is_existing = application_id not in added_ids
+        outcomes[application_id] = OUTCOME_EXISTING if is_existing else OUTCOME_ADDED
+        _log(
+            job,
+            module="applications",
+            action="ADD_TO_INTERVIEW_POOL",
+            target_type="application",
+            target_id=application.id,
+            target_label=application.name,
+            summary=f"{application.name}加入拟面试人员{'（已存在）' if is_existing else ''}",
+            details={
+                "application_id": application.id,
+                "existing": is_existing,
+                "added": not is_existing,
+                "batch_job_id": job.id,
+            },
+            application=application,
+            region=application.region,
+        )
+    return outcomes
+
+
+def _run_interview_pool_remove(job: BatchOperationJob, chunk: list[int]) -> dict[int, str]:
+    queryset = _scope_candidates(job, InterviewCandidate.objects.filter(id__in=chunk))
+    candidates = list(queryset.select_related("application", "application__region"))
+    queryset.delete()
+    outcomes = {candidate_id: OUTCOME_MISSING for candidate_id in chunk}
+    for candidate in candidates:
+        application = candidate.application
+        outcomes[candidate.id] = OUTCOME_REMOVED
+        _log(
+            job,
+            module="interviews",
+            action="REMOVE_FROM_INTERVIEW_POOL",
+            target_type="interview_candidate",
+            target_id=candidate.id,
+            target_label=application.name,
+            summary=f"移出拟面试人员：{application.name}",
+            details={
+                "interview_candidate_id": candidate.id,
+                "application_id": application.id,
+                "batch_job_id": job.id,
+            },
+            application=application,
+            region=application.region,
+        )
+    return outcomes
+
+
+_CONFIRM_HIRE_ERROR_OUTCOMES = {
+    "invalid_candidate_state": OUTCOME_INVALID_STATE,
+    "invalid_offer_status_for_confirm": OUTCOME_INVALID_OFFER_STATUS,
+}
+
+
+def _run_confirm_hire(job: BatchOperationJob, chunk: list[int]) -> dict[int, str]:
+    candidate_map = {
+        item.id: item
+        for item in _scope_candidates(
+            job,
+            InterviewCandidate.objects.select_for_update()
+            .select_related("application", "application__region")
+            .filter(id__in=chunk),
+        )
+    }
+    now = timezone.now()
+    outcomes = {}
+    confirmed = []
+    for candidate_id in chunk:
+        candidate = candidate_map.get(candidate_id)
+        if candidate is None:
+            outcomes[candidate_id] = OUTCOME_MISSING
+            continue
+        try:
+            OfferStatusTransitionService.apply_confirm_hire(candidate)
+        except OfferStatusTransitionError as exc:
+            # 与同步接口整批拒绝不同，大批量任务逐条记录不符合条件的原因，其余照常处理。
+            outcomes[candidate_id] = _CONFIRM_HIRE_ERROR_OUTCOMES.get(exc.code, OUTCOME_INVALID_STATE)
+            continue
+        candidate.updated_at = now
+        confirmed.append(candidate)
+        outcomes[candidate_id] = OUTCOME_CONFIRMED
+    InterviewCandidate.objects.bulk_update(confirmed, ["is_hired", "hired_at", "offer_status", "updated_at"])
+    for candidate in confirmed:
+        application = candidate.application
+        _log(
+            job,
+            module="interviews",
+            action="CONFIRM_HIRE",
+            target_type="interview_candidate",
+            target_id=candidate.id,
+            target_label=application.name,
+            summary=f"发放offer：{application.name}",
+            details={
+                "interview_candidate_id": candidate.id,
+                "application_id": application.id,
+                "already_confirmed": False,
+                "is_hired": candidate.is_hired,
+                "hired_at": "",
+                "offer_status": candidate.offer_status,
+                "batch_job_id": job.id,
+            },
+            application=application,
+            interview_candidate=candidate,
+            region=application.region,
+        )
+    return outcomes
+
+
+CHUNK_HANDLERS = {
+    BatchOperationJob.ACTION_INTERVIEW_POOL_ADD: _run_interview_pool_add,
+    BatchOperationJob.ACTION_INTERVIEW_POOL_REMOVE: _run_interview_pool_remove,
+    BatchOperationJob.ACTION_CONFIRM_HIRE: _run_confirm_hire,
+}
+
+SUMMARY_ACTIONS = {
+    BatchOperationJob.ACTION_INTERVIEW_POOL_ADD: ("applications", "BATCH_ADD_TO_INTERVIEW_POOL", "application_batch"),
+    BatchOperationJob.ACTION_INTERVIEW_POOL_REMOVE: (
+        "interviews",
+        "BATCH_REMOVE_FROM_INTERVIEW_POOL",
+        "interview_candidate_batch",
+    ),
+    BatchOperationJob.ACTION_CONFIRM_HIRE: ("interviews", "BATCH_CONFIRM_HIRE", "interview_candidate_batch"),
+}
+
+
+def _run_chunk(job: BatchOperationJob, handler, chunk: list[int]):
+    """
+    单块在独立事务内执行；进度与业务改动同事务提交，worker 中断回队后从下一块继续，不会重复处理。
+    进度回写按领取者与已处理位置条件更新：任务被回队并由其他 worker 领取后更新命中 0 行，
+    本块改动随事务回滚，当前执行者停止，已提交的块不会被两个 worker 重复执行。
+    """
+    with operation_log_batch(), transaction.atomic():
+        outcomes = handler(job, chunk)
+        counts = dict(job.outcome_counts or {})
+        for outcome in outcomes.values():
+            counts[outcome] = counts.get(outcome, 0) + 1
+        progress = {
+            "outcomes": {**(job.outcomes or {}), **{str(item_id): value for item_id, value in outcomes.items()}},
+            "outcome_counts": counts,
+            "processed": job.processed + len(chunk),
+        }
+        now = timezone.now()
+        # 每块刷新领取时间作为心跳，长任务不会被误判超时回队。
+        updated = BatchOperationJob.objects.filter(
+            pk=job.pk,
+            locked_by=job.locked_by,
+            processed=job.processed,
+        ).update(updated_at=now, locked_at=now, **progress)
+        if not updated:
+            raise BatchJobOwnershipLost(f"批量任务#{job.id} 已由其他 worker 领取")
+    # 事务提交后再同步内存对象，块失败回滚时内存进度与库内一致。
+    for field, value in progress.items():
+        setattr(job, field, value)
+
+
+def _write_summary_log(job: BatchOperationJob):
+    module, action, target_type = SUMMARY_ACTIONS[job.action]
+    counts = job.outcome_counts or {}
+    counts_text = "，".join(f"{key} {value}" for key, value in sorted(counts.items())) or "无"
+    _log(
+        job,
+        module=module,
+        action=action,
+        result=OperationLog.RESULT_SUCCESS if job.status == job.STATUS_SUCCESS else OperationLog.RESULT_FAILED,
+        target_type=target_type,
+        target_label=f"{job.total}条记录",
+        summary=f"{job.get_action_display()}（后台任务#{job.id}）：{counts_text}",
+        details={
+            "batch_job_id": job.id,
+            "outcome_counts": counts,
+            "processed": job.processed,
+            "total": job.total,
+        },
+    )
+
+
+def run_batch_job(job_id: int) -> BatchOperationJob:
+    """执行已领取的批量任务：从已处理位置继续逐块执行，结束后写汇总日志。"""
+    job = BatchOperationJob.objects.select_related("requested_by").get(pk=job_id)
+    handler = CHUNK_HANDLERS[job.action]
+    item_ids = list(job.item_ids or [])
+    chunk_size = max(int(job.chunk_size or 1), 1)
+    try:
+        while job.processed < len(item_ids):
+            _run_chunk(job, handler, item_ids[job.processed : job.processed + chunk_size])
+    except BatchJobOwnershipLost:
+        # 状态与汇总日志交由当前领取者回写。
+        logger.warning("batch_job_ownership_lost job_id=%s worker=%s processed=%s", job.id, job.locked_by, job.processed)
+        return job
+    except Exception as err:
+        logger.exception("batch_job_failed job_id=%s action=%s processed=%s", job.id, job.action, job.processed)
+        finish_job(job, success=False, error_code=BATCH_JOB_ERROR_RUNTIME, error_message=f"批量任务异常：{err}")
+    else:
+        finish_job(job, success=True)
+    _write_summary_log(job)
+    logger.info(
+        "batch_job_done job_id=%s action=%s status=%s processed=%s total=%s",
+        job.id,
+        job.action,
+        job.status,
+        job.processed,
+        job.total,
+    )
+    return job
@@ -0,0 +1,89 @@
+"""公开目录缓存：地区/地区字段/岗位的序列化结果按版本号存入 Django cache，模型变更时递增版本整体失效。"""
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+from .models import Job, Region, RegionField
+
+_VERSION_KEY = "public_catalog:version"
+
+
+def catalog_cache_enabled() -> bool:
+    return bool(getattr(settings, "PUBLIC_CATALOG_CACHE_ENABLED", True))
+
+
+def catalog_cache_seconds() -> int:
+    return max(int(getattr(settings, "PUBLIC_CATALOG_CACHE_SECONDS", 300) or 300), 1)
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def catalog_version() -> int:
+    """当前目录版本（毫秒时间戳），同时作为 Last-Modified；缓存中不存在时以当前时间初始化。"""
+    version = cache.get(_VERSION_KEY)
+    if version is None:
+        cache.add(_VERSION_KEY, _now_ms(), timeout=None)
+        version = cache.get(_VERSION_KEY) or _now_ms()
+    return int(version)
+
+
+def bump_catalog_version() -> int:
+    """递增目录版本；旧版本的缓存键不再被读取，随过期时间自然淘汰。"""
+    version = max(_now_ms(), int(cache.get(_VERSION_KEY) or 0) + 1)
+    cache.set(_VERSION_KEY, version, timeout=None)
+    return version
+
+
+@receiver(post_save, sender=Region)
+@receiver(post_delete, sender=Region)
+@receiver(post_save, sender=RegionField)
+@receiver(post_delete, sender=RegionField)
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def _invalidate_catalog(sender, **kwargs):
+    bump_catalog_version()
+    # 提交前的并发请求可能按未提交前的数据重建新版本缓存，提交后再递增一次。
+    transaction.on_commit(bump_catalog_version)
+
+
+def catalog_response(request, key: str, build: Callable[[], Any]):
+    """
+    按目录版本返回缓存的序列化结果：
+    - If-None-Match / If-Modified-Since 命中时直接返回 304，不读缓存正文；
+    - 未命中缓存时调用 build() 生成并写入当前版本的缓存键。
+    """
+    if not catalog_cache_enabled():
+        return Response(build())
+
+    version = catalog_version()
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    etag = quote_etag(f"catalog-{version}-{digest}")
+    last_modified = version // 1000
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is None:
+        cache_key = f"public_catalog:{version}:{digest}"
+        payload = cache.get(cache_key)
+        if payload is None:
+            payload = build()
+            cache.set(cache_key, payload, timeout=catalog_cache_seconds())
+        response = Response(payload)
+    else:
+        response = not_modified
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    # 允许浏览器/CDN 保存，但每次都带条件头回源校验，目录变更后立即可见。
+    patch_cache_control(response, public=True, no_cache=True)
+    return response
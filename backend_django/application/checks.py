@@ -0,0 +1,22 @@
+"""系统检查：启动（runserver/migrate/check）时校验 OA 字段映射配置，避免推送时才暴露问题。"""
+from django.conf import settings
+from django.core.checks import Error, register
+
+from .oa_field_mapping import OAFieldMappingError, get_oa_field_mapping_plan
+
+
+@register()
+def check_oa_field_mappings(app_configs, **kwargs):
+    if not getattr(settings, "OA_PUSH_ENABLED", False):
+        return []
+    try:
+        get_oa_field_mapping_plan()
+    except OAFieldMappingError as err:
+        return [
+            Error(
+                f"OA 字段映射配置错误：{err}",
+                hint="检查 OA_PUSH_MAIN_FIELD_MAPPINGS / OA_PUSH_REQUEST_NAME_TEMPLATE / OA_PUSH_REMARK_TEMPLATE",
+                id="application.E001",
+            )
+        ]
+    return []
@@ -0,0 +1,199 @@
+"""外部依赖熔断器：按端点统计失败率，熔断期间快速失败，到期后放行单个探测请求。
+
+状态保存在 Django 缓存中，web 与各 worker 进程共享同一份熔断状态。
+- closed：正常放行，按固定时间窗统计请求数与失败数，失败率超阈值即熔断。
+- open：熔断中，直接拒绝请求。
+- half_open：熔断到期，只放行一个探测请求；成功则恢复，失败则按倍数延长熔断时长。
+"""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+CIRCUIT_BREAKER_LABELS = {
+    "oa:applytoken": "OA 获取 token",
+    "oa:create_request": "OA 创建流程",
+    "oa:hrm_user_info": "OA 人员信息查询",
+    "sms:aliyun": "阿里云短信",
+}
+
+CIRCUIT_STATE_LABELS = {
+    STATE_CLOSED: "正常",
+    STATE_OPEN: "熔断中",
+    STATE_HALF_OPEN: "探测中",
+}
+
+
+class CircuitOpenError(RuntimeError):
+    """熔断期间拒绝请求。"""
+
+
+def circuit_breaker_enabled() -> bool:
+    return bool(getattr(settings, "CIRCUIT_BREAKER_ENABLED", True))
+
+
+def _window_seconds() -> int:
+    return max(int(getattr(settings, "CIRCUIT_BREAKER_WINDOW_SECONDS", 60) or 60), 1)
+
+
+def _min_requests() -> int:
+    return max(int(getattr(settings, "CIRCUIT_BREAKER_MIN_REQUESTS", 5) or 5), 1)
+
+
+def _failure_percent() -> int:
+    return min(max(int(getattr(settings, "CIRCUIT_BREAKER_FAILURE_PERCENT", 50) or 50), 1), 100)
+
+
+def _open_seconds() -> int:
+    return max(int(getattr(settings, "CIRCUIT_BREAKER_OPEN_SECONDS", 30) or 30), 1)
+
+
+def _max_open_seconds() -> int:
+    return max(int(getattr(settings, "CIRCUIT_BREAKER_MAX_OPEN_SECONDS", 300) or 300), _open_seconds())
+
+
+class CircuitBreaker:
+    """单个端点的熔断器，实例本身无状态，可随用随建。"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.label = CIRCUIT_BREAKER_LABELS.get(name, name)
+
+    def _key(self, suffix: str) -> str:
+        return f"circuit_breaker:{self.name}:{suffix}"
+
+    def _window_keys(self, now: float) -> tuple[str, str]:
+        index = int(now // _window_seconds())
+        return self._key(f"w{index}:total"), self._key(f"w{index}:failed")
+
+    def _incr(self, key: str) -> int:
+        timeout = _window_seconds() * 2
+        cache.add(key, 0, timeout=timeout)
+        try:
+            return int(cache.incr(key))
+        except ValueError:
+            # 计数键在 add 与 incr 之间过期，重新计数。
+            cache.set(key, 1, timeout=timeout)
+            return 1
+
+    def _load_state(self) -> dict[str, Any] | None:
+        state = cache.get(self._key("state"))
+        return state if isinstance(state, dict) else None
+
+    def _current_state(self, state: dict[str, Any] | None, now: float) -> str:
+        if state is None:
+            return STATE_CLOSED
+        if now < float(state.get("opened_at", 0)) + int(state.get("open_seconds", 0)):
+            return STATE_OPEN
+        return STATE_HALF_OPEN
+
+    def _open(self, *, open_seconds: int, trips: int, now: float) -> None:
+        cache.set(
+            self._key("state"),
+            {"opened_at": now, "open_seconds": open_seconds, "trips": trips},
+            timeout=None,
+        )
+        cache.delete(self._key("probe"))
+
+    def _close(self, now: float) -> None:
+        cache.delete_many([self._key("state"), self._key("probe"), *self._window_keys(now)])
+
+    def allow_request(self) -> bool:
+        """是否放行本次请求；半开状态下只有抢到探测名额的调用方返回 True。"""
+        if not circuit_breaker_enabled():
+            return True
+        now = time.time()
+        current = self._current_state(self._load_state(), now)
+        if current == STATE_CLOSED:
+            return True
+        if current == STATE_OPEN:
+            return False
+        # 探测名额带过期时间，探测方异常退出时不会永久卡在半开。
+        return bool(cache.add(self._key("probe"), now, timeout=_open_seconds()))
+
+    def record_success(self) -> None:
+        if not circuit_breaker_enabled():
+            return
+        now = time.time()
+        if self._current_state(self._load_state(), now) != STATE_CLOSED:
+            self._close(now)
+            return
+        self._incr(self._window_keys(now)[0])
+
+    def record_failure(self) -> None:
+        if not circuit_breaker_enabled():
+            return
+        now = time.time()
+        state = self._load_state()
+        current = self._current_state(state, now)
+        if current == STATE_HALF_OPEN:
+            # 探测失败：熔断时长翻倍，封顶 CIRCUIT_BREAKER_MAX_OPEN_SECONDS。
+            self._open(
+                open_seconds=min(int(state.get("open_seconds", 0)) * 2 or _open_seconds(), _max_open_seconds()),
+                trips=int(state.get("trips", 0)) + 1,
+                now=now,
+            )
+            return
+        if current == STATE_OPEN:
+            return
+        total_key, failed_key = self._window_keys(now)
+        total = self._incr(total_key)
+        failed = self._incr(failed_key)
+        if total >= _min_requests() and failed * 100 >= total * _failure_percent():
+            self._open(open_seconds=_open_seconds(), trips=1, now=now)
+
+    def snapshot(self) -> dict[str, Any]:
+        now = time.time()
+        state = self._load_state()
+        current = self._current_state(state, now)
+        total_key, failed_key = self._window_keys(now)
+        counts = cache.get_many([total_key, failed_key])
+        retry_after = 0
+        if current == STATE_OPEN:
+            retry_after = max(int(float(state["opened_at"]) + int(state["open_seconds"]) - now), 0)
+        return {
+            "name": self.name,
+            "label": self.label,
+            "state": current,
+            "state_label": CIRCUIT_STATE_LABELS[current],
+            "window_requests": int(counts.get(total_key) or 0),
+            "window_failures": int(counts.get(failed_key) or 0),
+            "open_seconds": int(state.get("open_seconds", 0)) if state else 0,
+            "retry_after_seconds": retry_after,
+            "trips": int(state.get("trips", 0)) if state else 0,
+        }
+
+    def reset(self) -> None:
+        self._close(time.time())
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    return CircuitBreaker(name)
+
+
+def circuit_breaker_states() -> list[dict[str, Any]]:
+    """全部已登记端点的熔断快照，供管理端展示。"""
+    return [get_circuit_breaker(name).snapshot() for name in CIRCUIT_BREAKER_LABELS]
+
+
+def circuit_breaker_config() -> dict[str, Any]:
+    return {
+        "enabled": circuit_breaker_enabled(),
+        "window_seconds": _window_seconds(),
+        "min_requests": _min_requests(),
+        "failure_percent": _failure_percent(),
+        "open_seconds": _open_seconds(),
+        "max_open_seconds": _max_open_seconds(),
+    }
+
+
+def reset_circuit_breakers() -> None:
+    for name in CIRCUIT_BREAKER_LABELS:
+        get_circuit_breaker(name).reset()
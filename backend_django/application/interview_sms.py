@@ -2,13 +2,17 @@
 from __future__ import annotations
 
 import json
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 
+from . import metrics
+from .circuit_breaker import get_circuit_breaker
 from .interview_flow import InterviewFlowError
 from .models import InterviewCandidate
 
@@ -60,6 +64,14 @@ def _build_interview_template_params(candidate: InterviewCandidate) -> dict[str,
     }
 
 
+@lru_cache(maxsize=4)
+def _get_aliyun_client(access_key_id: str, access_key_secret: str, region_id: str):
+    """按凭据复用 AcsClient，避免每条短信重复构建客户端。"""
+    from aliyunsdkcore.client import AcsClient
+
+    return AcsClient(access_key_id, access_key_secret, region_id)
+
+
 def _send_via_aliyun(phone: str, template_params: dict[str, str], *, out_id: str = "") -> SmsDispatchResult:
     access_key_id = str(getattr(settings, "ALIYUN_SMS_ACCESS_KEY_ID", "") or "").strip()
     access_key_secret = str(getattr(settings, "ALIYUN_SMS_ACCESS_KEY_SECRET", "") or "").strip()
@@ -75,7 +87,7 @@ def _send_via_aliyun(phone: str, template_params: dict[str, str], *, out_id: str
         )
 
     try:
-        from aliyunsdkcore.client import AcsClient
+        from aliyunsdkcore.client import AcsClient  # noqa: F401
         from aliyunsdkcore.acs_exception.exceptions import ClientException, ServerException
         from aliyunsdkdysmsapi.request.v20170525 import SendSmsRequest
     except Exception:
@@ -94,22 +106,33 @@ def _send_via_aliyun(phone: str, template_params: dict[str, str], *, out_id: str
     if out_id:
         request.set_OutId(out_id)
 
-    client = AcsClient(access_key_id, access_key_secret, region_id)
+    # 只有请求异常计入熔断失败；供应商返回的业务错误码说明通道可达。
+    breaker = get_circuit_breaker("sms:aliyun")
+    if not breaker.allow_request():
+        return SmsDispatchResult(
+            success=False,
+            provider_code="SMS_REQUEST_ERROR",
+            provider_message=f"{breaker.label}熔断中，暂停发送",
+        )
+    client = _get_aliyun_client(access_key_id, access_key_secret, region_id)
     try:
         raw_bytes = client.do_action_with_exception(request)
         payload = json.loads(raw_bytes.decode("utf-8"))
     except (ClientException, ServerException) as err:
+        breaker.record_failure()
         return SmsDispatchResult(
             success=False,
             provider_code=getattr(err, "error_code", "") or "SMS_REQUEST_ERROR",
             provider_message=str(err),
         )
     except Exception as err:
+        breaker.record_failure()
         return SmsDispatchResult(
             success=False,
             provider_code="SMS_REQUEST_ERROR",
             provider_message=str(err),
         )
+    breaker.record_success()
 
     code = str(payload.get("Code", "") or "")
     message = str(payload.get("Message", "") or "")
@@ -215,19 +238,25 @@ def _mark_sms_result(candidate: InterviewCandidate, result: SmsDispatchResult) -
     )
 
 
-def dispatch_interview_schedule_sms(
-    candidate_id: int, *, is_retry: bool = False
-) -> tuple[InterviewCandidate, SmsDispatchResult]:
-    """发送面试安排短信并更新候选人短信状态。"""
-    with transaction.atomic():
-        candidate = (
-            InterviewCandidate.objects.select_for_update()
-            .select_related("application", "application__job")
-            .get(pk=candidate_id)
-        )
-        _validate_sms_send_precondition(candidate)
-        _mark_sms_sending(candidate, is_retry=is_retry)
+def _lock_candidate(candidate_id: int) -> InterviewCandidate:
+    return (
+        InterviewCandidate.objects.select_for_update()
+        .select_related("application", "application__job")
+        .get(pk=candidate_id)
+    )
+
 
+def begin_interview_sms(candidate_id: int, *, is_retry: bool) -> InterviewCandidate:
+    """校验面试已安排并把短信状态落为 sending；需在事务内调用。"""
+    candidate = _lock_candidate(candidate_id)
+    _validate_sms_send_precondition(candidate)
+    _mark_sms_sending(candidate, is_retry=is_retry)
+    return candidate
+
+
+def send_interview_sms(candidate: InterviewCandidate) -> SmsDispatchResult:
+    """调用短信供应商发送，异常统一转为失败结果。"""
+    started = time.perf_counter()
     try:
         result = _send_interview_sms(candidate)
     except Exception as err:
@@ -236,12 +265,30 @@ def dispatch_interview_schedule_sms(
             provider_code="SMS_RUNTIME_ERROR",
             provider_message=str(err),
         )
+    provider = _sms_provider()
+    outcome = "success" if result.success else "failed"
+    metrics.inc(
+        "hrm_sms_dispatch_total",
+        {"provider": provider, "provider_code": result.provider_code or "", "result": outcome},
+    )
+    metrics.observe("hrm_sms_dispatch_duration_seconds", time.perf_counter() - started, {"provider": provider})
+    return result
 
+
+def record_interview_sms_result(candidate_id: int, result: SmsDispatchResult) -> InterviewCandidate:
     with transaction.atomic():
-        candidate = (
-            InterviewCandidate.objects.select_for_update()
-            .select_related("application", "application__job")
-            .get(pk=candidate_id)
-        )
+        candidate = _lock_candidate(candidate_id)
         _mark_sms_result(candidate, result)
+    return candidate
+
+
+def dispatch_interview_schedule_sms(
+    candidate_id: int, *, is_retry: bool = False
+) -> tuple[InterviewCandidate, SmsDispatchResult]:
+    """发送面试安排短信并更新候选人短信状态。"""
+    with transaction.atomic():
+        candidate = begin_interview_sms(candidate_id, is_retry=is_retry)
+
+    result = send_interview_sms(candidate)
+    candidate = record_interview_sms_result(candidate_id, result)
     return candidate, result
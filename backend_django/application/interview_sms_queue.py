@@ -0,0 +1,183 @@
+"""面试短信任务队列：接口只负责入队，run_interview_sms_worker 在后台按供应商限速发送。"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+
+from .audit import write_operation_log
+from .interview_sms import (
+    SmsDispatchResult,
+    _sms_provider,
+    begin_interview_sms,
+    record_interview_sms_result,
+    send_interview_sms,
+)
+from .job_queue import claim_jobs, finish_job, requeue_stale_jobs
+from .models import InterviewCandidate, InterviewSmsJob, OperationLog
+
+logger = logging.getLogger(__name__)
+
+
+def interview_sms_queue_enabled() -> bool:
+    return bool(getattr(settings, "INTERVIEW_SMS_QUEUE_ENABLED", True))
+
+
+def interview_sms_worker_concurrency() -> int:
+    return max(int(getattr(settings, "INTERVIEW_SMS_WORKER_CONCURRENCY", 4) or 4), 1)
+
+
+def interview_sms_job_stale_seconds() -> int:
+    return max(int(getattr(settings, "INTERVIEW_SMS_JOB_STALE_SECONDS", 300) or 300), 60)
+
+
+def interview_sms_rate_per_second() -> float:
+    """单个 worker 进程内每个供应商的发送速率上限，<=0 表示不限速。"""
+    try:
+        return float(getattr(settings, "INTERVIEW_SMS_RATE_PER_SECOND", 10) or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class _ProviderRateLimiter:
+    """按供应商划分的令牌桶，线程安全；worker 线程发送前先取令牌。"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def acquire(self, provider: str, rate: float) -> None:
+        if rate <= 0:
+            return
+        capacity = max(rate, 1.0)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, updated_at = self._buckets.get(provider, (capacity, now))
+                tokens = min(capacity, tokens + (now - updated_at) * rate)
+                if tokens >= 1:
+                    self._buckets[provider] = (tokens - 1, now)
+                    return
+                self._buckets[provider] = (tokens, now)
+                wait_seconds = (1 - tokens) / rate
+            time.sleep(wait_seconds)
+
+
+_RATE_LIMITER = _ProviderRateLimiter()
+
+
+def enqueue_interview_sms(
+    candidate_id: int,
+    *,
+    is_retry: bool = False,
+    user=None,
+    request_id: str = "",
+) -> tuple[InterviewCandidate, InterviewSmsJob]:
+    """
+    校验面试已安排，把短信状态落为 sending 并入队。
+
+    同一候选人已有未完成任务时直接复用；未安排面试时抛 InterviewFlowError。
+    """
+    with transaction.atomic():
+        candidate = begin_interview_sms(candidate_id, is_retry=is_retry)
+        active_job = (
+            InterviewSmsJob.objects.filter(candidate_id=candidate_id, status=InterviewSmsJob.STATUS_QUEUED)
+            .order_by("id")
+            .first()
+        )
+        if active_job is not None:
+            # 尚未发出的任务会读取最新面试信息，无需重复入队。
+            return candidate, active_job
+        job = InterviewSmsJob.objects.create(
+            candidate=candidate,
+            is_retry=is_retry,
+            provider=_sms_provider(),
+            requested_by=user if user and getattr(user, "pk", None) else None,
+            request_id=request_id or "",
+        )
+    return candidate, job
+
+
+def queued_sms_payload(job: InterviewSmsJob) -> dict:
+    """入队后的短信返回结构：字段与 SmsDispatchResult.to_payload 对齐，附带任务信息。"""
+    return {
+        **SmsDispatchResult(success=False).to_payload(),
+        "queued": True,
+        "job_id": job.id,
+        "job_status": job.status,
+    }
+
+
+def requeue_stale_interview_sms_jobs(*, stale_seconds: int | None = None) -> int:
+    seconds = stale_seconds if stale_seconds is not None else interview_sms_job_stale_seconds()
+    return requeue_stale_jobs(InterviewSmsJob, stale_seconds=seconds)
+
+
+def claim_interview_sms_jobs(*, limit: int, worker_name: str) -> list[int]:
+    return claim_jobs(InterviewSmsJob, limit=limit, worker_name=worker_name)
+
+
+def _write_sms_log(job: InterviewSmsJob, candidate: InterviewCandidate, result: SmsDispatchResult) -> None:
+    application = candidate.application
+    write_operation_log(
+        user=job.requested_by,
+        module="interviews",
+        action="INTERVIEW_SMS_SUCCESS" if result.success else "INTERVIEW_SMS_FAILED",
+        result=OperationLog.RESULT_SUCCESS if result.success else OperationLog.RESULT_FAILED,
+        target_type="interview_candidate",
+        target_id=candidate.id,
+        target_label=application.name,
+        summary=f"面试短信发送{'成功' if result.success else '失败'}：{application.name}",
+        details={
+            "interview_candidate_id": candidate.id,
+            "application_id": application.id,
+            "sms_job_id": job.id,
+            "is_retry": job.is_retry,
+            "sms": result.to_payload(),
+        },
+        application=application,
+        interview_candidate=candidate,
+        region=application.region,
+        request_id=job.request_id,
+    )
+
+
+def run_interview_sms_job(job_id: int) -> SmsDispatchResult:
+    """执行单个已领取任务：发送前复核面试仍处于已安排状态，再按供应商限速发送。"""
+    job = InterviewSmsJob.objects.select_related("requested_by").get(pk=job_id)
+    candidate = InterviewCandidate.objects.select_related(
+        "application", "application__job", "application__region"
+    ).get(pk=job.candidate_id)
+
+    if candidate.status != InterviewCandidate.STATUS_SCHEDULED or not candidate.interview_at:
+        # 入队后面试被取消/出结果，不再发送过期通知。
+        result = SmsDispatchResult(
+            success=False,
+            provider_code="INTERVIEW_NOT_SCHEDULED",
+            provider_message="面试已取消或状态已变更，短信未发送",
+        )
+    else:
+        _RATE_LIMITER.acquire(job.provider or _sms_provider(), interview_sms_rate_per_second())
+        result = send_interview_sms(candidate)
+
+    try:
+        candidate = record_interview_sms_result(job.candidate_id, result)
+    finally:
+        finish_job(
+            job,
+            success=result.success,
+            error_code=result.provider_code,
+            error_message=result.provider_message,
+        )
+    _write_sms_log(job, candidate, result)
+    logger.info(
+        "interview_sms_job_done job_id=%s candidate_id=%s success=%s provider_code=%s",
+        job.id,
+        candidate.id,
+        result.success,
+        result.provider_code,
+    )
+    return result
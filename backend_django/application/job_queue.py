@@ -0,0 +1,49 @@
+"""数据库任务队列通用能力：领取、超时回队与完成回写，供 OA 推送/短信等 outbox 复用。"""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+
+def requeue_stale_jobs(model, *, stale_seconds: int) -> int:
+    """worker 异常退出后遗留的执行中任务超时回队，返回回队数量。"""
+    now = timezone.now()
+    return model.objects.filter(
+        status=model.STATUS_RUNNING,
+        locked_at__lt=now - timedelta(seconds=max(int(stale_seconds), 1)),
+    ).update(
+        status=model.STATUS_QUEUED,
+        locked_at=None,
+        locked_by="",
+        updated_at=now,
+    )
+
+
+def claim_jobs(model, *, limit: int, worker_name: str) -> list[int]:
+    """按入队顺序领取待执行任务；SKIP LOCKED 保证多个 worker 进程互不抢占。"""
+    now = timezone.now()
+    with transaction.atomic():
+        job_ids = list(
+            model.objects.select_for_update(skip_locked=True)
+            .filter(status=model.STATUS_QUEUED)
+            .order_by("id")
+            .values_list("id", flat=True)[: max(int(limit), 1)]
+        )
+        if job_ids:
+            model.objects.filter(id__in=job_ids, status=model.STATUS_QUEUED).update(
+                status=model.STATUS_RUNNING,
+                locked_at=now,
+                locked_by=str(worker_name or "")[:100],
+                updated_at=now,
+            )
+    return job_ids
+
+
+def finish_job(job, *, success: bool, error_code: str = "", error_message: str = "") -> None:
+    job.status = job.STATUS_SUCCESS if success else job.STATUS_FAILED
+    job.finished_at = timezone.now()
+    job.error_code = "" if success else str(error_code or "")[:50]
+    job.error_message = "" if success else str(error_message or "")
+    job.save(update_fields=["status", "finished_at", "error_code", "error_message", "updated_at"])
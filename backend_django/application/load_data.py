@@ -0,0 +1,506 @@
+"""压测数据生成：按可配置分布批量写入地区/岗位/应聘记录/候选人/轮次快照/操作日志，同一种子结果可复现。"""
+from __future__ import annotations
+
+import random
+import struct
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .interview_flow import MAX_INTERVIEW_ROUND
+from .models import (
+    Application,
+    ApplicationAttachment,
+    InterviewCandidate,
+    InterviewRoundRecord,
+    Job,
+    OperationLog,
+    Region,
+    UserProfile,
+)
+from .operation_log_meta import OPERATION_ACTION_LABELS
+
+# 候选人状态组合：别名 -> (面试状态, 面试结果)。覆盖拟面试池、改期、待定与结果池的全部组合。
+CANDIDATE_STATES = {
+    "pending": (InterviewCandidate.STATUS_PENDING, ""),
+    "pending_next": (InterviewCandidate.STATUS_PENDING, InterviewCandidate.RESULT_NEXT_ROUND),
+    "pending_hold": (InterviewCandidate.STATUS_PENDING, InterviewCandidate.RESULT_PENDING),
+    "scheduled": (InterviewCandidate.STATUS_SCHEDULED, ""),
+    "scheduled_next": (InterviewCandidate.STATUS_SCHEDULED, InterviewCandidate.RESULT_NEXT_ROUND),
+    "passed": (InterviewCandidate.STATUS_COMPLETED, InterviewCandidate.RESULT_PASS),
+    "rejected": (InterviewCandidate.STATUS_COMPLETED, InterviewCandidate.RESULT_REJECT),
+}
+DEFAULT_CANDIDATE_WEIGHTS = {
+    "pending": 20,
+    "pending_next": 8,
+    "pending_hold": 4,
+    "scheduled": 12,
+    "scheduled_next": 6,
+    "passed": 25,
+    "rejected": 25,
+}
+DEFAULT_OFFER_WEIGHTS = {
+    InterviewCandidate.OFFER_STATUS_PENDING: 4,
+    InterviewCandidate.OFFER_STATUS_ISSUED: 3,
+    InterviewCandidate.OFFER_STATUS_CONFIRMED: 2,
+    InterviewCandidate.OFFER_STATUS_REJECTED: 1,
+}
+DEFAULT_OA_PUSH_WEIGHTS = {
+    InterviewCandidate.OA_PUSH_STATUS_IDLE: 2,
+    InterviewCandidate.OA_PUSH_STATUS_SUCCESS: 6,
+    InterviewCandidate.OA_PUSH_STATUS_FAILED: 2,
+}
+DEFAULT_SMS_WEIGHTS = {
+    InterviewCandidate.SMS_STATUS_IDLE: 1,
+    InterviewCandidate.SMS_STATUS_SUCCESS: 7,
+    InterviewCandidate.SMS_STATUS_FAILED: 2,
+}
+
+# 操作日志动作 -> 模块，与各视图写日志时的取值一致。
+_LOG_ACTION_MODULES = {
+    "ADD_TO_INTERVIEW_POOL": "applications",
+    "ADD_TO_TALENT_POOL": "applications",
+    "SCHEDULE_INTERVIEW": "interviews",
+    "RESCHEDULE_INTERVIEW": "interviews",
+    "CANCEL_INTERVIEW_SCHEDULE": "interviews",
+    "SAVE_INTERVIEW_RESULT": "interviews",
+    "RESEND_INTERVIEW_SMS": "interviews",
+    "INTERVIEW_SMS_SUCCESS": "interviews",
+    "INTERVIEW_SMS_FAILED": "interviews",
+    "REMOVE_FROM_INTERVIEW_POOL": "interviews",
+    "MOVE_TALENT_TO_INTERVIEW": "talent",
+    "CONFIRM_HIRE": "interviews",
+    "CONFIRM_ONBOARD": "interviews",
+    "OA_PUSH_SUCCESS": "interviews",
+    "OA_PUSH_FAILED": "interviews",
+    "UPDATE_OFFER_STATUS": "interviews",
+}
+
+_SURNAMES = "王李张刘陈杨黄赵吴周徐孙马朱胡郭何林罗高"
+_GIVEN_NAMES = "伟芳娜敏静丽强磊军洋勇艳杰娟涛明超秀霞平刚桂"
+_SCHOOLS = ("华东理工大学", "西南交通大学", "山东大学", "武汉理工大学", "郑州大学", "河北工业大学")
+_MAJORS = ("机械设计", "电气自动化", "会计学", "市场营销", "计算机科学", "人力资源管理")
+_DEGREES = ("大专", "本科", "硕士")
+_COMPANIES = ("华信制造", "恒通物流", "联创科技", "宏达建设", "中和贸易")
+_POSITIONS = ("操作工", "技术员", "文员", "销售", "工程师", "主管")
+_RELATIONS = ("父亲", "母亲", "配偶", "兄弟", "姐妹")
+_INTERVIEWERS = ("王经理", "李主管", "张工", "刘总监", "陈专员")
+_EXTRA_CATEGORIES = ("id_front", "id_back", "diploma", "resume", "other")
+
+
+def _weighted(weights: dict) -> tuple[list, list]:
+    keys = [key for key, weight in weights.items() if weight > 0]
+    return keys, [weights[key] for key in keys]
+
+
+def _placeholder_png(shade: int) -> bytes:
+    """生成 8x8 灰度 PNG，作为照片附件的占位文件。"""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    raw = b"".join(b"\x00" + bytes([shade % 256]) * 8 for _ in range(8))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", 8, 8, 8, 0, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _placeholder_pdf(index: int) -> bytes:
+    return f"%PDF-1.4\n% load-data placeholder {index}\n%%EOF\n".encode("ascii")
+
+
+@contextmanager
+def preserve_timestamps(*models):
+    """临时关闭 auto_now/auto_now_add，让 bulk_create 写入生成的历史时间而非当前时间。"""
+    saved = []
+    for model in models:
+        for model_field in model._meta.concrete_fields:
+            if getattr(model_field, "auto_now", False) or getattr(model_field, "auto_now_add", False):
+                saved.append((model_field, model_field.auto_now, model_field.auto_now_add))
+                model_field.auto_now = model_field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for model_field, auto_now, auto_now_add in saved:
+            model_field.auto_now, model_field.auto_now_add = auto_now, auto_now_add
+
+
+@dataclass
+class LoadDataConfig:
+    applications: int = 10_000
+    regions: int = 10
+    jobs_per_region: int = 8
+    interview_ratio: float = 0.6
+    candidate_weights: dict = field(default_factory=lambda: dict(DEFAULT_CANDIDATE_WEIGHTS))
+    offer_weights: dict = field(default_factory=lambda: dict(DEFAULT_OFFER_WEIGHTS))
+    photo_ratio: float = 0.9
+    extra_attachments: int = 2
+    media_files: int = 20
+    log_days: int = 180
+    logs_per_application: float = 3.0
+    batch_size: int = 2_000
+    seed: int = 1
+    prefix: str = "load"
+    anchor: datetime | None = None
+
+
+class LoadDataGenerator:
+    """
+    按批生成数据：每批先写应聘记录，再写其附件、候选人、轮次快照与操作日志，内存占用与总量无关。
+    - 随机数只来自 seed，锚定时间固定后同一配置多次生成内容一致（主键除外）；
+    - 附件只写 media_files 个占位文件到默认存储（MEDIA_ROOT），各记录循环引用，避免百万级小文件。
+    """
+
+    def __init__(self, config: LoadDataConfig, *, log: Callable[[str], None] | None = None):
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.anchor = config.anchor or timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.log = log or (lambda message: None)
+        self.counts = {
+            "regions": 0,
+            "jobs": 0,
+            "applications": 0,
+            "attachments": 0,
+            "candidates": 0,
+            "round_records": 0,
+            "operation_logs": 0,
+        }
+        self._candidate_keys, self._candidate_weights = _weighted(config.candidate_weights)
+        self._offer_keys, self._offer_weights = _weighted(config.offer_weights)
+        self._oa_keys, self._oa_weights = _weighted(DEFAULT_OA_PUSH_WEIGHTS)
+        self._sms_keys, self._sms_weights = _weighted(DEFAULT_SMS_WEIGHTS)
+        self._log_actions = [action for action in _LOG_ACTION_MODULES if action in OPERATION_ACTION_LABELS]
+        self._next_application_no = 0
+
+    @property
+    def tag(self) -> str:
+        return f"{self.config.prefix}-{self.config.seed}"
+
+    def run(self) -> dict:
+        started = time.perf_counter()
+        jobs, operators = self._create_catalog()
+        media = self._write_media_files()
+        remaining = self.config.applications
+        with preserve_timestamps(Application, ApplicationAttachment, InterviewCandidate, InterviewRoundRecord, OperationLog):
+            while remaining > 0:
+                size = min(self.config.batch_size, remaining)
+                with transaction.atomic():
+                    self._generate_batch(size, jobs, operators, media)
+                remaining -= size
+                self.log(
+                    f"已写入 {self.counts['applications']}/{self.config.applications} 条应聘记录，"
+                    f"耗时 {time.perf_counter() - started:.1f}s"
+                )
+        self.counts["seconds"] = round(time.perf_counter() - started, 2)
+        return self.counts
+
+    # ---- 基础数据 ----
+
+    def _create_catalog(self) -> tuple[list[Job], list]:
+        regions = []
+        for index in range(self.config.regions):
+            code = f"{self.tag}-{index}"
+            regions.append(Region.objects.create(name=f"压测地区{code}", code=code, order=index))
+        Job.objects.bulk_create(
+            [
+                Job(
+                    region=region,
+                    title=f"{self.random.choice(_POSITIONS)}{index + 1}",
+                    salary=f"{self.random.randint(4, 9)}000-{self.random.randint(10, 20)}000",
+                    education=self.random.choice(_DEGREES),
+                    is_active=self.random.random() > 0.1,
+                    order=index,
+                )
+                for region in regions
+                for index in range(self.config.jobs_per_region)
+            ]
+        )
+        jobs = list(Job.objects.filter(region__in=regions).order_by("id"))
+        user_model = get_user_model()
+        operators = []
+        for region in regions:
+            user = user_model.objects.create_user(username=f"{self.tag}-hr-{region.order}", password=None)
+            UserProfile.objects.create(user=user, region=region, can_view_all=False)
+            operators.append((user, region))
+        self.counts["regions"] = len(regions)
+        self.counts["jobs"] = len(jobs)
+        return jobs, operators
+
+    def _write_media_files(self) -> dict[str, list[str]]:
+        photos, documents = [], []
+        for index in range(max(self.config.media_files, 1)):
+            photos.append(
+                default_storage.save(f"attachments/{self.tag}/photo-{index}.png", ContentFile(_placeholder_png(index * 37)))
+            )
+            documents.append(
+                default_storage.save(f"attachments/{self.tag}/doc-{index}.pdf", ContentFile(_placeholder_pdf(index)))
+            )
+        return {"photo": photos, "document": documents}
+
+    # ---- 分批生成 ----
+
+    def _insert(self, model, objects: list, *, fields: tuple[str, ...]) -> list[dict]:
+        """批量插入并返回带主键的行；数据库不支持回填主键时（MySQL）按主键区间回查。"""
+        if not objects:
+            return []
+        if connection.features.can_return_rows_from_bulk_insert:
+            model.objects.bulk_create(objects, batch_size=self.config.batch_size)
+            return [{"id": obj.pk, **{name: getattr(obj, name) for name in fields}} for obj in objects]
+        floor = model.objects.order_by("-pk").values_list("pk", flat=True).first() or 0
+        model.objects.bulk_create(objects, batch_size=self.config.batch_size)
+        return list(model.objects.filter(pk__gt=floor).order_by("pk").values("id", *fields)[: len(objects)])
+
+    def _generate_batch(self, size: int, jobs: list[Job], operators: list, media: dict):
+        rng = self.random
+        span = timedelta(days=self.config.log_days)
+        applications = []
+        for _ in range(size):
+            number = self._next_application_no
+            self._next_application_no += 1
+            job = rng.choice(jobs)
+            applications.append(self._build_application(number, job, self.anchor - span * rng.random()))
+        rows = self._insert(Application, applications, fields=("region_id", "created_at"))
+        self.counts["applications"] += len(rows)
+
+        attachments = []
+        for row in rows:
+            if rng.random() < self.config.photo_ratio:
+                attachments.append(self._attachment(row, "photo", rng.choice(media["photo"])))
+            for _ in range(rng.randint(0, self.config.extra_attachments * 2)):
+                attachments.append(self._attachment(row, rng.choice(_EXTRA_CATEGORIES), rng.choice(media["document"])))
+        ApplicationAttachment.objects.bulk_create(attachments, batch_size=self.config.batch_size)
+        self.counts["attachments"] += len(attachments)
+
+        pooled = [row for row in rows if rng.random() < self.config.interview_ratio]
+        states = rng.choices(self._candidate_keys, weights=self._candidate_weights, k=len(pooled))
+        candidates = [self._build_candidate(row, state) for row, state in zip(pooled, states)]
+        candidate_rows = self._insert(
+            InterviewCandidate,
+            candidates,
+            fields=("application_id", "status", "result", "interview_round", "created_at", "result_at"),
+        )
+        self.counts["candidates"] += len(candidate_rows)
+
+        records = [record for row in candidate_rows for record in self._build_round_records(row)]
+        InterviewRoundRecord.objects.bulk_create(records, batch_size=self.config.batch_size)
+        self.counts["round_records"] += len(records)
+
+        candidate_by_application = {row["application_id"]: row["id"] for row in candidate_rows}
+        logs = self._build_logs(rows, candidate_by_application, operators)
+        OperationLog.objects.bulk_create(logs, batch_size=self.config.batch_size)
+        self.counts["operation_logs"] += len(logs)
+
+    def _build_application(self, number: int, job: Job, created_at: datetime) -> Application:
+        rng = self.random
+        age = rng.randint(19, 45)
+        birth_year = self.anchor.year - age
+        degree = rng.choice(_DEGREES)
+        graduate_year = birth_year + 22
+        return Application(
+            region_id=job.region_id,
+            job=job,
+            name=rng.choice(_SURNAMES) + "".join(rng.choices(_GIVEN_NAMES, k=rng.randint(1, 2))),
+            recruit_type=rng.choice(("社会招聘", "校园招聘")),
+            age=age,
+            gender=rng.choice(("男", "女")),
+            phone=f"1{rng.choice('3578')}{number:09d}",
+            email=f"{self.tag}.{number}@example.com",
+            expected_salary=f"{rng.randint(4, 15)}000",
+            recruitment_source=rng.choice(("网络招聘", "内部推荐", "现场招聘")),
+            marital_status=rng.choice(("未婚", "已婚")),
+            birth_month=datetime(birth_year, rng.randint(1, 12), 1).date(),
+            height_cm=rng.randint(150, 190),
+            weight_kg=rng.randint(45, 90),
+            health_status="良好",
+            graduate_school=rng.choice(_SCHOOLS),
+            graduation_date=datetime(graduate_year, 7, 1).date(),
+            major=rng.choice(_MAJORS),
+            education_level=degree,
+            political_status=rng.choice(("群众", "共青团员", "中共党员")),
+            ethnicity="汉族",
+            native_place=rng.choice(("山东济南", "河南郑州", "四川成都", "湖北武汉")),
+            current_address=f"{rng.choice(('幸福路', '建设路', '人民路'))}{rng.randint(1, 999)}号",
+            id_number=f"{rng.randint(110000, 659000)}{birth_year}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}{rng.randint(0, 9999):04d}",
+            emergency_name=rng.choice(_SURNAMES) + rng.choice(_GIVEN_NAMES),
+            emergency_phone=f"13{rng.randint(0, 999999999):09d}",
+            self_evaluation="工作认真负责，学习能力强，具备良好的团队合作意识。" * rng.randint(1, 3),
+            education_history=[
+                {
+                    "school": rng.choice(_SCHOOLS),
+                    "major": rng.choice(_MAJORS),
+                    "degree": degree,
+                    "start": f"{graduate_year - 4}-09",
+                    "end": f"{graduate_year}-07",
+                }
+                for _ in range(rng.randint(1, 2))
+            ],
+            work_history=[
+                {
+                    "company": rng.choice(_COMPANIES),
+                    "position": rng.choice(_POSITIONS),
+                    "start": f"{graduate_year + offset}-0{rng.randint(1, 9)}",
+                    "end": f"{graduate_year + offset + 1}-0{rng.randint(1, 9)}",
+                }
+                for offset in range(rng.randint(1, 3))
+            ],
+            family_members=[
+                {
+                    "name": rng.choice(_SURNAMES) + rng.choice(_GIVEN_NAMES),
+                    "relation": relation,
+                    "age": rng.randint(20, 75),
+                    "company": rng.choice(_COMPANIES),
+                    "position": rng.choice(_POSITIONS),
+                    "phone": f"13{rng.randint(0, 999999999):09d}",
+                }
+                for relation in rng.sample(_RELATIONS, rng.randint(2, 4))
+            ],
+            created_at=created_at,
+        )
+
+    def _attachment(self, row: dict, category: str, name: str) -> ApplicationAttachment:
+        return ApplicationAttachment(
+            application_id=row["id"],
+            category=category,
+            file=name,
+            created_at=row["created_at"] + timedelta(minutes=self.random.randint(0, 30)),
+        )
+
+    def _build_candidate(self, row: dict, state: str) -> InterviewCandidate:
+        rng = self.random
+        status, result = CANDIDATE_STATES[state]
+        created_at = row["created_at"] + timedelta(hours=rng.randint(1, 72))
+        interview_round = 1
+        if result in (InterviewCandidate.RESULT_PASS, InterviewCandidate.RESULT_REJECT, InterviewCandidate.RESULT_PENDING):
+            interview_round = rng.randint(1, MAX_INTERVIEW_ROUND)
+        elif state == "pending_next":
+            interview_round = rng.randint(1, MAX_INTERVIEW_ROUND - 1)
+        elif state == "scheduled_next":
+            interview_round = rng.randint(2, MAX_INTERVIEW_ROUND)
+        recorded = result != "" and status != InterviewCandidate.STATUS_SCHEDULED
+        result_at = created_at + timedelta(days=interview_round * rng.randint(1, 5)) if recorded else None
+        candidate = InterviewCandidate(
+            application_id=row["id"],
+            status=status,
+            result=result,
+            interview_round=interview_round,
+            result_at=result_at,
+            created_at=created_at,
+            updated_at=result_at or created_at,
+        )
+        if status == InterviewCandidate.STATUS_SCHEDULED:
+            interviewers = rng.sample(_INTERVIEWERS, rng.randint(1, 2))
+            candidate.interview_at = self.anchor + timedelta(days=rng.randint(-3, 14), hours=rng.randint(9, 17))
+            candidate.interviewers = interviewers
+            candidate.interviewer = "、".join(interviewers)
+            candidate.interview_location = f"{rng.randint(1, 5)}号会议室"
+            candidate.sms_status = rng.choices(self._sms_keys, weights=self._sms_weights)[0]
+            if candidate.sms_status != InterviewCandidate.SMS_STATUS_IDLE:
+                candidate.sms_updated_at = created_at + timedelta(hours=1)
+            if candidate.sms_status == InterviewCandidate.SMS_STATUS_SUCCESS:
+                candidate.sms_sent_at = candidate.sms_updated_at
+            elif candidate.sms_status == InterviewCandidate.SMS_STATUS_FAILED:
+                candidate.sms_error = "短信供应商返回失败"
+                candidate.sms_provider_code = "isv.BUSINESS_LIMIT_CONTROL"
+        if result == InterviewCandidate.RESULT_PASS:
+            candidate.offer_status = rng.choices(self._offer_keys, weights=self._offer_weights)[0]
+            if candidate.offer_status == InterviewCandidate.OFFER_STATUS_CONFIRMED:
+                candidate.is_hired = True
+                candidate.hired_at = result_at + timedelta(days=rng.randint(1, 14))
+                candidate.oa_push_status = rng.choices(self._oa_keys, weights=self._oa_weights)[0]
+                if candidate.oa_push_status != InterviewCandidate.OA_PUSH_STATUS_IDLE:
+                    candidate.oa_push_last_attempt_at = candidate.hired_at
+                if candidate.oa_push_status == InterviewCandidate.OA_PUSH_STATUS_SUCCESS:
+                    candidate.oa_push_success_at = candidate.hired_at
+                    candidate.oa_push_request_id = str(rng.randint(100000, 999999))
+                elif candidate.oa_push_status == InterviewCandidate.OA_PUSH_STATUS_FAILED:
+                    candidate.oa_push_error_code = "OA_HTTP_ERROR"
+                    candidate.oa_push_error_message = "OA 接口返回 502"
+        return candidate
+
+    def _build_round_records(self, row: dict) -> list[InterviewRoundRecord]:
+        """已记录结果的轮次：之前各轮为“进入下一轮”，最后一轮为当前结果；已安排的本轮尚未出结果。"""
+        rng = self.random
+        last_recorded = row["interview_round"]
+        if row["status"] == InterviewCandidate.STATUS_SCHEDULED or not row["result"]:
+            last_recorded -= 1
+        records = []
+        for round_no in range(1, last_recorded + 1):
+            result = row["result"] if round_no == last_recorded and row["result"] else InterviewCandidate.RESULT_NEXT_ROUND
+            interviewers = rng.sample(_INTERVIEWERS, rng.randint(1, 3))
+            decision = result if result != InterviewCandidate.RESULT_NEXT_ROUND else InterviewCandidate.RESULT_PASS
+            records.append(
+                InterviewRoundRecord(
+                    candidate_id=row["id"],
+                    round_no=round_no,
+                    interview_at=row["created_at"] + timedelta(days=round_no * 2),
+                    interviewer="、".join(interviewers),
+                    interviewers=interviewers,
+                    interviewer_scores=[{"interviewer": name, "decision": decision} for name in interviewers],
+                    result=result,
+                    result_note=rng.choice(("", "沟通表达清晰", "专业基础扎实", "岗位匹配度一般")),
+                    created_at=row["created_at"] + timedelta(days=round_no * 2, hours=2),
+                )
+            )
+        return records
+
+    def _build_logs(self, rows: list[dict], candidate_by_application: dict, operators: list) -> list[OperationLog]:
+        rng = self.random
+        expected = self.config.logs_per_application
+        logs = []
+        for row in rows:
+            count = int(expected) + (1 if rng.random() < expected - int(expected) else 0)
+            candidate_id = candidate_by_application.get(row["id"])
+            for _ in range(count):
+                operator, region = rng.choice(operators)
+                action = rng.choice(self._log_actions)
+                failed = rng.random() < 0.05
+                logs.append(
+                    OperationLog(
+                        operator=operator,
+                        operator_username=operator.username,
+                        operator_role="地区管理员",
+                        operator_region_name=region.name,
+                        region_id=row["region_id"],
+                        module=_LOG_ACTION_MODULES[action],
+                        action=action,
+                        target_type="application",
+                        target_id=row["id"],
+                        target_label=f"应聘记录#{row['id']}",
+                        application_id=row["id"],
+                        interview_candidate_id=candidate_id,
+                        result=OperationLog.RESULT_FAILED if failed else OperationLog.RESULT_SUCCESS,
+                        summary=OPERATION_ACTION_LABELS[action],
+                        details={"source": "load_data", "reason": "模拟失败"} if failed else {"source": "load_data"},
+                        request_id=f"{rng.getrandbits(64):016x}",
+                        created_at=self.anchor - timedelta(days=self.config.log_days) * rng.random(),
+                    )
+                )
+        return logs
+
+
+def parse_weights(raw: str, allowed: dict) -> dict:
+    """解析 "a=1,b=2" 形式的分布配置；未列出的键权重为 0。"""
+    weights = {}
+    for item in str(raw or "").split(","):
+        if not item.strip():
+            continue
+        key, sep, value = item.partition("=")
+        key = key.strip()
+        if not sep or key not in allowed:
+            raise ValueError(f"未知的分布项：{item.strip()}（可用：{', '.join(allowed)}）")
+        weights[key] = max(float(value), 0.0)
+    if not any(weights.values()):
+        raise ValueError("分布权重需至少有一项大于 0")
+    return weights
@@ -0,0 +1,291 @@
+"""接口基准：按规模用压测数据生成器生成合成数据，用测试客户端逐个请求 application 路由，输出延迟/SQL 次数/SQL 耗时 JSON。"""
+import json
+import math
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from application import urls as application_urls
+from application.catalog_cache import bump_catalog_version
+from application.load_data import LoadDataConfig, LoadDataGenerator
+from application.models import (
+    Application,
+    BatchOperationJob,
+    Job,
+    OperationLog,
+    Region,
+    RegionField,
+    UserProfile,
+)
+from application.search_index import rebuild_search_index
+
+SCALE_ALIASES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+# 只读基准中不请求的 GET 路由：会触发外部跳转或依赖外部系统。
+EXCLUDED_ROUTES = {
+    "auth-oa-entry": "依赖 OA 单点登录外部跳转",
+}
+
+_BATCH_SIZE = 1000
+
+
+class _Rollback(Exception):
+    pass
+
+
+def parse_scale(raw: str) -> int:
+    value = str(raw or "").strip().lower()
+    if value in SCALE_ALIASES:
+        return SCALE_ALIASES[value]
+    try:
+        count = int(value)
+    except ValueError as err:
+        raise CommandError(f"无法识别的规模：{raw}（可用 1k/10k/100k 或正整数）") from err
+    if count <= 0:
+        raise CommandError("--scale 需为正整数")
+    return count
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    """最近秩百分位；样本为空时返回 0。"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(max(math.ceil(ratio * len(ordered)) - 1, 0), len(ordered) - 1)
+    return ordered[index]
+
+
+def compare_with_baseline(
+    current: dict,
+    baseline: dict,
+    *,
+    latency_tolerance_percent: float,
+    min_latency_delta_ms: float,
+    query_tolerance: int,
+) -> list[dict]:
+    """对比同名路由：SQL 次数增长超过容差、或 p95 延迟超出比例且绝对差值超过下限即视为回归。"""
+    regressions = []
+    baseline_endpoints = baseline.get("endpoints") or {}
+    for name, result in (current.get("endpoints") or {}).items():
+        previous = baseline_endpoints.get(name)
+        if not previous:
+            continue
+        if result["queries"] > previous["queries"] + query_tolerance:
+            regressions.append(
+                {"endpoint": name, "metric": "queries", "baseline": previous["queries"], "current": result["queries"]}
+            )
+        limit = previous["p95_ms"] * (1 + latency_tolerance_percent / 100)
+        if result["p95_ms"] > limit and result["p95_ms"] - previous["p95_ms"] > min_latency_delta_ms:
+            regressions.append(
+                {"endpoint": name, "metric": "p95_ms", "baseline": previous["p95_ms"], "current": result["p95_ms"]}
+            )
+    return regressions
+
+
+class Command(BaseCommand):
+    help = "基准测试 application 全部只读路由（p50/p95 延迟、SQL 次数、SQL 耗时），数据在事务内生成并回滚"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", default="1k", help="应聘记录规模：1k/10k/100k 或正整数（默认 1k）")
+        parser.add_argument("--iterations", type=int, default=20, help="每个路由的采样次数（默认 20）")
+        parser.add_argument("--output", default="", help="结果 JSON 写入路径（默认输出到标准输出）")
+        parser.add_argument("--baseline", default="", help="基线 JSON 路径；指定后对比并在回归时以非零状态退出")
+        parser.add_argument(
+            "--latency-tolerance",
+            type=float,
+            default=20.0,
+            help="p95 延迟允许增长的百分比（默认 20）",
+        )
+        parser.add_argument(
+            "--min-latency-delta-ms",
+            type=float,
+            default=5.0,
+            help="p95 增长绝对值低于该毫秒数时忽略，避免小接口抖动误报（默认 5）",
+        )
+        parser.add_argument("--query-tolerance", type=int, default=0, help="SQL 次数允许增加的条数（默认 0）")
+        parser.add_argument("--seed", type=int, default=20240101, help="随机种子（默认 20240101）")
+
+    def handle(self, *args, **options):
+        scale = parse_scale(options["scale"])
+        iterations = max(int(options["iterations"]), 1)
+        baseline = self._load_baseline(options["baseline"])
+
+        # 生成器写出的占位附件放进临时目录，随基准结束删除。
+        try:
+            with tempfile.TemporaryDirectory() as media_root, transaction.atomic(), override_settings(
+                ALLOWED_HOSTS=["*"], MEDIA_ROOT=media_root
+            ):
+                samples = self._seed(scale, int(options["seed"]))
+                report = {
+                    "scale": scale,
+                    "iterations": iterations,
+                    "database": connection.vendor,
+                    "endpoints": {},
+                    "skipped": {},
+                }
+                self._run_routes(report, samples, iterations)
+                raise _Rollback
+        except _Rollback:
+            pass
+        finally:
+            # 基准期间按合成数据缓存的公开目录随回滚作废。
+            bump_catalog_version()
+
+        body = json.dumps(report, ensure_ascii=False, indent=2)
+        if options["output"]:
+            Path(options["output"]).write_text(body + "\n", encoding="utf-8")
+            self.stderr.write(f"结果已写入 {options['output']}")
+        else:
+            self.stdout.write(body)
+
+        if baseline is None:
+            return
+        regressions = compare_with_baseline(
+            report,
+            baseline,
+            latency_tolerance_percent=float(options["latency_tolerance"]),
+            min_latency_delta_ms=float(options["min_latency_delta_ms"]),
+            query_tolerance=max(int(options["query_tolerance"]), 0),
+        )
+        if regressions:
+            for item in regressions:
+                self.stderr.write(
+                    f"回归：{item['endpoint']} {item['metric']} {item['baseline']} -> {item['current']}"
+                )
+            raise CommandError(f"与基线相比共 {len(regressions)} 项回归")
+        self.stderr.write("与基线相比无回归")
+
+    @staticmethod
+    def _load_baseline(path: str):
+        if not path:
+            return None
+        try:
+            return json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as err:
+            raise CommandError(f"无法读取基线文件：{path}") from err
+
+    def _run_routes(self, report: dict, samples: dict, iterations: int):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Token {samples['token']}")
+        for pattern in application_urls.urlpatterns:
+            name = pattern.name
+            view_class = getattr(pattern.callback, "view_class", None)
+            if name in EXCLUDED_ROUTES:
+                report["skipped"][name] = EXCLUDED_ROUTES[name]
+                continue
+            if view_class is None or not hasattr(view_class, "get"):
+                report["skipped"][name] = "无 GET 方法（写操作不纳入只读基准）"
+                continue
+            kwargs = {}
+            if "pk" in pattern.pattern.converters:
+                if name not in samples["pks"]:
+                    report["skipped"][name] = "缺少样本主键"
+                    continue
+                kwargs["pk"] = samples["pks"][name]
+            url = reverse(name, kwargs=kwargs)
+            if name in samples["params"]:
+                url = f"{url}?{urlencode(samples['params'][name])}"
+            report["endpoints"][name] = self._measure(client, url, iterations)
+
+    @staticmethod
+    def _measure(client, url: str, iterations: int) -> dict:
+        client.get(url)  # 预热：填充缓存与连接，避免首请求拉高 p95。
+        latencies, sql_times, query_counts, status_codes = [], [], [], set()
+        for _ in range(iterations):
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = client.get(url)
+                if getattr(response, "streaming", False):
+                    b"".join(response.streaming_content)
+                latencies.append((time.perf_counter() - started) * 1000)
+            query_counts.append(len(captured.captured_queries))
+            sql_times.append(sum(float(query.get("time") or 0) for query in captured.captured_queries) * 1000)
+            status_codes.add(response.status_code)
+        return {
+            "url": url,
+            "status": sorted(status_codes),
+            "p50_ms": round(percentile(latencies, 0.5), 2),
+            "p95_ms": round(percentile(latencies, 0.95), 2),
+            "queries": max(query_counts),
+            "sql_p50_ms": round(percentile(sql_times, 0.5), 2),
+            "sql_p95_ms": round(percentile(sql_times, 0.95), 2),
+        }
+
+    def _seed(self, scale: int, seed: int) -> dict:
+        # 合成数据与 seed_load_data 共用同一生成器，分布与字段随生成器演进，不另行维护。
+        started = time.perf_counter()
+        stamp = int(time.time())
+        generator = LoadDataGenerator(
+            LoadDataConfig(
+                applications=scale,
+                regions=max(min(scale // 2000, 20), 2),
+                jobs_per_region=5,
+                interview_ratio=0.7,
+                media_files=1,
+                logs_per_application=1.0,
+                batch_size=_BATCH_SIZE,
+                seed=seed,
+                prefix=f"bench{stamp}",
+            )
+        )
+        counts = generator.run()
+        regions = list(Region.objects.filter(code__startswith=f"{generator.tag}-").order_by("order", "id"))
+        region_field = RegionField.objects.create(region=regions[0], key="bench_field", label="基准字段")
+        job = Job.objects.filter(region__in=regions).order_by("id").first()
+        applications = Application.objects.filter(region__in=regions).order_by("id")
+        # 批量写入不触发模型信号，与 seed_load_data 一样为合成数据建立检索索引，检索接口才有命中。
+        rebuild_search_index(applications, batch_size=_BATCH_SIZE)
+
+        user = get_user_model().objects.create_superuser(username=f"bench_admin_{stamp}", password=None)
+        UserProfile.objects.create(user=user, region=regions[0], can_view_all=True)
+        token = Token.objects.create(user=user)
+        # 已完成的批量任务，覆盖进度轮询接口（含逐条结果）。
+        batch_item_ids = list(applications.values_list("id", flat=True)[:_BATCH_SIZE])
+        batch_job = BatchOperationJob.objects.create(
+            action=BatchOperationJob.ACTION_INTERVIEW_POOL_ADD,
+            status=BatchOperationJob.STATUS_SUCCESS,
+            item_ids=batch_item_ids,
+            total=len(batch_item_ids),
+            processed=len(batch_item_ids),
+            outcome_counts={"existing": len(batch_item_ids)},
+            outcomes={str(item_id): "existing" for item_id in batch_item_ids},
+            requested_by=user,
+        )
+
+        # 详情接口取带候选人的应聘记录，覆盖轮次快照预取路径。
+        detail_application_id = (
+            applications.filter(interview_candidate__isnull=False).values_list("id", flat=True).first()
+            or applications.values_list("id", flat=True).first()
+        )
+        pks = {
+            "job-detail": job.id,
+            "application-attachments": applications.values_list("id", flat=True).first(),
+            "admin-region-detail": regions[0].id,
+            "admin-region-field-detail": region_field.id,
+            "admin-job-detail": job.id,
+            "admin-application-detail": detail_application_id,
+            "admin-operation-log-detail": OperationLog.objects.filter(region__in=regions)
+            .values_list("id", flat=True)
+            .first(),
+            "admin-batch-job-detail": batch_job.id,
+        }
+        # 必填查询参数：检索接口取详情样本的姓名作检索词。
+        params = {
+            "admin-applications-search": {
+                "q": applications.filter(id=detail_application_id).values_list("name", flat=True).first(),
+            },
+        }
+        self.stderr.write(
+            f"已生成 {counts['applications']} 条应聘记录、{counts['candidates']} 名候选人，"
+            f"耗时 {time.perf_counter() - started:.1f}s（结束后回滚）"
+        )
+        return {"token": token.key, "pks": pks, "params": params}
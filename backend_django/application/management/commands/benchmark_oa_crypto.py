@@ -0,0 +1,74 @@
+"""OA 加密头基准：对比每次解析公钥+RSA 加密与缓存复用两种方式构建推送请求头的 CPU 耗时。"""
+import base64
+import time
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from application.oa_push import _build_push_headers, _encrypt_header_value, clear_oa_crypto_cache
+
+
+def _generate_spk(key_size: int) -> str:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    der = private_key.public_key().public_bytes(
+        serialization.Encoding.DER,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return base64.b64encode(der).decode("ascii")
+
+
+class Command(BaseCommand):
+    help = "基准测试 OA 推送请求头构建耗时（公钥解析 + RSA 加密 userid，冷路径 vs 缓存路径）"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=200,
+            help="每种路径的迭代次数（默认 200）",
+        )
+        parser.add_argument(
+            "--key-size",
+            type=int,
+            default=2048,
+            help="临时生成的 RSA 公钥位数（默认 2048，不读取线上 OA_PUSH_SPK）",
+        )
+
+    def handle(self, *args, **options):
+        iterations = max(int(options["iterations"]), 1)
+        spk = _generate_spk(max(int(options["key_size"]), 1024))
+        user_id = "1001"
+
+        def build_headers():
+            return _build_push_headers(token="bench-token", encrypted_userid=_encrypt_header_value(spk, user_id))
+
+        clear_oa_crypto_cache()
+        with override_settings(OA_PUSH_ENCRYPTED_HEADER_CACHE_SECONDS=0):
+            cold_seconds = self._measure(build_headers, iterations, before_each=clear_oa_crypto_cache)
+
+        clear_oa_crypto_cache()
+        with override_settings(OA_PUSH_ENCRYPTED_HEADER_CACHE_SECONDS=600):
+            build_headers()
+            cached_seconds = self._measure(build_headers, iterations)
+        clear_oa_crypto_cache()
+
+        cold_us = cold_seconds / iterations * 1_000_000
+        cached_us = cached_seconds / iterations * 1_000_000
+        self.stdout.write(f"迭代次数：{iterations}")
+        self.stdout.write(f"冷路径（每次解析公钥 + 加密）：{cold_us:.1f} µs/请求 CPU")
+        self.stdout.write(f"缓存路径（复用公钥与密文）：{cached_us:.1f} µs/请求 CPU")
+        self.stdout.write(self.style.SUCCESS(f"每请求节省 CPU：{cold_us - cached_us:.1f} µs"))
+
+    @staticmethod
+    def _measure(func, iterations: int, before_each=None) -> float:
+        total = 0.0
+        for _ in range(iterations):
+            if before_each is not None:
+                before_each()
+            started = time.process_time()
+            func()
+            total += time.process_time() - started
+        return total
@@ -0,0 +1,131 @@
+"""结果池序列化基准：对比 DRF 序列化器与 values() 快速路径在不同候选人规模下的耗时。"""
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from application.models import Application, InterviewCandidate, InterviewRoundRecord, Job, Region
+from application.serializers import InterviewOutcomeFastSerializer, InterviewPassedCandidateListSerializer
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "基准测试通过/人才库列表序列化耗时（DRF 序列化器 vs values() 快速路径），数据在事务内生成并回滚"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="1000,10000,50000",
+            help="候选人规模，逗号分隔（默认 1000,10000,50000）",
+        )
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=2,
+            help="每个候选人的轮次快照数（0-3，默认 2）",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            sizes = sorted({int(item) for item in str(options["sizes"]).split(",") if item.strip()})
+        except ValueError as err:
+            raise CommandError("--sizes 需为逗号分隔的整数") from err
+        if not sizes or sizes[0] <= 0:
+            raise CommandError("--sizes 需为正整数")
+        rounds = min(max(int(options["rounds"]), 0), 3)
+
+        try:
+            with transaction.atomic():
+                self._seed(sizes[-1], rounds)
+                base = InterviewCandidate.objects.filter(
+                    status=InterviewCandidate.STATUS_COMPLETED,
+                    result=InterviewCandidate.RESULT_PASS,
+                    application__name__startswith="基准候选人",
+                ).order_by("-result_at", "-updated_at", "-id")
+                # SQLite 不存在 MySQL 客户端整表缓冲问题，流式内存表现需在 MySQL 上测量。
+                self.stdout.write(f"数据库：{connection.vendor}，轮次快照：每人 {rounds} 条")
+                for size in sizes:
+                    self._run(base, size)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _run(self, base, size: int):
+        drf_queryset = base.select_related("application", "application__region", "application__job").prefetch_related(
+            Prefetch("round_records", queryset=InterviewRoundRecord.objects.order_by("round_no", "id"))
+        )[:size]
+        renderer = JSONRenderer()
+
+        started = time.perf_counter()
+        drf_body = renderer.render(InterviewPassedCandidateListSerializer(drf_queryset, many=True).data)
+        drf_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        fast_body = renderer.render(InterviewOutcomeFastSerializer().serialize(base[:size]))
+        fast_seconds = time.perf_counter() - started
+
+        if fast_body != drf_body:
+            raise CommandError(f"{size} 条规模下快速路径输出与 DRF 序列化器不一致")
+        self.stdout.write(
+            f"{size:>6} 条：DRF {drf_seconds * 1000:.0f} ms，快速路径 {fast_seconds * 1000:.0f} ms，"
+            f"加速 {drf_seconds / max(fast_seconds, 1e-9):.1f}x，响应 {len(fast_body) / 1024:.0f} KB"
+        )
+
+    def _seed(self, count: int, rounds: int):
+        region = Region.objects.create(name="基准地区", code=f"bench-{int(time.time())}")
+        job = Job.objects.create(region=region, title="基准岗位")
+        Application.objects.bulk_create(
+            [
+                Application(
+                    region=region,
+                    job=job,
+                    name=f"基准候选人{index}",
+                    gender="男",
+                    phone=f"139{index:08d}",
+                    education_level="本科",
+                )
+                for index in range(count)
+            ],
+            batch_size=1000,
+        )
+        # MySQL 的 bulk_create 不回填主键，重新查询取得主键。
+        applications = list(Application.objects.filter(job=job).order_by("id"))
+        now = timezone.now()
+        InterviewCandidate.objects.bulk_create(
+            [
+                InterviewCandidate(
+                    application=application,
+                    status=InterviewCandidate.STATUS_COMPLETED,
+                    result=InterviewCandidate.RESULT_PASS,
+                    interview_round=max(rounds, 1),
+                    result_at=now - timedelta(minutes=index),
+                )
+                for index, application in enumerate(applications)
+            ],
+            batch_size=1000,
+        )
+        candidates = list(InterviewCandidate.objects.filter(application__job=job).only("id"))
+        InterviewRoundRecord.objects.bulk_create(
+            [
+                InterviewRoundRecord(
+                    candidate=candidate,
+                    round_no=round_no,
+                    interview_at=now - timedelta(days=round_no),
+                    interviewer=f"面试官{round_no}",
+                    score=80 + round_no,
+                    interviewer_scores=[{"interviewer": f"面试官{round_no}", "score": 80 + round_no}],
+                    result=InterviewCandidate.RESULT_NEXT_ROUND,
+                )
+                for candidate in candidates
+                for round_no in range(1, rounds + 1)
+            ],
+            batch_size=1000,
+        )
+        self.stdout.write(f"已生成 {count} 名基准候选人（事务结束后回滚）")
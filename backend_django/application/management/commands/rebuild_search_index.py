@@ -0,0 +1,32 @@
+"""重建应聘记录全文检索索引，用于首次上线、批量导入或调整分词规则之后。"""
+from django.core.management.base import BaseCommand
+
+from application.models import Application
+from application.search_index import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "按主键分批重建应聘记录检索倒排索引"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="单批处理的应聘记录数（默认 500）",
+        )
+        parser.add_argument(
+            "--region-id",
+            type=int,
+            default=None,
+            help="仅重建指定地区的应聘记录",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(int(options["batch_size"]), 1)
+        queryset = Application.objects.all()
+        if options["region_id"]:
+            queryset = queryset.filter(region_id=options["region_id"])
+        self.stdout.write(self.style.NOTICE(f"准备重建检索索引，共 {queryset.count()} 条应聘记录。"))
+        processed = rebuild_search_index(queryset, batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f"检索索引重建完成，处理 {processed} 条应聘记录。"))
@@ -0,0 +1,32 @@
+"""批量操作 worker：消费 BatchOperationJob 队列，按块分事务执行大批量操作并回写进度。"""
+from application.batch_jobs import (
+    batch_job_stale_seconds,
+    batch_job_worker_concurrency,
+    claim_batch_jobs,
+    requeue_stale_batch_jobs,
+    run_batch_job,
+)
+from application.management.queue_worker import QueueWorkerCommand
+
+
+class Command(QueueWorkerCommand):
+    help = "消费批量操作任务队列（BatchOperationJob），按块执行批量加入/移出拟面试与批量发放offer"
+
+    queue_label = "批量操作"
+    thread_name_prefix = "batch-job"
+    concurrency_setting_name = "BATCH_JOB_WORKER_CONCURRENCY"
+
+    def default_concurrency(self) -> int:
+        return batch_job_worker_concurrency()
+
+    def stale_seconds(self) -> int:
+        return batch_job_stale_seconds()
+
+    def requeue_stale(self, stale_seconds: int) -> int:
+        return requeue_stale_batch_jobs(stale_seconds=stale_seconds)
+
+    def claim(self, limit: int, worker_name: str) -> list[int]:
+        return claim_batch_jobs(limit=limit, worker_name=worker_name)
+
+    def get_run_job(self):
+        return run_batch_job
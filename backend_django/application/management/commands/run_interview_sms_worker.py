@@ -0,0 +1,34 @@
+"""面试短信 worker：消费 InterviewSmsJob 队列，按供应商限速发送并回写短信状态。"""
+from application.interview_sms_queue import (
+    claim_interview_sms_jobs,
+    interview_sms_job_stale_seconds,
+    interview_sms_worker_concurrency,
+    requeue_stale_interview_sms_jobs,
+    run_interview_sms_job,
+)
+from application.management.queue_worker import QueueWorkerCommand
+
+
+class Command(QueueWorkerCommand):
+    help = "消费面试短信任务队列（InterviewSmsJob），后台限速发送面试通知短信"
+
+    queue_label = "面试短信"
+    thread_name_prefix = "interview-sms"
+    concurrency_setting_name = "INTERVIEW_SMS_WORKER_CONCURRENCY"
+    # 供应商限速令牌桶在进程内共享，只提供线程池。
+    pool_choices = ("thread",)
+
+    def default_concurrency(self) -> int:
+        return interview_sms_worker_concurrency()
+
+    def stale_seconds(self) -> int:
+        return interview_sms_job_stale_seconds()
+
+    def requeue_stale(self, stale_seconds: int) -> int:
+        return requeue_stale_interview_sms_jobs(stale_seconds=stale_seconds)
+
+    def claim(self, limit: int, worker_name: str) -> list[int]:
+        return claim_interview_sms_jobs(limit=limit, worker_name=worker_name)
+
+    def get_run_job(self):
+        return run_interview_sms_job
@@ -0,0 +1,43 @@
+"""OA 推送 worker：消费 OAPushJob 队列，在线程/进程池中执行推送并回写状态。"""
+from application.management.queue_worker import QueueWorkerCommand
+from application.oa_client import oa_http_pool_stats
+from application.oa_push_queue import (
+    claim_oa_push_jobs,
+    oa_push_job_stale_seconds,
+    oa_push_worker_concurrency,
+    requeue_stale_oa_push_jobs,
+    run_oa_push_job,
+)
+
+
+class Command(QueueWorkerCommand):
+    help = "消费 OA 推送任务队列（OAPushJob），后台执行 OA 流程创建"
+
+    queue_label = "OA 推送"
+    thread_name_prefix = "oa-push"
+    concurrency_setting_name = "OA_PUSH_WORKER_CONCURRENCY"
+
+    def default_concurrency(self) -> int:
+        return oa_push_worker_concurrency()
+
+    def stale_seconds(self) -> int:
+        return oa_push_job_stale_seconds()
+
+    def requeue_stale(self, stale_seconds: int) -> int:
+        return requeue_stale_oa_push_jobs(stale_seconds=stale_seconds)
+
+    def claim(self, limit: int, worker_name: str) -> list[int]:
+        return claim_oa_push_jobs(limit=limit, worker_name=worker_name)
+
+    def get_run_job(self):
+        return run_oa_push_job
+
+    def exit_summary(self) -> str:
+        # process 池下请求发生在子进程，父进程统计为空。
+        stats = oa_http_pool_stats()
+        if not stats["requests"]:
+            return ""
+        return (
+            f"OA 连接池：请求 {stats['requests']} 次，新建连接 {stats['new_connections']} 个，"
+            f"复用 {stats['reused']} 次"
+        )
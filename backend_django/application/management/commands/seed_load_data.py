@@ -0,0 +1,101 @@
+"""生成压测数据：批量写入贴近生产形态的应聘/面试/日志数据，供基准与压测使用。"""
+from datetime import date, datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from application.catalog_cache import bump_catalog_version
+from application.load_data import (
+    CANDIDATE_STATES,
+    DEFAULT_CANDIDATE_WEIGHTS,
+    DEFAULT_OFFER_WEIGHTS,
+    LoadDataConfig,
+    LoadDataGenerator,
+    parse_weights,
+)
+from application.models import Application, Region
+from application.search_index import rebuild_search_index
+
+
+def _format_weights(weights: dict) -> str:
+    return ",".join(f"{key}={value}" for key, value in weights.items())
+
+
+class Command(BaseCommand):
+    help = "批量生成压测数据（应聘记录/附件/候选人/轮次快照/操作日志），同一 --seed 与 --anchor 结果可复现"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--applications", type=int, default=10_000, help="应聘记录条数（默认 10000）")
+        parser.add_argument("--regions", type=int, default=10, help="地区数（默认 10）")
+        parser.add_argument("--jobs-per-region", type=int, default=8, help="每个地区的岗位数（默认 8）")
+        parser.add_argument(
+            "--interview-ratio",
+            type=float,
+            default=0.6,
+            help="进入面试流程（生成候选人）的应聘记录占比（默认 0.6）",
+        )
+        parser.add_argument(
+            "--candidate-weights",
+            default=_format_weights(DEFAULT_CANDIDATE_WEIGHTS),
+            help=f"候选人状态组合分布，可用键：{', '.join(CANDIDATE_STATES)}",
+        )
+        parser.add_argument(
+            "--offer-weights",
+            default=_format_weights(DEFAULT_OFFER_WEIGHTS),
+            help="通过人员 Offer 状态分布",
+        )
+        parser.add_argument("--photo-ratio", type=float, default=0.9, help="带照片附件的占比（默认 0.9）")
+        parser.add_argument("--extra-attachments", type=int, default=2, help="每条记录其他附件的平均数（默认 2）")
+        parser.add_argument("--media-files", type=int, default=20, help="写入 MEDIA_ROOT 的占位文件数（默认 20）")
+        parser.add_argument("--log-days", type=int, default=180, help="数据时间跨度天数（默认 180）")
+        parser.add_argument(
+            "--logs-per-application",
+            type=float,
+            default=3.0,
+            help="每条应聘记录平均关联的操作日志数（默认 3）",
+        )
+        parser.add_argument("--batch-size", type=int, default=2000, help="每批写入的应聘记录数（默认 2000）")
+        parser.add_argument("--seed", type=int, default=1, help="随机种子（默认 1）")
+        parser.add_argument("--prefix", default="load", help="地区编码/账号前缀，用于区分多次生成（默认 load）")
+        parser.add_argument("--anchor", default="", help="时间锚点 YYYY-MM-DD，生成数据分布在锚点之前（默认今天）")
+
+    def handle(self, *args, **options):
+        try:
+            candidate_weights = parse_weights(options["candidate_weights"], CANDIDATE_STATES)
+            offer_weights = parse_weights(options["offer_weights"], DEFAULT_OFFER_WEIGHTS)
+        except ValueError as err:
+            raise CommandError(str(err)) from err
+        anchor = None
+        if options["anchor"]:
+            try:
+                anchor = timezone.make_aware(datetime.combine(date.fromisoformat(options["anchor"]), time.min))
+            except ValueError as err:
+                raise CommandError("--anchor 需为 YYYY-MM-DD") from err
+
+        config = LoadDataConfig(
+            applications=max(int(options["applications"]), 0),
+            regions=max(int(options["regions"]), 1),
+            jobs_per_region=max(int(options["jobs_per_region"]), 1),
+            interview_ratio=min(max(float(options["interview_ratio"]), 0.0), 1.0),
+            candidate_weights=candidate_weights,
+            offer_weights=offer_weights,
+            photo_ratio=min(max(float(options["photo_ratio"]), 0.0), 1.0),
+            extra_attachments=max(int(options["extra_attachments"]), 0),
+            media_files=max(int(options["media_files"]), 1),
+            log_days=max(int(options["log_days"]), 1),
+            logs_per_application=max(float(options["logs_per_application"]), 0.0),
+            batch_size=max(int(options["batch_size"]), 100),
+            seed=int(options["seed"]),
+            prefix=str(options["prefix"]).strip() or "load",
+            anchor=anchor,
+        )
+        generator = LoadDataGenerator(config, log=self.stdout.write)
+        if Region.objects.filter(code__startswith=f"{generator.tag}-").exists():
+            raise CommandError(f"已存在编码前缀为 {generator.tag}- 的地区，请更换 --prefix 或 --seed")
+
+        counts = generator.run()
+        # 批量写入不触发模型信号，手动让公开目录缓存失效并为新数据建立检索索引。
+        bump_catalog_version()
+        rebuild_search_index(Application.objects.filter(region__code__startswith=f"{generator.tag}-"))
+        summary = "，".join(f"{key}={value}" for key, value in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"压测数据生成完成：{summary}"))
@@ -0,0 +1,148 @@
+"""队列 worker 命令基类：轮询领取任务，在线程/进程池中并发执行，支持优雅退出。"""
+import abc
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+
+def run_job_in_pool(run_job, job_id: int) -> None:
+    """池内执行入口：每个任务结束后释放当前线程/进程的数据库连接。"""
+    close_old_connections()
+    try:
+        run_job(job_id)
+    finally:
+        connections.close_all()
+
+
+class QueueWorkerCommand(BaseCommand, metaclass=abc.ABCMeta):
+    """
+    子类需提供（抽象方法缺失时命令类无法实例化，加载命令即报错）:
+    - queue_label / thread_name_prefix / concurrency_setting_name
+    - default_concurrency() / stale_seconds()
+    - requeue_stale(stale_seconds) / claim(limit, worker_name) / get_run_job()
+    get_run_job 返回的执行函数需为模块级函数，process 池下才能被序列化。
+    """
+
+    queue_label = ""
+    thread_name_prefix = "queue-worker"
+    concurrency_setting_name = ""
+    pool_choices = ("thread", "process")
+
+    @abc.abstractmethod
+    def default_concurrency(self) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def stale_seconds(self) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def requeue_stale(self, stale_seconds: int) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def claim(self, limit: int, worker_name: str) -> list[int]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_run_job(self):
+        raise NotImplementedError
+
+    def exit_summary(self) -> str:
+        """退出时追加输出的统计信息，默认无。"""
+        return ""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=0,
+            help=f"并发执行数（默认读取 {self.concurrency_setting_name}）",
+        )
+        parser.add_argument(
+            "--pool",
+            choices=list(self.pool_choices),
+            default="thread",
+            help="执行池类型：thread（默认，适合 IO 等待）" + ("或 process" if "process" in self.pool_choices else ""),
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="队列为空时的轮询间隔秒数（默认 2）",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="清空当前队列后退出，适合 cron 或排障",
+        )
+
+    def handle(self, *args, **options):
+        concurrency = max(int(options["concurrency"] or 0), 0) or self.default_concurrency()
+        poll_interval = max(float(options["poll_interval"]), 0.1)
+        run_once = bool(options["once"])
+        worker_name = f"{socket.gethostname()}:{os.getpid()}"
+        run_job = self.get_run_job()
+
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        use_process_pool = options["pool"] == "process"
+        if use_process_pool:
+            # 子进程在首次提交时 fork，提交前关闭父进程连接，避免子进程复用同一 socket。
+            executor = ProcessPoolExecutor(
+                max_workers=concurrency,
+                mp_context=multiprocessing.get_context("fork"),
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=self.thread_name_prefix)
+
+        self.stdout.write(
+            self.style.NOTICE(
+                f"{self.queue_label} worker 启动：worker={worker_name} pool={options['pool']} concurrency={concurrency}"
+            )
+        )
+        processed = 0
+        try:
+            while not self._stopping:
+                close_old_connections()
+                requeued = self.requeue_stale(self.stale_seconds())
+                if requeued:
+                    self.stdout.write(self.style.WARNING(f"超时任务回队 {requeued} 条"))
+
+                job_ids = self.claim(concurrency, worker_name)
+                if not job_ids:
+                    if run_once:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                if use_process_pool:
+                    connections.close_all()
+                futures = [executor.submit(run_job_in_pool, run_job, job_id) for job_id in job_ids]
+                wait(futures)
+                for future in futures:
+                    error = future.exception()
+                    if error is not None:
+                        self.stderr.write(f"{self.queue_label}任务执行异常：{error}")
+                processed += len(job_ids)
+                self.stdout.write(f"已处理 {processed} 个任务")
+        finally:
+            executor.shutdown(wait=True)
+            connections.close_all()
+
+        self.stdout.write(self.style.SUCCESS(f"{self.queue_label} worker 退出，共处理 {processed} 个任务。"))
+        summary = self.exit_summary()
+        if summary:
+            self.stdout.write(summary)
+
+    def _request_stop(self, signum, frame):
+        # 收到停止信号后处理完当前批次再退出，避免任务停在执行中。
+        self._stopping = True
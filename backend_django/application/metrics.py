@@ -0,0 +1,304 @@
+"""进程内指标注册表：请求/OA 推送/短信/登录等热点路径的计数与耗时直方图，输出 Prometheus 文本格式。"""
+
+from __future__ import annotations
+
+import atexit
+import bisect
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# 耗时直方图桶（秒），覆盖接口响应与外部调用的常见区间。
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 多进程模式下每个进程最多每隔该秒数把快照落盘一次，抓取时其他进程的数据最多滞后这么久。
+FLUSH_INTERVAL_SECONDS = 1.0
+
+COUNTER = "counter"
+HISTOGRAM = "histogram"
+GAUGE = "gauge"
+
+METRIC_DEFINITIONS: dict[str, tuple[str, str]] = {
+    "hrm_http_request_duration_seconds": (HISTOGRAM, "HTTP 请求耗时（按路由/方法/状态码类别）"),
+    "hrm_oa_push_total": (COUNTER, "OA 推送次数（按结果与错误码）"),
+    "hrm_oa_push_duration_seconds": (HISTOGRAM, "OA 推送耗时（含自动重试）"),
+    "hrm_sms_dispatch_total": (COUNTER, "面试短信发送次数（按供应商与返回码）"),
+    "hrm_sms_dispatch_duration_seconds": (HISTOGRAM, "面试短信发送耗时"),
+    "hrm_login_failures_total": (COUNTER, "登录失败次数"),
+    "hrm_login_locks_total": (COUNTER, "登录失败触发账号锁定次数"),
+    "hrm_queue_depth": (GAUGE, "后台任务队列积压（按队列与状态，抓取时实时查询）"),
+}
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def metrics_enabled() -> bool:
+    return bool(getattr(settings, "METRICS_ENABLED", True))
+
+
+def metrics_multiproc_dir() -> str:
+    return str(getattr(settings, "METRICS_MULTIPROC_DIR", "") or "").strip()
+
+
+def metrics_snapshot_ttl_seconds() -> int:
+    return max(int(getattr(settings, "METRICS_SNAPSHOT_TTL_SECONDS", 86400) or 0), 0)
+
+
+def metrics_auth_token() -> str:
+    return str(getattr(settings, "METRICS_AUTH_TOKEN", "") or "").strip()
+
+
+def _label_key(labels: dict[str, Any] | None) -> LabelKey:
+    return tuple(sorted((str(key), str(value)) for key, value in (labels or {}).items()))
+
+
+class MetricsRegistry:
+    """
+    每个进程一份内存注册表：
+    - 记录只做加锁的内存累加；
+    - 配置 METRICS_MULTIPROC_DIR 时按节流间隔把本进程快照写成 <主机名>-<pid>.json，
+      抓取时合并目录下全部快照，gunicorn 多 worker 与独立 worker 容器（共享卷）的数据可正确汇总；
+    - fork 后检测到 pid 变化会清空继承的数据，避免父进程计数被重复累计；
+    - 抓取时清理已退出进程的快照：本机 pid 已不存在、或超过 METRICS_SNAPSHOT_TTL_SECONDS 未更新
+      （容器重建后主机名变化，旧主机的快照只能按时间淘汰）。清理后对应计数按 Prometheus 计数器重置处理。
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._reset(os.getpid())
+
+    def _reset(self, pid: int):
+        self._pid = pid
+        self._counters: dict[tuple[str, LabelKey], float] = {}
+        self._histograms: dict[tuple[str, LabelKey], list] = {}
+        self._version = 0
+        self._flushed_version = 0
+        self._flushed_at = 0.0
+
+    def _check_pid(self):
+        pid = os.getpid()
+        if pid != self._pid:
+            self._reset(pid)
+
+    def inc(self, name: str, labels: dict[str, Any] | None = None, value: float = 1.0):
+        if not metrics_enabled():
+            return
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._check_pid()
+            self._counters[key] = self._counters.get(key, 0.0) + value
+            self._version += 1
+        self._maybe_flush()
+
+    def observe(self, name: str, seconds: float, labels: dict[str, Any] | None = None):
+        if not metrics_enabled():
+            return
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._check_pid()
+            entry = self._histograms.get(key)
+            if entry is None:
+                # [各桶计数（非累计，末位为 +Inf）, 总和, 次数]
+                entry = self._histograms[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][bisect.bisect_left(self.buckets, seconds)] += 1
+            entry[1] += seconds
+            entry[2] += 1
+            self._version += 1
+        self._maybe_flush()
+
+    def snapshot(self) -> dict[str, list]:
+        return self._snapshot()[0]
+
+    def _snapshot(self) -> tuple[dict[str, list], int]:
+        with self._lock:
+            self._check_pid()
+            return {
+                "buckets": list(self.buckets),
+                "counters": [[name, list(labels), value] for (name, labels), value in self._counters.items()],
+                "histograms": [
+                    [name, list(labels), list(entry[0]), entry[1], entry[2]]
+                    for (name, labels), entry in self._histograms.items()
+                ],
+            }, self._version
+
+    def _snapshot_path(self, directory: str) -> Path:
+        return Path(directory) / f"{socket.gethostname()}-{self._pid}.json"
+
+    def _maybe_flush(self):
+        directory = metrics_multiproc_dir()
+        if not directory or time.monotonic() - self._flushed_at < FLUSH_INTERVAL_SECONDS:
+            return
+        self.flush()
+
+    def flush(self):
+        """把本进程快照原子写入多进程目录；未配置目录或无新数据时跳过。"""
+        directory = metrics_multiproc_dir()
+        if not directory or self._version == self._flushed_version:
+            return
+        snapshot, version = self._snapshot()
+        path = self._snapshot_path(directory)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            temp_path.write_text(json.dumps(snapshot, ensure_ascii=False), encoding="utf-8")
+            os.replace(temp_path, path)
+        except OSError:
+            logger.warning("metrics_flush_failed path=%s", path, exc_info=True)
+            return
+        with self._lock:
+            self._flushed_version = max(self._flushed_version, version)
+            self._flushed_at = time.monotonic()
+
+    @staticmethod
+    def _is_stale_snapshot(path: Path, *, hostname: str, ttl: int, now: float) -> bool:
+        host, _, raw_pid = path.stem.rpartition("-")
+        if host == hostname and raw_pid.isdigit():
+            try:
+                os.kill(int(raw_pid), 0)
+            except ProcessLookupError:
+                return True
+            except OSError:
+                pass
+        if not ttl:
+            return False
+        try:
+            return now - path.stat().st_mtime > ttl
+        except OSError:
+            return False
+
+    def collect(self) -> dict[str, list]:
+        """合并本进程与多进程目录下其他进程的快照，顺带删除已退出进程的快照。"""
+        own = self.snapshot()
+        directory = metrics_multiproc_dir()
+        snapshots = [own]
+        if directory:
+            self.flush()
+            own_path = self._snapshot_path(directory)
+            hostname = socket.gethostname()
+            ttl = metrics_snapshot_ttl_seconds()
+            now = time.time()
+            for path in sorted(Path(directory).glob("*.json")):
+                if path == own_path:
+                    continue
+                if self._is_stale_snapshot(path, hostname=hostname, ttl=ttl, now=now):
+                    path.unlink(missing_ok=True)
+                    continue
+                try:
+                    snapshots.append(json.loads(path.read_text(encoding="utf-8")))
+                except (OSError, ValueError):
+                    logger.warning("metrics_snapshot_unreadable path=%s", path)
+        return merge_snapshots(snapshots, buckets=self.buckets)
+
+    def clear(self):
+        with self._lock:
+            self._reset(os.getpid())
+
+
+def merge_snapshots(snapshots: list[dict], *, buckets: tuple[float, ...]) -> dict[str, list]:
+    counters: dict[tuple[str, LabelKey], float] = {}
+    histograms: dict[tuple[str, LabelKey], list] = {}
+    for snapshot in snapshots:
+        if list(snapshot.get("buckets") or buckets) != list(buckets):
+            # 桶定义不同（版本升级前的旧快照）无法合并，直接跳过。
+            continue
+        for name, labels, value in snapshot.get("counters") or []:
+            key = (name, tuple(tuple(item) for item in labels))
+            counters[key] = counters.get(key, 0.0) + float(value)
+        for name, labels, bucket_counts, total, count in snapshot.get("histograms") or []:
+            key = (name, tuple(tuple(item) for item in labels))
+            entry = histograms.setdefault(key, [[0] * (len(buckets) + 1), 0.0, 0])
+            entry[0] = [left + right for left, right in zip(entry[0], bucket_counts)]
+            entry[1] += float(total)
+            entry[2] += int(count)
+    return {
+        "counters": [[name, labels, value] for (name, labels), value in counters.items()],
+        "histograms": [[name, labels, *entry] for (name, labels), entry in histograms.items()],
+    }
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Iterable[tuple[str, str]]) -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in labels]
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_prometheus(collected: dict[str, list], *, buckets: tuple[float, ...], gauges: list | None = None) -> str:
+    """按 Prometheus 文本格式 0.0.4 输出；同名指标聚在一起并带 HELP/TYPE。"""
+    series: dict[str, list[str]] = {name: [] for name in METRIC_DEFINITIONS}
+    for name, labels, value in sorted(collected["counters"]):
+        series.setdefault(name, []).append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    for name, labels, bucket_counts, total, count in sorted(collected["histograms"], key=lambda item: item[:2]):
+        labels = list(labels)
+        cumulative = 0
+        lines = series.setdefault(name, [])
+        for bound, bucket_count in zip([*buckets, "+Inf"], bucket_counts):
+            cumulative += bucket_count
+            le = bound if isinstance(bound, str) else _format_value(bound)
+            lines.append(f"{name}_bucket{_format_labels([*labels, ('le', le)])} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {count}")
+    for name, labels, value in gauges or []:
+        series.setdefault(name, []).append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    output = []
+    for name, lines in series.items():
+        if not lines:
+            continue
+        kind, help_text = METRIC_DEFINITIONS.get(name, (COUNTER, name))
+        output.append(f"# HELP {name} {help_text}")
+        output.append(f"# TYPE {name} {kind}")
+        output.extend(lines)
+    return "\n".join(output) + "\n"
+
+
+def queue_depth_gauges() -> list:
+    """OA 推送/面试短信任务队列的排队与执行中数量，抓取时实时查询。"""
+    from django.db.models import Count
+
+    from .models import InterviewSmsJob, OAPushJob
+
+    gauges = []
+    for queue, model in (("oa_push", OAPushJob), ("interview_sms", InterviewSmsJob)):
+        counts = dict(
+            model.objects.filter(status__in=model.ACTIVE_STATUSES)
+            .values_list("status")
+            .annotate(total=Count("id"))
+            .order_by()
+        )
+        for job_status in model.ACTIVE_STATUSES:
+            gauges.append(
+                ["hrm_queue_depth", (("queue", queue), ("status", job_status)), counts.get(job_status, 0)]
+            )
+    return gauges
+
+
+registry = MetricsRegistry()
+atexit.register(registry.flush)
+
+
+def inc(name: str, labels: dict[str, Any] | None = None, value: float = 1.0):
+    registry.inc(name, labels, value)
+
+
+def observe(name: str, seconds: float, labels: dict[str, Any] | None = None):
+    registry.observe(name, seconds, labels)
+
+
+def render_metrics() -> str:
+    return render_prometheus(registry.collect(), buckets=registry.buckets, gauges=queue_depth_gauges())
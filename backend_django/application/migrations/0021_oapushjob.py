@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-18 20:53
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('application', '0020_alter_applicationattachment_category'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OAPushJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('queued', '排队中'), ('running', '执行中'), ('success', '推送成功'), ('failed', '推送失败')], default='queued', max_length=20, verbose_name='任务状态')),
+                ('is_retry', models.BooleanField(default=False, verbose_name='手动重发')),
+                ('request_id', models.CharField(blank=True, default='', max_length=64, verbose_name='请求链路ID')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='领取时间')),
+                ('locked_by', models.CharField(blank=True, default='', max_length=100, verbose_name='领取 worker')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='完成时间')),
+                ('error_code', models.CharField(blank=True, default='', max_length=50, verbose_name='错误码')),
+                ('error_message', models.TextField(blank=True, default='', verbose_name='失败原因')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='入队时间')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='更新时间')),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='oa_push_jobs', to='application.interviewcandidate', verbose_name='拟面试人员')),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='oa_push_jobs', to=settings.AUTH_USER_MODEL, verbose_name='发起人')),
+            ],
+            options={
+                'verbose_name': 'OA推送任务',
+                'verbose_name_plural': 'OA推送任务',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['status', 'id'], name='oapushjob_status'), models.Index(fields=['candidate', 'status'], name='oapushjob_cand_status')],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0022_interviewsmsjob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interviewcandidate',
+            index=models.Index(fields=['status', 'result', 'result_at', 'updated_at', 'id'], name='candidate_outcome'),
+        ),
+        migrations.AddIndex(
+            model_name='interviewcandidate',
+            index=models.Index(fields=['status', 'created_at'], name='candidate_status_created'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:42
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('application', '0023_interviewcandidate_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BatchOperationJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action', models.CharField(choices=[('interview_pool_add', '批量加入拟面试人员'), ('interview_pool_remove', '批量移出拟面试人员'), ('confirm_hire', '批量发放offer')], max_length=30, verbose_name='批量动作')),
+                ('status', models.CharField(choices=[('queued', '排队中'), ('running', '执行中'), ('success', '已完成'), ('failed', '执行失败')], default='queued', max_length=20, verbose_name='任务状态')),
+                ('item_ids', models.JSONField(blank=True, default=list, verbose_name='目标ID列表')),
+                ('region_scope', models.IntegerField(blank=True, null=True, verbose_name='地区范围')),
+                ('chunk_size', models.PositiveIntegerField(default=100, verbose_name='每块条数')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='总条数')),
+                ('processed', models.PositiveIntegerField(default=0, verbose_name='已处理条数')),
+                ('outcome_counts', models.JSONField(blank=True, default=dict, verbose_name='结果统计')),
+                ('outcomes', models.JSONField(blank=True, default=dict, verbose_name='逐条结果')),
+                ('request_id', models.CharField(blank=True, default='', max_length=64, verbose_name='请求链路ID')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='领取时间')),
+                ('locked_by', models.CharField(blank=True, default='', max_length=100, verbose_name='领取 worker')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='完成时间')),
+                ('error_code', models.CharField(blank=True, default='', max_length=50, verbose_name='错误码')),
+                ('error_message', models.TextField(blank=True, default='', verbose_name='失败原因')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='入队时间')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='更新时间')),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='batch_operation_jobs', to=settings.AUTH_USER_MODEL, verbose_name='发起人')),
+            ],
+            options={
+                'verbose_name': '批量操作任务',
+                'verbose_name_plural': '批量操作任务',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['status', 'id'], name='batchjob_status'), models.Index(fields=['requested_by', 'id'], name='batchjob_requester')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:55
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0024_batchoperationjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=8, verbose_name='索引词')),
+                ('weight', models.PositiveIntegerField(default=1, verbose_name='权重')),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='application.application')),
+            ],
+            options={
+                'verbose_name': '应聘记录检索索引',
+                'verbose_name_plural': '应聘记录检索索引',
+                'indexes': [models.Index(fields=['term', 'application'], name='app_search_term')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='applicationsearchterm',
+            constraint=models.UniqueConstraint(fields=('application', 'term'), name='uniq_app_search_term'),
+        ),
+    ]
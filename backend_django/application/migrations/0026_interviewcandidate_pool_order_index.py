@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 22:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0025_applicationsearchterm'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='interviewcandidate',
+            name='candidate_status_created',
+        ),
+        migrations.AddIndex(
+            model_name='interviewcandidate',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='candidate_pool_order'),
+        ),
+    ]
@@ -0,0 +1,90 @@
+import unicodedata
+
+from django.db import migrations, transaction
+
+BATCH_SIZE = 500
+
+# 以下为建表时分词规则的冻结副本：迁移写出的内容不随 search_index 后续调整而变化，
+# 分词规则变更后由 rebuild_search_index 重建。
+SEARCH_FIELDS = (
+    ("name", 10),
+    ("phone", 8),
+    ("graduate_school", 5),
+    ("major", 5),
+    ("work_history", 3),
+    ("self_evaluation", 1),
+)
+
+
+def _flatten(value):
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in _flatten(item)]
+    if isinstance(value, (list, tuple)):
+        return [text for item in value for text in _flatten(item)]
+    if value is None or isinstance(value, bool):
+        return []
+    text = str(value).strip()
+    return [text] if text else []
+
+
+def _fold(char):
+    decomposed = unicodedata.normalize("NFKD", char)
+    stripped = "".join(item for item in decomposed if not unicodedata.combining(item))
+    return unicodedata.normalize("NFKC", stripped).casefold()
+
+
+def _normalize(text):
+    return "".join(folded for char in str(text or "") for folded in _fold(char) if folded.isalnum())
+
+
+def _text_terms(normalized):
+    if not normalized:
+        return set()
+    terms = {normalized[index : index + 2] for index in range(len(normalized) - 1)}
+    terms.add(normalized[-1])
+    return terms
+
+
+def _build_terms(application):
+    weights = {}
+    for field, weight in SEARCH_FIELDS:
+        text = "；".join(_flatten(getattr(application, field, "")))
+        for term in _text_terms(_normalize(text)):
+            weights[term] = weights.get(term, 0) + weight
+    return weights
+
+
+def backfill_search_terms(apps, schema_editor):
+    # 索引表建表时为空，已有应聘记录按主键分批写入索引词。
+    Application = apps.get_model("application", "Application")
+    ApplicationSearchTerm = apps.get_model("application", "ApplicationSearchTerm")
+    fields = ["id", *(field for field, _ in SEARCH_FIELDS)]
+    last_id = 0
+    while True:
+        batch = list(Application.objects.filter(id__gt=last_id).order_by("id").only(*fields)[:BATCH_SIZE])
+        if not batch:
+            break
+        with transaction.atomic():
+            ApplicationSearchTerm.objects.filter(application_id__in=[item.pk for item in batch]).delete()
+            ApplicationSearchTerm.objects.bulk_create(
+                [
+                    ApplicationSearchTerm(application_id=item.pk, term=term, weight=weight)
+                    for item in batch
+                    for term, weight in _build_terms(item).items()
+                ],
+                batch_size=2000,
+            )
+        last_id = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+    # 每批一个事务，大表回填时不持有单个长事务。
+    atomic = False
+
+    dependencies = [
+        ("application", "0026_interviewcandidate_pool_order_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_terms, migrations.RunPython.noop),
+    ]
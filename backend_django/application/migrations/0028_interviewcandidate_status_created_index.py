@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-19 06:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0027_backfill_application_search_terms'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='interviewcandidate',
+            name='candidate_pool_order',
+        ),
+        migrations.AddIndex(
+            model_name='interviewcandidate',
+            index=models.Index(fields=['status', 'created_at'], name='candidate_status_created'),
+        ),
+    ]
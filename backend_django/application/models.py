@@ -174,6 +174,29 @@ class ApplicationAttachment(models.Model):
         return f"{self.application.pk}-{self.category}"
 
 
+class ApplicationSearchTerm(models.Model):
+    """应聘记录倒排索引：检索字段按二元分词展开，每条记录每个索引词一行，权重为命中字段权重之和。"""
+
+    application = models.ForeignKey(
+        Application, related_name="search_terms", on_delete=models.CASCADE
+    )
+    term = models.CharField("索引词", max_length=8)
+    weight = models.PositiveIntegerField("权重", default=1)
+
+    class Meta:
+        verbose_name = "应聘记录检索索引"
+        verbose_name_plural = "应聘记录检索索引"
+        constraints = [
+            models.UniqueConstraint(fields=["application", "term"], name="uniq_app_search_term"),
+        ]
+        indexes = [
+            models.Index(fields=["term", "application"], name="app_search_term"),
+        ]
+
+    def __str__(self):
+        return f"{self.application_id}-{self.term}"
+
+
 class InterviewCandidate(models.Model):
     """拟面试池记录：保存当前轮次、当前安排和当前结果。"""
 
@@ -186,6 +209,8 @@ class InterviewCandidate(models.Model):
         (STATUS_SCHEDULED, "已安排"),
         (STATUS_COMPLETED, "已完成"),
     ]
+    # 拟面试池（流程中）状态，按等值列表过滤以便命中 status 前缀索引。
+    IN_PROGRESS_STATUSES = (STATUS_PENDING, STATUS_SCHEDULED)
 
     RESULT_PENDING = "待定"
     RESULT_NEXT_ROUND = "进入下一轮"
@@ -293,6 +318,12 @@ class InterviewCandidate(models.Model):
         ordering = ["-created_at", "id"]
         verbose_name = "拟面试人员"
         verbose_name_plural = "拟面试人员"
+        indexes = [
+            # 结果池（通过/人才库）：status+result 等值过滤后按索引倒序直接取排序结果。
+            models.Index(fields=["status", "result", "result_at", "updated_at", "id"], name="candidate_outcome"),
+            # 拟面试池：按状态取流程中的候选人后按创建时间排序；流程中候选人占比小，排序开销有限。
+            models.Index(fields=["status", "created_at"], name="candidate_status_created"),
+        ]
 
     def __str__(self):
         return f"{self.application.name}-{self.application.job.title}"
@@ -337,6 +368,177 @@ class InterviewRoundRecord(models.Model):
         return f"{self.candidate.application.name}-第{self.round_no}轮"
 
 
+class OAPushJob(models.Model):
+    """OA 推送任务：接口入队后立即返回，由后台 worker 消费并回写候选人推送状态。"""
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCESS = "success"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "排队中"),
+        (STATUS_RUNNING, "执行中"),
+        (STATUS_SUCCESS, "推送成功"),
+        (STATUS_FAILED, "推送失败"),
+    ]
+    ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+    candidate = models.ForeignKey(
+        InterviewCandidate,
+        related_name="oa_push_jobs",
+        on_delete=models.CASCADE,
+        verbose_name="拟面试人员",
+    )
+    status = models.CharField("任务状态", max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    is_retry = models.BooleanField("手动重发", default=False)
+    requested_by = models.ForeignKey(
+        "auth.User",
+        related_name="oa_push_jobs",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="发起人",
+    )
+    request_id = models.CharField("请求链路ID", max_length=64, blank=True, default="")
+    locked_at = models.DateTimeField("领取时间", null=True, blank=True)
+    locked_by = models.CharField("领取 worker", max_length=100, blank=True, default="")
+    finished_at = models.DateTimeField("完成时间", null=True, blank=True)
+    error_code = models.CharField("错误码", max_length=50, blank=True, default="")
+    error_message = models.TextField("失败原因", blank=True, default="")
+    created_at = models.DateTimeField("入队时间", auto_now_add=True)
+    updated_at = models.DateTimeField("更新时间", auto_now=True)
+
+    class Meta:
+        ordering = ["id"]
+        verbose_name = "OA推送任务"
+        verbose_name_plural = "OA推送任务"
+        indexes = [
+            models.Index(fields=["status", "id"], name="oapushjob_status"),
+            models.Index(fields=["candidate", "status"], name="oapushjob_cand_status"),
+        ]
+
+    def __str__(self):
+        return f"OA推送任务#{self.pk}-{self.get_status_display()}"
+
+
+class InterviewSmsJob(models.Model):
+    """面试短信任务：安排/重发接口入队后立即返回，由后台 worker 限速发送并回写短信状态。"""
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCESS = "success"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "排队中"),
+        (STATUS_RUNNING, "发送中"),
+        (STATUS_SUCCESS, "发送成功"),
+        (STATUS_FAILED, "发送失败"),
+    ]
+    ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+    candidate = models.ForeignKey(
+        InterviewCandidate,
+        related_name="sms_jobs",
+        on_delete=models.CASCADE,
+        verbose_name="拟面试人员",
+    )
+    status = models.CharField("任务状态", max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    is_retry = models.BooleanField("手动重发", default=False)
+    provider = models.CharField("短信供应商", max_length=30, blank=True, default="")
+    requested_by = models.ForeignKey(
+        "auth.User",
+        related_name="interview_sms_jobs",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="发起人",
+    )
+    request_id = models.CharField("请求链路ID", max_length=64, blank=True, default="")
+    locked_at = models.DateTimeField("领取时间", null=True, blank=True)
+    locked_by = models.CharField("领取 worker", max_length=100, blank=True, default="")
+    finished_at = models.DateTimeField("完成时间", null=True, blank=True)
+    error_code = models.CharField("错误码", max_length=50, blank=True, default="")
+    error_message = models.TextField("失败原因", blank=True, default="")
+    created_at = models.DateTimeField("入队时间", auto_now_add=True)
+    updated_at = models.DateTimeField("更新时间", auto_now=True)
+
+    class Meta:
+        ordering = ["id"]
+        verbose_name = "面试短信任务"
+        verbose_name_plural = "面试短信任务"
+        indexes = [
+            models.Index(fields=["status", "id"], name="smsjob_status"),
+            models.Index(fields=["candidate", "status"], name="smsjob_cand_status"),
+        ]
+
+    def __str__(self):
+        return f"面试短信任务#{self.pk}-{self.get_status_display()}"
+
+
+class BatchOperationJob(models.Model):
+    """批量操作任务：大批量 ID 入队后按块分事务执行，逐块回写进度与逐条结果，供前端轮询。"""
+
+    ACTION_INTERVIEW_POOL_ADD = "interview_pool_add"
+    ACTION_INTERVIEW_POOL_REMOVE = "interview_pool_remove"
+    ACTION_CONFIRM_HIRE = "confirm_hire"
+    ACTION_CHOICES = [
+        (ACTION_INTERVIEW_POOL_ADD, "批量加入拟面试人员"),
+        (ACTION_INTERVIEW_POOL_REMOVE, "批量移出拟面试人员"),
+        (ACTION_CONFIRM_HIRE, "批量发放offer"),
+    ]
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCESS = "success"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "排队中"),
+        (STATUS_RUNNING, "执行中"),
+        (STATUS_SUCCESS, "已完成"),
+        (STATUS_FAILED, "执行失败"),
+    ]
+    ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+    action = models.CharField("批量动作", max_length=30, choices=ACTION_CHOICES)
+    status = models.CharField("任务状态", max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    item_ids = models.JSONField("目标ID列表", default=list, blank=True)
+    # 发起时的数据范围：空为全局账号，否则为所属地区ID（无 profile 为 -1），执行时按此过滤。
+    region_scope = models.IntegerField("地区范围", null=True, blank=True)
+    chunk_size = models.PositiveIntegerField("每块条数", default=100)
+    total = models.PositiveIntegerField("总条数", default=0)
+    processed = models.PositiveIntegerField("已处理条数", default=0)
+    outcome_counts = models.JSONField("结果统计", default=dict, blank=True)
+    outcomes = models.JSONField("逐条结果", default=dict, blank=True)
+    requested_by = models.ForeignKey(
+        "auth.User",
+        related_name="batch_operation_jobs",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="发起人",
+    )
+    request_id = models.CharField("请求链路ID", max_length=64, blank=True, default="")
+    locked_at = models.DateTimeField("领取时间", null=True, blank=True)
+    locked_by = models.CharField("领取 worker", max_length=100, blank=True, default="")
+    finished_at = models.DateTimeField("完成时间", null=True, blank=True)
+    error_code = models.CharField("错误码", max_length=50, blank=True, default="")
+    error_message = models.TextField("失败原因", blank=True, default="")
+    created_at = models.DateTimeField("入队时间", auto_now_add=True)
+    updated_at = models.DateTimeField("更新时间", auto_now=True)
+
+    class Meta:
+        ordering = ["id"]
+        verbose_name = "批量操作任务"
+        verbose_name_plural = "批量操作任务"
+        indexes = [
+            models.Index(fields=["status", "id"], name="batchjob_status"),
+            models.Index(fields=["requested_by", "id"], name="batchjob_requester"),
+        ]
+
+    def __str__(self):
+        return f"批量操作任务#{self.pk}-{self.get_action_display()}-{self.get_status_display()}"
+
+
 class UserProfile(models.Model):
     user = models.OneToOneField("auth.User", on_delete=models.CASCADE, related_name="profile")
     region = models.ForeignKey(Region, on_delete=models.PROTECT, verbose_name="地区")
@@ -0,0 +1,154 @@
+"""OA HTTP 客户端：进程内复用带连接池的 requests.Session，供推送/token/人员同步共用。"""
+from __future__ import annotations
+
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .circuit_breaker import CircuitOpenError, get_circuit_breaker
+
+_SESSION_LOCK = threading.Lock()
+_SESSION_STATE: dict[str, Any] = {"pid": None, "key": None, "session": None}
+
+
+def _pool_connections() -> int:
+    return max(int(getattr(settings, "OA_HTTP_POOL_CONNECTIONS", 4) or 4), 1)
+
+
+def _pool_maxsize() -> int:
+    return max(int(getattr(settings, "OA_HTTP_POOL_MAXSIZE", 10) or 10), 1)
+
+
+def _pool_block() -> bool:
+    return bool(getattr(settings, "OA_HTTP_POOL_BLOCK", False))
+
+
+def _connect_retries() -> int:
+    return max(int(getattr(settings, "OA_HTTP_CONNECT_RETRIES", 2) or 0), 0)
+
+
+def _retry_backoff_seconds() -> float:
+    return max(int(getattr(settings, "OA_HTTP_RETRY_BACKOFF_MS", 200) or 0), 0) / 1000
+
+
+def _session_config_key() -> tuple:
+    return (_pool_connections(), _pool_maxsize(), _pool_block(), _connect_retries(), _retry_backoff_seconds())
+
+
+def _build_session() -> requests.Session:
+    # OA 接口均为 POST 且创建流程不幂等：只重试建连失败（请求未发出），读超时与 5xx 不自动重放。
+    retry = Retry(
+        total=_connect_retries(),
+        connect=_connect_retries(),
+        read=0,
+        status=0,
+        redirect=0,
+        backoff_factor=_retry_backoff_seconds(),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_pool_connections(),
+        pool_maxsize=_pool_maxsize(),
+        pool_block=_pool_block(),
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # 保持与单次 requests.post 一致的无状态语义，不在调用间共享 OA 下发的 Cookie。
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def get_oa_session() -> requests.Session:
+    """返回当前进程共享的 OA Session；fork 后或连接池配置变化时重建。"""
+    pid = os.getpid()
+    key = _session_config_key()
+    session = _SESSION_STATE["session"]
+    if session is not None and _SESSION_STATE["pid"] == pid and _SESSION_STATE["key"] == key:
+        return session
+    with _SESSION_LOCK:
+        session = _SESSION_STATE["session"]
+        if session is not None and _SESSION_STATE["pid"] == pid and _SESSION_STATE["key"] == key:
+            return session
+        if session is not None and _SESSION_STATE["pid"] == pid:
+            session.close()
+        session = _build_session()
+        _SESSION_STATE.update({"pid": pid, "key": key, "session": session})
+    return session
+
+
+def reset_oa_session() -> None:
+    with _SESSION_LOCK:
+        session = _SESSION_STATE["session"]
+        if session is not None and _SESSION_STATE["pid"] == os.getpid():
+            session.close()
+        _SESSION_STATE.update({"pid": None, "key": None, "session": None})
+
+
+class OACircuitOpenError(CircuitOpenError, requests.ConnectionError):
+    """OA 端点熔断中；继承 ConnectionError，调用方按网络异常（OA_NETWORK_ERROR）处理。"""
+
+
+def oa_post(url: str, *, breaker: str, **kwargs) -> requests.Response:
+    """
+    通过共享连接池发起 OA POST 请求，其余参数与 requests.post 一致。
+    breaker 为熔断端点名：网络异常与 5xx 计为失败，熔断期间直接抛 OACircuitOpenError。
+    """
+    circuit = get_circuit_breaker(breaker)
+    if not circuit.allow_request():
+        raise OACircuitOpenError(f"{circuit.label}熔断中，暂停请求")
+    try:
+        response = get_oa_session().post(url, **kwargs)
+    except requests.RequestException:
+        circuit.record_failure()
+        raise
+    if response.status_code >= 500:
+        circuit.record_failure()
+    else:
+        circuit.record_success()
+    return response
+
+
+def oa_http_pool_stats() -> dict[str, Any]:
+    """
+    连接复用统计（当前进程）：
+    - requests: 已发出的请求数
+    - new_connections: 新建 TCP/TLS 连接数
+    - reused: 复用已有连接的请求数
+    """
+    session = _SESSION_STATE["session"]
+    hosts = []
+    if session is not None and _SESSION_STATE["pid"] == os.getpid():
+        seen = set()
+        for adapter in session.adapters.values():
+            if id(adapter) in seen:
+                continue
+            seen.add(id(adapter))
+            pools = adapter.poolmanager.pools
+            for pool_key in list(pools.keys()):
+                pool = pools.get(pool_key)
+                if pool is None:
+                    continue
+                hosts.append(
+                    {
+                        "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                        "requests": int(pool.num_requests),
+                        "new_connections": int(pool.num_connections),
+                        "idle_connections": int(pool.pool.qsize()) if pool.pool is not None else 0,
+                    }
+                )
+    total_requests = sum(item["requests"] for item in hosts)
+    total_connections = sum(item["new_connections"] for item in hosts)
+    return {
+        "requests": total_requests,
+        "new_connections": total_connections,
+        "reused": max(total_requests - total_connections, 0),
+        "hosts": hosts,
+    }
@@ -0,0 +1,253 @@
+"""OA 字段映射执行计划：把 OA_PUSH_* 映射/模板配置预编译为取值函数，配置变更前复用。"""
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from operator import attrgetter
+from string import Formatter
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Application, InterviewCandidate
+
+_PLAN_SETTING_NAMES = {
+    "OA_PUSH_MAIN_FIELD_MAPPINGS",
+    "OA_PUSH_REQUEST_NAME_TEMPLATE",
+    "OA_PUSH_REMARK_TEMPLATE",
+}
+_TEMPLATE_FIELDS = {
+    "name": lambda candidate: str(candidate.application.name or ""),
+    "phone": lambda candidate: str(candidate.application.phone or ""),
+    "job": lambda candidate: str(getattr(candidate.application.job, "title", "") or ""),
+    "candidate_id": lambda candidate: str(candidate.id),
+    "application_id": lambda candidate: str(candidate.application_id),
+}
+_MISSING = object()
+
+_PLAN_LOCK = threading.Lock()
+_PLAN_CACHE: dict[str, OAFieldMappingPlan | None] = {"plan": None}
+
+
+class OAFieldMappingError(RuntimeError):
+    """OA 字段映射配置非法。"""
+
+
+def _normalize_field_value(value: Any, *, raw: bool) -> Any:
+    if value is None:
+        return ""
+    if raw:
+        return value
+    if isinstance(value, datetime):
+        return timezone.localtime(value).strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _walk_path(current: Any, parts: tuple[str, ...]) -> Any:
+    """通用取值：兼容 JSON 字段中的 dict 层级，缺失时返回 _MISSING。"""
+    for part in parts:
+        if isinstance(current, dict):
+            current = current.get(part, _MISSING)
+        else:
+            current = getattr(current, part, _MISSING)
+        if current is _MISSING:
+            return _MISSING
+    return current
+
+
+def _model_has_attribute(model, name: str) -> bool:
+    try:
+        model._meta.get_field(name)
+        return True
+    except FieldDoesNotExist:
+        pass
+    if hasattr(model, name):
+        return True
+    # 外键的 *_id 列。
+    return any(getattr(field, "attname", "") == name for field in model._meta.concrete_fields)
+
+
+def _compile_getter(source: str, *, label: str) -> Callable[[InterviewCandidate], Any]:
+    """把 source 路径编译为取值函数：常量直接返回，属性链走 attrgetter，遇到 dict 时回退逐级取值。"""
+    path = str(source or "").strip()
+    if not path:
+        return lambda candidate: _MISSING
+    if path.startswith("constant."):
+        constant = path[len("constant.") :]
+        return lambda candidate: constant
+
+    model = InterviewCandidate
+    prefix: tuple[str, ...] = ()
+    if path.startswith("application."):
+        model = Application
+        prefix = ("application",)
+        path = path[len("application.") :]
+    elif path.startswith("candidate."):
+        path = path[len("candidate.") :]
+
+    parts = tuple(part for part in path.split(".") if part)
+    if not parts:
+        raise OAFieldMappingError(f"{label} 的 source 路径为空")
+    # 只校验首段模型属性；其后片段可能是 JSON 字段中的任意键（如 work-history），交给逐级取值。
+    if not parts[0].isidentifier() or not _model_has_attribute(model, parts[0]):
+        raise OAFieldMappingError(f"{label} 的 source 字段不存在：{model.__name__}.{parts[0]}")
+
+    full_parts = prefix + parts
+    if not all(part.isidentifier() for part in parts):
+        return lambda candidate: _walk_path(candidate, full_parts)
+
+    fast_get = attrgetter(".".join(full_parts))
+
+    def getter(candidate: InterviewCandidate) -> Any:
+        try:
+            return fast_get(candidate)
+        except AttributeError:
+            return _walk_path(candidate, full_parts)
+
+    return getter
+
+
+@dataclass(frozen=True)
+class _MainFieldStep:
+    oa_field: str
+    getter: Callable[[InterviewCandidate], Any]
+    default: Any
+    has_default: bool
+    raw: bool
+
+
+@dataclass(frozen=True)
+class _CompiledTemplate:
+    template: str
+    fields: tuple[str, ...]
+
+    def render(self, candidate: InterviewCandidate) -> str:
+        if not self.fields:
+            return self.template
+        context = {name: _TEMPLATE_FIELDS[name](candidate) for name in self.fields}
+        return self.template.format(**context)
+
+
+def _compile_template(template: str, *, label: str) -> _CompiledTemplate:
+    """预解析模板占位符；未知占位符按空串处理（与历史行为一致），语法错误与下标/属性访问直接报错。"""
+    text = str(template or "")
+    try:
+        parsed = list(Formatter().parse(text))
+    except ValueError as err:
+        raise OAFieldMappingError(f"{label} 模板格式错误：{err}") from err
+    fields: list[str] = []
+    rewritten: list[str] = []
+    for literal, field_name, format_spec, conversion in parsed:
+        rewritten.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+        if "[" in field_name or "." in field_name:
+            raise OAFieldMappingError(f"{label} 模板占位符不支持下标或属性访问：{{{field_name}}}")
+        if field_name in _TEMPLATE_FIELDS:
+            if field_name not in fields:
+                fields.append(field_name)
+            spec = f"!{conversion}" if conversion else ""
+            spec += f":{format_spec}" if format_spec else ""
+            rewritten.append(f"{{{field_name}{spec}}}")
+    return _CompiledTemplate(template="".join(rewritten), fields=tuple(fields))
+
+
+@dataclass(frozen=True)
+class OAFieldMappingPlan:
+    main_fields: tuple[_MainFieldStep, ...]
+    request_name: _CompiledTemplate
+    remark: _CompiledTemplate
+
+    def build_main_data(self, candidate: InterviewCandidate) -> list[dict[str, Any]]:
+        rows = []
+        for step in self.main_fields:
+            value = step.getter(candidate)
+            if value is _MISSING or (step.has_default and value in (None, "")):
+                value = step.default
+            rows.append({"fieldName": step.oa_field, "fieldValue": _normalize_field_value(value, raw=step.raw)})
+        return rows
+
+    def render_request_name(self, candidate: InterviewCandidate) -> str:
+        return self.request_name.render(candidate).strip() or f"入职确认-{candidate.application.name}"
+
+    def render_remark(self, candidate: InterviewCandidate) -> str:
+        return self.remark.render(candidate)
+
+
+def compile_oa_field_mapping_plan(
+    mappings: Any,
+    *,
+    request_name_template: str = "入职确认-{name}",
+    remark_template: str = "",
+) -> OAFieldMappingPlan:
+    """校验并编译映射配置，配置非法时抛 OAFieldMappingError。"""
+    if not isinstance(mappings, list):
+        raise OAFieldMappingError("OA_PUSH_MAIN_FIELD_MAPPINGS 必须是数组")
+    if not mappings:
+        raise OAFieldMappingError("OA_PUSH_MAIN_FIELD_MAPPINGS 为空，无法构建主表字段")
+
+    steps = []
+    for index, raw_mapping in enumerate(mappings):
+        label = f"OA_PUSH_MAIN_FIELD_MAPPINGS[{index}]"
+        if not isinstance(raw_mapping, dict):
+            raise OAFieldMappingError(f"{label} 不是对象")
+        oa_field = str(raw_mapping.get("oa_field") or "").strip()
+        if not oa_field:
+            raise OAFieldMappingError(f"{label} 的 oa_field 为空")
+        steps.append(
+            _MainFieldStep(
+                oa_field=oa_field,
+                getter=_compile_getter(raw_mapping.get("source") or "", label=f"{label}({oa_field})"),
+                default=raw_mapping.get("default", ""),
+                has_default="default" in raw_mapping,
+                raw=bool(raw_mapping.get("raw", False)),
+            )
+        )
+    return OAFieldMappingPlan(
+        main_fields=tuple(steps),
+        request_name=_compile_template(
+            request_name_template or "入职确认-{name}",
+            label="OA_PUSH_REQUEST_NAME_TEMPLATE",
+        ),
+        remark=_compile_template(remark_template or "", label="OA_PUSH_REMARK_TEMPLATE"),
+    )
+
+
+def get_oa_field_mapping_plan() -> OAFieldMappingPlan:
+    """返回当前配置对应的执行计划；首次调用时编译，配置变更后重新编译。"""
+    plan = _PLAN_CACHE["plan"]
+    if plan is not None:
+        return plan
+    with _PLAN_LOCK:
+        plan = _PLAN_CACHE["plan"]
+        if plan is None:
+            plan = compile_oa_field_mapping_plan(
+                getattr(settings, "OA_PUSH_MAIN_FIELD_MAPPINGS", []),
+                request_name_template=str(
+                    getattr(settings, "OA_PUSH_REQUEST_NAME_TEMPLATE", "入职确认-{name}") or "入职确认-{name}"
+                ),
+                remark_template=str(getattr(settings, "OA_PUSH_REMARK_TEMPLATE", "") or ""),
+            )
+            _PLAN_CACHE["plan"] = plan
+    return plan
+
+
+def clear_oa_field_mapping_plan() -> None:
+    with _PLAN_LOCK:
+        _PLAN_CACHE["plan"] = None
+
+
+@receiver(setting_changed)
+def _reset_plan_on_setting_changed(sender, setting, **kwargs):
+    if setting in _PLAN_SETTING_NAMES:
+        clear_oa_field_mapping_plan()
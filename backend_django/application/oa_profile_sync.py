@@ -4,10 +4,10 @@ from __future__ import annotations
 import json
 import logging
 
-import requests
 from django.conf import settings
 from django.contrib.auth import get_user_model
 
+from .oa_client import oa_post
 from .oa_push import (
     encrypt_oa_text_with_spk,
     fetch_oa_token_value,
@@ -62,8 +62,9 @@ def _query_real_name_by_loginid(loginid: str, *, config: dict[str, str]) -> str:
             ensure_ascii=False,
         )
     }
-    response = requests.post(
+    response = oa_post(
         endpoint,
+        breaker="oa:hrm_user_info",
         headers=headers,
         data=body,
         timeout=get_oa_request_timeout_seconds(),
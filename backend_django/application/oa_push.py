@@ -4,16 +4,26 @@ from __future__ import annotations
 import base64
 import json
 import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from functools import lru_cache
+from datetime import datetime
 from typing import Any
 
 import requests
 from django.conf import settings
-from django.db import transaction
+from django.core.cache import cache
+from django.db import connections, transaction
 from django.utils import timezone
 
+from . import metrics
 from .models import InterviewCandidate
+from .oa_field_mapping import OAFieldMappingError, get_oa_field_mapping_plan
+from .oa_client import oa_post
 
 logger = logging.getLogger(__name__)
 
@@ -54,17 +64,17 @@ class OAPushResult:
         }
 
 
-class _SafeFormatDict(dict):
-    """模板渲染缺失键时返回空串，避免 format 抛 KeyError。"""
-
-    def __missing__(self, key):
-        return ""
+# token 存于 Django cache，多 worker/多主机共享；刷新锁保证同一时刻只有一个进程调用 applytoken。
+_TOKEN_CACHE_KEY = "oa_push:token"
+_TOKEN_LOCK_KEY = "oa_push:token:lock"
+# 距过期不足该秒数视为不可用，规避边界时间抖动。
+_TOKEN_EXPIRY_MARGIN_SECONDS = 60
+_TOKEN_LOCK_POLL_SECONDS = 0.05
 
-
-_TOKEN_CACHE: dict[str, Any] = {
-    "token": "",
-    "expires_at": None,
-}
+# 只缓存请求头里的固定值（secret/userid），按 LRU 限制条目数，过期条目在读写时淘汰。
+_ENCRYPTED_HEADER_MAX_ENTRIES = 16
+_ENCRYPTED_HEADER_LOCK = threading.Lock()
+_ENCRYPTED_HEADER_CACHE: OrderedDict[tuple[str, str], tuple[str, float]] = OrderedDict()
 
 
 def _is_enabled() -> bool:
@@ -75,6 +85,10 @@ def _now() -> datetime:
     return timezone.now()
 
 
+def _batch_concurrency() -> int:
+    return max(int(getattr(settings, "OA_PUSH_BATCH_CONCURRENCY", 8) or 8), 1)
+
+
 def _get_timeout_seconds() -> int:
     return max(int(getattr(settings, "OA_PUSH_REQUEST_TIMEOUT_SECONDS", 10) or 10), 1)
 
@@ -83,6 +97,12 @@ def _token_ttl_seconds() -> int:
     return max(int(getattr(settings, "OA_PUSH_TOKEN_TTL_SECONDS", 1800) or 1800), 60)
 
 
+def _token_refresh_ahead_seconds() -> int:
+    """提前刷新窗口：不超过 TTL 的一半，保证刷新期间旧 token 仍可用。"""
+    value = max(int(getattr(settings, "OA_PUSH_TOKEN_REFRESH_AHEAD_SECONDS", 300) or 0), 0)
+    return min(value, _token_ttl_seconds() // 2)
+
+
 def _auto_retry_times() -> int:
     return max(int(getattr(settings, "OA_PUSH_AUTO_RETRY_TIMES", 1) or 1), 0)
 
@@ -136,11 +156,16 @@ def fetch_oa_token_value(force_refresh: bool = False) -> str:
     result = _fetch_token(force_refresh=force_refresh)
     if not result.success:
         return ""
-    return str(_TOKEN_CACHE.get("token") or result.request_id or "").strip()
+    return str(result.request_id or "").strip()
+
+
+def clear_oa_token_cache() -> None:
+    """清除共享 token 与刷新锁（配置变更或排障时使用）。"""
+    cache.delete_many([_TOKEN_CACHE_KEY, _TOKEN_LOCK_KEY])
 
 
 def encrypt_oa_text_with_spk(plain_text: str, *, spk: str = "") -> str:
-    """对外公开 OA 公钥加密能力。spk 为空时使用 OA_PUSH_SPK。"""
+    """对外公开 OA 公钥加密能力。spk 为空时使用 OA_PUSH_SPK。明文任意，不进入密文缓存。"""
     target_spk = str(spk or get_oa_auth_config().get("spk") or "").strip()
     if not target_spk:
         return ""
@@ -166,15 +191,25 @@ def _normalize_public_key(spk: str) -> str:
     return f"-----BEGIN PUBLIC KEY-----\n{body}\n-----END PUBLIC KEY-----"
 
 
+@lru_cache(maxsize=4)
+def _load_public_key(spk: str):
+    """SPK 解析结果按进程缓存，避免每次请求重复解析 PEM。"""
+    try:
+        from cryptography.hazmat.primitives import serialization
+    except Exception as err:
+        raise RuntimeError("缺少 cryptography 依赖，无法执行 OA 加密") from err
+
+    pem = _normalize_public_key(spk).encode("utf-8")
+    return serialization.load_pem_public_key(pem)
+
+
 def _encrypt_text_with_spk(spk: str, plain_text: str) -> str:
     try:
-        from cryptography.hazmat.primitives import hashes, serialization
         from cryptography.hazmat.primitives.asymmetric import padding
     except Exception as err:
         raise RuntimeError("缺少 cryptography 依赖，无法执行 OA 加密") from err
 
-    pem = _normalize_public_key(spk).encode("utf-8")
-    public_key = serialization.load_pem_public_key(pem)
+    public_key = _load_public_key(spk)
     encrypted = public_key.encrypt(
         str(plain_text or "").encode("utf-8"),
         padding.PKCS1v15(),
@@ -182,94 +217,52 @@ def _encrypt_text_with_spk(spk: str, plain_text: str) -> str:
     return base64.b64encode(encrypted).decode("utf-8")
 
 
-def _resolve_source(candidate: InterviewCandidate, source: str, default: Any = "") -> Any:
-    """按 source 路径取值，支持 application./candidate./constant. 前缀。"""
-    path = str(source or "").strip()
-    if not path:
-        return default
-
-    if path.startswith("constant."):
-        return path[len("constant.") :]
-
-    target: Any = candidate
-    if path.startswith("application."):
-        target = candidate.application
-        path = path[len("application.") :]
-    elif path.startswith("candidate."):
-        target = candidate
-        path = path[len("candidate.") :]
-
-    current = target
-    for part in path.split("."):
-        if not part:
-            continue
-        if isinstance(current, dict):
-            current = current.get(part, default)
-        else:
-            current = getattr(current, part, default)
-        if current is default:
-            return default
-    return current
-
-
-def _normalize_field_value(value: Any, *, raw: bool) -> Any:
-    if value is None:
-        return ""
-    if raw:
-        return value
-    if isinstance(value, datetime):
-        return timezone.localtime(value).strftime("%Y-%m-%d %H:%M:%S")
-    if isinstance(value, date):
-        return value.isoformat()
-    if isinstance(value, (list, dict)):
-        return json.dumps(value, ensure_ascii=False)
-    return str(value)
+def _encrypted_header_cache_seconds() -> int:
+    return max(int(getattr(settings, "OA_PUSH_ENCRYPTED_HEADER_CACHE_SECONDS", 600) or 0), 0)
+
+
+def _encrypt_header_value(spk: str, plain_text: str) -> str:
+    """
+    加密请求头中的固定值（secret/userid），并在时间窗口内复用密文。
+
+    PKCS1v15 密文带随机填充，OA 端对同一密文可重复解密；窗口为 0 时每次重新加密。
+    """
+    window = _encrypted_header_cache_seconds()
+    if window <= 0:
+        return _encrypt_text_with_spk(spk, plain_text)
+    key = (spk, str(plain_text or ""))
+    now = time.monotonic()
+    with _ENCRYPTED_HEADER_LOCK:
+        cached = _ENCRYPTED_HEADER_CACHE.get(key)
+        if cached and now - cached[1] < window:
+            _ENCRYPTED_HEADER_CACHE.move_to_end(key)
+            return cached[0]
+    encrypted = _encrypt_text_with_spk(spk, plain_text)
+    with _ENCRYPTED_HEADER_LOCK:
+        _ENCRYPTED_HEADER_CACHE[key] = (encrypted, now)
+        _ENCRYPTED_HEADER_CACHE.move_to_end(key)
+        expired = [k for k, (_, created) in _ENCRYPTED_HEADER_CACHE.items() if now - created >= window]
+        for expired_key in expired:
+            del _ENCRYPTED_HEADER_CACHE[expired_key]
+        while len(_ENCRYPTED_HEADER_CACHE) > _ENCRYPTED_HEADER_MAX_ENTRIES:
+            _ENCRYPTED_HEADER_CACHE.popitem(last=False)
+    return encrypted
+
+
+def clear_oa_crypto_cache() -> None:
+    """清除公钥解析与密文缓存（SPK 轮换或排障时使用）。"""
+    _load_public_key.cache_clear()
+    with _ENCRYPTED_HEADER_LOCK:
+        _ENCRYPTED_HEADER_CACHE.clear()
 
 
 def _build_main_data(candidate: InterviewCandidate) -> list[dict[str, Any]]:
-    # 主表字段完全由配置驱动，避免字段变更时改代码。
-    mappings = getattr(settings, "OA_PUSH_MAIN_FIELD_MAPPINGS", [])
-    if not isinstance(mappings, list):
-        raise RuntimeError("OA_PUSH_MAIN_FIELD_MAPPINGS 必须是数组")
-    if not mappings:
-        raise RuntimeError("OA_PUSH_MAIN_FIELD_MAPPINGS 为空，无法构建主表字段")
-
-    rows: list[dict[str, Any]] = []
-    for raw_mapping in mappings:
-        if not isinstance(raw_mapping, dict):
-            raise RuntimeError("OA_PUSH_MAIN_FIELD_MAPPINGS 包含非法项")
-        oa_field = str(raw_mapping.get("oa_field") or "").strip()
-        source = str(raw_mapping.get("source") or "").strip()
-        if not oa_field:
-            raise RuntimeError("OA_PUSH_MAIN_FIELD_MAPPINGS 存在空 oa_field")
-        default = raw_mapping.get("default", "")
-        raw = bool(raw_mapping.get("raw", False))
-        value = _resolve_source(candidate, source, default=default)
-        if value in (None, "") and "default" in raw_mapping:
-            value = default
-        rows.append(
-            {
-                "fieldName": oa_field,
-                "fieldValue": _normalize_field_value(value, raw=raw),
-            }
-        )
-    return rows
+    # 主表字段完全由配置驱动，避免字段变更时改代码；映射在首次使用时预编译。
+    return get_oa_field_mapping_plan().build_main_data(candidate)
 
 
 def _build_request_name(candidate: InterviewCandidate) -> str:
-    template = str(
-        getattr(settings, "OA_PUSH_REQUEST_NAME_TEMPLATE", "入职确认-{name}") or "入职确认-{name}"
-    )
-    context = _SafeFormatDict(
-        {
-            "name": str(candidate.application.name or ""),
-            "phone": str(candidate.application.phone or ""),
-            "job": str(getattr(candidate.application.job, "title", "") or ""),
-            "candidate_id": str(candidate.id),
-            "application_id": str(candidate.application_id),
-        }
-    )
-    return template.format_map(context).strip() or f"入职确认-{candidate.application.name}"
+    return get_oa_field_mapping_plan().render_request_name(candidate)
 
 
 def _build_request_payload(candidate: InterviewCandidate) -> dict[str, Any]:
@@ -282,26 +275,16 @@ def _build_request_payload(candidate: InterviewCandidate) -> dict[str, Any]:
         other_params = {}
 
     request_level = str(getattr(settings, "OA_PUSH_REQUEST_LEVEL", "") or "").strip()
-    remark_template = str(getattr(settings, "OA_PUSH_REMARK_TEMPLATE", "") or "")
-    remark = remark_template.format_map(
-        _SafeFormatDict(
-            {
-                "name": str(candidate.application.name or ""),
-                "phone": str(candidate.application.phone or ""),
-                "candidate_id": str(candidate.id),
-                "application_id": str(candidate.application_id),
-            }
-        )
-    )
+    plan = get_oa_field_mapping_plan()
 
     payload: dict[str, Any] = {
         "workflowId": str(getattr(settings, "OA_PUSH_WORKFLOW_ID", "") or "").strip(),
-        "requestName": _build_request_name(candidate),
-        "mainData": _build_main_data(candidate),
+        "requestName": plan.render_request_name(candidate),
+        "mainData": plan.build_main_data(candidate),
         "detailData": detail_data,
         "otherParams": other_params,
         "requestLevel": request_level,
-        "remark": remark,
+        "remark": plan.render_remark(candidate),
     }
     return payload
 
@@ -430,31 +413,88 @@ def _classify_oa_failure(payload: dict[str, Any], *, http_status: int = 200) ->
     )
 
 
-def _cached_token_available() -> bool:
-    # 提前 60 秒视为过期，规避边界时间抖动。
-    token = str(_TOKEN_CACHE.get("token") or "")
-    expires_at = _TOKEN_CACHE.get("expires_at")
-    if not token or not expires_at:
-        return False
-    if not isinstance(expires_at, datetime):
-        return False
-    return expires_at > (_now() + timedelta(seconds=60))
+def _read_cached_token() -> dict[str, Any] | None:
+    entry = cache.get(_TOKEN_CACHE_KEY)
+    if not isinstance(entry, dict) or not entry.get("token"):
+        return None
+    if float(entry.get("expires_at") or 0) <= _now().timestamp() + _TOKEN_EXPIRY_MARGIN_SECONDS:
+        return None
+    return entry
 
 
-def _fetch_token(force_refresh: bool = False) -> OAPushResult:
-    """获取 token：优先读缓存，失效后走 applytoken。"""
-    if not force_refresh and _cached_token_available():
-        return OAPushResult(
-            success=True,
-            retryable=False,
-            request_id=str(_TOKEN_CACHE.get("token") or ""),
-        )
+def _token_success(token: str) -> OAPushResult:
+    return OAPushResult(success=True, retryable=False, request_id=token)
+
 
+def _acquire_token_lock() -> str:
+    owner = uuid.uuid4().hex
+    lock_seconds = _get_timeout_seconds() * 2 + 5
+    return owner if cache.add(_TOKEN_LOCK_KEY, owner, timeout=lock_seconds) else ""
+
+
+def _release_token_lock(owner: str) -> None:
+    if owner and cache.get(_TOKEN_LOCK_KEY) == owner:
+        cache.delete(_TOKEN_LOCK_KEY)
+
+
+def _invalidate_token(token: str) -> None:
+    """OA 判定 token 失效时清除共享缓存；仅清除同一个 token，避免误删他人刚刷新的值。"""
+    entry = cache.get(_TOKEN_CACHE_KEY)
+    if isinstance(entry, dict) and entry.get("token") == token:
+        cache.delete(_TOKEN_CACHE_KEY)
+
+
+def _fetch_token(force_refresh: bool = False, *, invalid_token: str = "") -> OAPushResult:
+    """
+    获取 token（single-flight）：
+    - 缓存命中且未进入提前刷新窗口：直接返回
+    - 进入提前刷新窗口：抢到锁的调用在本次请求内同步刷新（失败则沿用旧 token），其余进程不等待、继续使用旧 token
+    - 无可用 token 或强制刷新：抢锁刷新，未抢到锁则等待其他进程写回缓存
+    """
+    if invalid_token:
+        _invalidate_token(invalid_token)
+    entry = _read_cached_token()
+    if entry and not force_refresh:
+        if _now().timestamp() < float(entry.get("refresh_at") or 0):
+            return _token_success(entry["token"])
+        owner = _acquire_token_lock()
+        if not owner:
+            return _token_success(entry["token"])
+        try:
+            result = _apply_token()
+        finally:
+            _release_token_lock(owner)
+        # 提前刷新失败时旧 token 仍在有效期内，继续使用。
+        return result if result.success else _token_success(entry["token"])
+
+    deadline = _now().timestamp() + _get_timeout_seconds() + 1
+    while True:
+        owner = _acquire_token_lock()
+        if owner:
+            try:
+                entry = _read_cached_token()
+                if entry and entry["token"] != invalid_token and (not force_refresh or invalid_token):
+                    # 等锁期间其他进程已刷新。
+                    return _token_success(entry["token"])
+                return _apply_token()
+            finally:
+                _release_token_lock(owner)
+        time.sleep(_TOKEN_LOCK_POLL_SECONDS)
+        entry = _read_cached_token()
+        if entry and entry["token"] != invalid_token:
+            return _token_success(entry["token"])
+        if _now().timestamp() >= deadline:
+            # 持锁进程异常未写回，降级为本进程直接获取。
+            return _apply_token()
+
+
+def _apply_token() -> OAPushResult:
+    """调用 applytoken 获取新 token 并写入共享缓存。"""
     base_url = _oa_base_url()
     endpoint = f"{base_url}/api/ec/dev/auth/applytoken"
     config = _required_config()
 
-    encrypted_secret = _encrypt_text_with_spk(config["OA_PUSH_SPK"], config["OA_PUSH_SECRIT"])
+    encrypted_secret = _encrypt_header_value(config["OA_PUSH_SPK"], config["OA_PUSH_SECRIT"])
     headers = {
         "appid": config["OA_PUSH_APP_ID"],
         "secret": encrypted_secret,
@@ -463,7 +503,12 @@ def _fetch_token(force_refresh: bool = False) -> OAPushResult:
     }
 
     try:
-        response = requests.post(endpoint, headers=headers, timeout=_get_timeout_seconds())
+        response = oa_post(
+            endpoint,
+            breaker="oa:applytoken",
+            headers=headers,
+            timeout=_get_timeout_seconds(),
+        )
     except requests.RequestException as err:
         return OAPushResult(
             success=False,
@@ -487,9 +532,18 @@ def _fetch_token(force_refresh: bool = False) -> OAPushResult:
             result.error_message = result.error_message or "OA 返回 token 为空"
         return result
 
-    _TOKEN_CACHE["token"] = token
-    _TOKEN_CACHE["expires_at"] = _now() + timedelta(seconds=_token_ttl_seconds())
-    return OAPushResult(success=True, retryable=False, request_id=token)
+    ttl_seconds = _token_ttl_seconds()
+    issued_at = _now().timestamp()
+    cache.set(
+        _TOKEN_CACHE_KEY,
+        {
+            "token": token,
+            "expires_at": issued_at + ttl_seconds,
+            "refresh_at": issued_at + ttl_seconds - _token_refresh_ahead_seconds(),
+        },
+        timeout=ttl_seconds,
+    )
+    return _token_success(token)
 
 
 def _build_form_payload(payload: dict[str, Any]) -> dict[str, str]:
@@ -531,8 +585,9 @@ def _create_request_with_token(
         data = _build_form_payload(payload)
 
     try:
-        response = requests.post(
+        response = oa_post(
             endpoint,
+            breaker="oa:create_request",
             headers=headers,
             data=data,
             json=json_payload,
@@ -568,6 +623,13 @@ def _push_once(candidate: InterviewCandidate) -> OAPushResult:
 
     try:
         payload = _build_request_payload(candidate)
+    except OAFieldMappingError as err:
+        return OAPushResult(
+            success=False,
+            retryable=False,
+            error_code=OA_PUSH_ERROR_CONFIG,
+            error_message=f"OA 字段映射配置错误：{err}",
+        )
     except Exception as err:
         return OAPushResult(
             success=False,
@@ -581,19 +643,19 @@ def _push_once(candidate: InterviewCandidate) -> OAPushResult:
         token_result.payload_snapshot = payload
         return token_result
 
-    token = str(_TOKEN_CACHE.get("token") or "")
+    token = str(token_result.request_id or "")
     config = _required_config()
-    encrypted_userid = _encrypt_text_with_spk(config["OA_PUSH_SPK"], config["OA_PUSH_USER_ID"])
+    encrypted_userid = _encrypt_header_value(config["OA_PUSH_SPK"], config["OA_PUSH_USER_ID"])
     result = _create_request_with_token(token=token, encrypted_userid=encrypted_userid, payload=payload)
     if result.success:
         return result
     if result.error_code == OA_PUSH_ERROR_TOKEN_EXPIRED:
         # token 失效时强制刷新后再试一次，避免把瞬时过期直接判失败。
-        refresh_result = _fetch_token(force_refresh=True)
+        refresh_result = _fetch_token(force_refresh=True, invalid_token=token)
         if not refresh_result.success:
             refresh_result.payload_snapshot = payload
             return refresh_result
-        refreshed_token = str(_TOKEN_CACHE.get("token") or "")
+        refreshed_token = str(refresh_result.request_id or "")
         retry_result = _create_request_with_token(
             token=refreshed_token,
             encrypted_userid=encrypted_userid,
@@ -605,9 +667,30 @@ def _push_once(candidate: InterviewCandidate) -> OAPushResult:
     return result
 
 
-def _mark_pending(candidate: InterviewCandidate, *, is_retry: bool) -> None:
-    """发起推送前先落库 pending，保证链路可追踪。"""
-    now = _now()
+_PENDING_FIELDS = [
+    "oa_push_retry_count",
+    "oa_push_status",
+    "oa_push_last_attempt_at",
+    "oa_push_error_code",
+    "oa_push_error_message",
+    "oa_push_oa_code",
+    "oa_push_oa_message",
+    "updated_at",
+]
+_RESULT_FIELDS = [
+    "oa_push_status",
+    "oa_push_success_at",
+    "oa_push_request_id",
+    "oa_push_error_code",
+    "oa_push_error_message",
+    "oa_push_oa_code",
+    "oa_push_oa_message",
+    "oa_push_payload_snapshot",
+    "updated_at",
+]
+
+
+def _apply_pending(candidate: InterviewCandidate, *, now: datetime) -> None:
     current_retry = int(candidate.oa_push_retry_count or 0)
     candidate.oa_push_retry_count = current_retry + 1
     candidate.oa_push_status = InterviewCandidate.OA_PUSH_STATUS_PENDING
@@ -616,25 +699,11 @@ def _mark_pending(candidate: InterviewCandidate, *, is_retry: bool) -> None:
     candidate.oa_push_error_message = ""
     candidate.oa_push_oa_code = ""
     candidate.oa_push_oa_message = ""
-    candidate.save(
-        update_fields=[
-            "oa_push_retry_count",
-            "oa_push_status",
-            "oa_push_last_attempt_at",
-            "oa_push_error_code",
-            "oa_push_error_message",
-            "oa_push_oa_code",
-            "oa_push_oa_message",
-            "updated_at",
-        ]
-    )
-    if is_retry:
-        logger.info("oa_push_retry candidate_id=%s retry_count=%s", candidate.id, candidate.oa_push_retry_count)
+    # bulk_update 不触发 auto_now，显式写入。
+    candidate.updated_at = now
 
 
-def _mark_result(candidate: InterviewCandidate, result: OAPushResult) -> None:
-    """推送结束后统一回写状态、失败原因、OA 返回码和请求快照。"""
-    now = _now()
+def _apply_result(candidate: InterviewCandidate, result: OAPushResult, *, now: datetime) -> None:
     candidate.oa_push_payload_snapshot = result.payload_snapshot or {}
     if result.success:
         candidate.oa_push_status = InterviewCandidate.OA_PUSH_STATUS_SUCCESS
@@ -651,79 +720,207 @@ def _mark_result(candidate: InterviewCandidate, result: OAPushResult) -> None:
         candidate.oa_push_error_message = str(result.error_message or "OA 推送失败")
         candidate.oa_push_oa_code = str(result.oa_code or "")
         candidate.oa_push_oa_message = str(result.oa_message or "")
-    candidate.save(
-        update_fields=[
-            "oa_push_status",
-            "oa_push_success_at",
-            "oa_push_request_id",
-            "oa_push_error_code",
-            "oa_push_error_message",
-            "oa_push_oa_code",
-            "oa_push_oa_message",
-            "oa_push_payload_snapshot",
-            "updated_at",
-        ]
+    candidate.updated_at = now
+
+
+def _mark_pending(candidate: InterviewCandidate, *, is_retry: bool) -> None:
+    """发起推送前先落库 pending，保证链路可追踪。"""
+    _apply_pending(candidate, now=_now())
+    candidate.save(update_fields=_PENDING_FIELDS)
+    if is_retry:
+        logger.info("oa_push_retry candidate_id=%s retry_count=%s", candidate.id, candidate.oa_push_retry_count)
+
+
+def _mark_result(candidate: InterviewCandidate, result: OAPushResult) -> None:
+    """推送结束后统一回写状态、失败原因、OA 返回码和请求快照。"""
+    _apply_result(candidate, result, now=_now())
+    candidate.save(update_fields=_RESULT_FIELDS)
+
+
+def _lock_candidate(candidate_id: int) -> InterviewCandidate:
+    return (
+        InterviewCandidate.objects.select_for_update()
+        .select_related("application", "application__job", "application__region")
+        .get(pk=candidate_id)
     )
 
 
-def dispatch_oa_push(candidate_id: int, *, is_retry: bool = False) -> tuple[InterviewCandidate, OAPushResult]:
-    """对外入口：幂等保护 + 自动重试 + 状态落库。"""
-    with transaction.atomic():
-        candidate = (
-            InterviewCandidate.objects.select_for_update()
-            .select_related("application", "application__job", "application__region")
-            .get(pk=candidate_id)
+def already_pushed_result(candidate: InterviewCandidate) -> OAPushResult | None:
+    """已成功且存在 request_id 时返回幂等结果，避免重复建 OA 流程。"""
+    if candidate.oa_push_status == InterviewCandidate.OA_PUSH_STATUS_SUCCESS and candidate.oa_push_request_id:
+        return OAPushResult(
+            success=True,
+            retryable=False,
+            request_id=candidate.oa_push_request_id,
+            oa_message="已推送成功，跳过重复创建",
+            payload_snapshot=candidate.oa_push_payload_snapshot or {},
         )
-        if candidate.oa_push_status == InterviewCandidate.OA_PUSH_STATUS_SUCCESS and candidate.oa_push_request_id:
-            # 已成功且存在 request_id 时直接幂等返回，避免重复建 OA 流程。
-            return candidate, OAPushResult(
-                success=True,
-                retryable=False,
-                request_id=candidate.oa_push_request_id,
-                oa_message="已推送成功，跳过重复创建",
-                payload_snapshot=candidate.oa_push_payload_snapshot or {},
-            )
+    return None
+
+
+def begin_oa_push(candidate_id: int, *, is_retry: bool) -> tuple[InterviewCandidate, OAPushResult | None]:
+    """锁定候选人并落库 pending；已推送成功时返回幂等结果，调用方无需再推送。"""
+    with transaction.atomic():
+        candidate = _lock_candidate(candidate_id)
+        skipped = already_pushed_result(candidate)
+        if skipped is not None:
+            return candidate, skipped
         _mark_pending(candidate, is_retry=is_retry)
+    return candidate, None
+
+
+def _push_with_auto_retry(candidate: InterviewCandidate) -> OAPushResult:
+    started = time.perf_counter()
+    result = _push_with_auto_retry_unmetered(candidate)
+    outcome = "success" if result.success else "failed"
+    metrics.inc("hrm_oa_push_total", {"result": outcome, "error_code": result.error_code or ""})
+    metrics.observe("hrm_oa_push_duration_seconds", time.perf_counter() - started, {"result": outcome})
+    return result
 
+
+def _push_with_auto_retry_unmetered(candidate: InterviewCandidate) -> OAPushResult:
     if not _is_enabled():
-        result = OAPushResult(
+        return OAPushResult(
             success=False,
             retryable=False,
             error_code=OA_PUSH_ERROR_DISABLED,
             error_message="OA 推送未启用",
             payload_snapshot={},
         )
-    else:
-        attempts = 0
-        result = OAPushResult(
-            success=False,
-            retryable=False,
-            error_code=OA_PUSH_ERROR_RUNTIME,
-            error_message="OA 推送失败",
+
+    attempts = 0
+    result = OAPushResult(
+        success=False,
+        retryable=False,
+        error_code=OA_PUSH_ERROR_RUNTIME,
+        error_message="OA 推送失败",
+    )
+    max_attempts = max(_auto_retry_times(), 0) + 1
+    while attempts < max_attempts:
+        # 仅对 retryable 错误继续重试。
+        attempts += 1
+        try:
+            result = _push_once(candidate)
+        except Exception as err:
+            result = OAPushResult(
+                success=False,
+                retryable=True,
+                error_code=OA_PUSH_ERROR_RUNTIME,
+                error_message=f"OA 推送运行异常：{err}",
+            )
+        if result.success:
+            break
+        if not result.retryable:
+            break
+    return result
+
+
+def complete_oa_push(
+    candidate_id: int, *, candidate: InterviewCandidate | None = None
+) -> tuple[InterviewCandidate, OAPushResult]:
+    """对已标记 pending 的候选人执行推送并回写结果，供同步入口与队列 worker 共用。"""
+    if candidate is None:
+        candidate = (
+            InterviewCandidate.objects.select_related("application", "application__job", "application__region")
+            .get(pk=candidate_id)
         )
-        max_attempts = max(_auto_retry_times(), 0) + 1
-        while attempts < max_attempts:
-            # 仅对 retryable 错误继续重试。
-            attempts += 1
-            try:
-                result = _push_once(candidate)
-            except Exception as err:
-                result = OAPushResult(
-                    success=False,
-                    retryable=True,
-                    error_code=OA_PUSH_ERROR_RUNTIME,
-                    error_message=f"OA 推送运行异常：{err}",
-                )
-            if result.success:
-                break
-            if not result.retryable:
-                break
+        skipped = already_pushed_result(candidate)
+        if skipped is not None:
+            return candidate, skipped
+
+    result = _push_with_auto_retry(candidate)
+    return record_oa_push_result(candidate_id, result), result
+
 
+def record_oa_push_result(candidate_id: int, result: OAPushResult) -> InterviewCandidate:
+    """加锁回写推送结果。"""
     with transaction.atomic():
-        candidate = (
+        candidate = _lock_candidate(candidate_id)
+        _mark_result(candidate, result)
+    return candidate
+
+
+def dispatch_oa_push(candidate_id: int, *, is_retry: bool = False) -> tuple[InterviewCandidate, OAPushResult]:
+    """对外入口：幂等保护 + 自动重试 + 状态落库。"""
+    candidate, skipped = begin_oa_push(candidate_id, is_retry=is_retry)
+    if skipped is not None:
+        return candidate, skipped
+    return complete_oa_push(candidate_id, candidate=candidate)
+
+
+def _push_in_thread(candidate: InterviewCandidate) -> OAPushResult:
+    """线程池执行入口：映射路径若触发查询会占用线程私有连接，结束后释放。"""
+    try:
+        return _push_with_auto_retry(candidate)
+    finally:
+        connections.close_all()
+
+
+def dispatch_oa_push_many(
+    candidate_ids: list[int],
+    *,
+    concurrency: int | None = None,
+    is_retry: bool = False,
+) -> list[tuple[InterviewCandidate, OAPushResult]]:
+    """
+    批量推送：单次查询加载候选人，线程池并发调用 OA，结果一次 bulk_update 回写。
+
+    单个候选人的语义与 dispatch_oa_push 一致（幂等跳过、pending 落库、自动重试）；
+    不存在的候选人 ID 会被忽略。返回顺序与 candidate_ids 一致。
+    """
+    ordered_ids = list(dict.fromkeys(int(candidate_id) for candidate_id in candidate_ids))
+    if not ordered_ids:
+        return []
+
+    outcomes: dict[int, tuple[InterviewCandidate, OAPushResult]] = {}
+    to_push: list[InterviewCandidate] = []
+    with transaction.atomic():
+        candidates = (
             InterviewCandidate.objects.select_for_update()
             .select_related("application", "application__job", "application__region")
-            .get(pk=candidate_id)
+            .filter(id__in=ordered_ids)
+            .order_by("id")
         )
-        _mark_result(candidate, result)
-    return candidate, result
+        now = _now()
+        for candidate in candidates:
+            skipped = already_pushed_result(candidate)
+            if skipped is not None:
+                outcomes[candidate.id] = (candidate, skipped)
+                continue
+            _apply_pending(candidate, now=now)
+            to_push.append(candidate)
+        if to_push:
+            InterviewCandidate.objects.bulk_update(to_push, _PENDING_FIELDS)
+    if is_retry:
+        logger.info("oa_push_retry_many candidate_ids=%s", [candidate.id for candidate in to_push])
+
+    if to_push:
+        try:
+            # 线程启动前编译映射计划，避免各线程并发编译。
+            get_oa_field_mapping_plan()
+        except OAFieldMappingError:
+            pass
+        max_workers = min(max(int(concurrency or 0), 0) or _batch_concurrency(), len(to_push))
+        if max_workers == 1:
+            results = [_push_with_auto_retry(candidate) for candidate in to_push]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="oa-push-batch") as executor:
+                results = list(executor.map(_push_in_thread, to_push))
+
+        with transaction.atomic():
+            locked = InterviewCandidate.objects.select_for_update().select_related(
+                "application", "application__job", "application__region"
+            ).in_bulk([candidate.id for candidate in to_push])
+            now = _now()
+            updated = []
+            for candidate, result in zip(to_push, results):
+                current = locked.get(candidate.id)
+                if current is None:
+                    continue
+                _apply_result(current, result, now=now)
+                updated.append(current)
+                outcomes[current.id] = (current, result)
+            if updated:
+                InterviewCandidate.objects.bulk_update(updated, _RESULT_FIELDS)
+
+    return [outcomes[candidate_id] for candidate_id in ordered_ids if candidate_id in outcomes]
@@ -0,0 +1,171 @@
+"""OA 推送任务队列：接口只负责入队，run_oa_push_worker 在后台消费并回写推送状态。"""
+from __future__ import annotations
+
+import logging
+
+from django.conf import settings
+from django.db import transaction
+
+from .audit import write_operation_log
+from .job_queue import claim_jobs, finish_job, requeue_stale_jobs
+from .models import InterviewCandidate, OAPushJob, OperationLog
+from .oa_push import (
+    OA_PUSH_ERROR_RUNTIME,
+    OAPushResult,
+    already_pushed_result,
+    begin_oa_push,
+    complete_oa_push,
+    record_oa_push_result,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def oa_push_queue_enabled() -> bool:
+    return bool(getattr(settings, "OA_PUSH_QUEUE_ENABLED", True))
+
+
+def oa_push_worker_concurrency() -> int:
+    return max(int(getattr(settings, "OA_PUSH_WORKER_CONCURRENCY", 4) or 4), 1)
+
+
+def oa_push_job_stale_seconds() -> int:
+    return max(int(getattr(settings, "OA_PUSH_JOB_STALE_SECONDS", 600) or 600), 60)
+
+
+def enqueue_oa_push(
+    candidate_id: int,
+    *,
+    is_retry: bool = False,
+    user=None,
+    request_id: str = "",
+) -> tuple[InterviewCandidate, OAPushJob | None]:
+    """
+    把候选人加入推送队列并落库 pending。
+
+    返回:
+    - candidate: 最新候选人记录
+    - job: 新建或已在排队的任务；候选人已推送成功时为 None
+    """
+    with transaction.atomic():
+        # 先锁候选人行，保证同一候选人的并发入队串行化。
+        candidate = (
+            InterviewCandidate.objects.select_for_update()
+            .select_related("application", "application__job", "application__region")
+            .get(pk=candidate_id)
+        )
+        active_job = (
+            OAPushJob.objects.filter(candidate_id=candidate_id, status__in=OAPushJob.ACTIVE_STATUSES)
+            .order_by("id")
+            .first()
+        )
+        if active_job is not None:
+            # 同一候选人已有未完成任务时复用，避免重复建 OA 流程。
+            return candidate, active_job
+
+        candidate, skipped = begin_oa_push(candidate_id, is_retry=is_retry)
+        if skipped is not None:
+            return candidate, None
+        job = OAPushJob.objects.create(
+            candidate=candidate,
+            is_retry=is_retry,
+            requested_by=user if user and getattr(user, "pk", None) else None,
+            request_id=request_id or "",
+        )
+    return candidate, job
+
+
+def requeue_stale_oa_push_jobs(*, stale_seconds: int | None = None) -> int:
+    seconds = stale_seconds if stale_seconds is not None else oa_push_job_stale_seconds()
+    return requeue_stale_jobs(OAPushJob, stale_seconds=seconds)
+
+
+def claim_oa_push_jobs(*, limit: int, worker_name: str) -> list[int]:
+    return claim_jobs(OAPushJob, limit=limit, worker_name=worker_name)
+
+
+def _finish_job(job: OAPushJob, result: OAPushResult) -> None:
+    finish_job(
+        job,
+        success=result.success,
+        error_code=result.error_code,
+        error_message=result.error_message,
+    )
+
+
+def _write_push_log(job: OAPushJob, candidate: InterviewCandidate, result: OAPushResult) -> None:
+    application = candidate.application
+    details = {
+        "interview_candidate_id": candidate.id,
+        "application_id": application.id,
+        "oa_push_job_id": job.id,
+        "is_retry": job.is_retry,
+    }
+    if result.success:
+        details["request_id"] = result.request_id
+    else:
+        details.update(
+            {
+                "error_code": result.error_code,
+                "error_message": result.error_message,
+                "retryable": result.retryable,
+                "oa_code": result.oa_code,
+                "oa_message": result.oa_message,
+            }
+        )
+    write_operation_log(
+        user=job.requested_by,
+        module="interviews",
+        action="OA_PUSH_SUCCESS" if result.success else "OA_PUSH_FAILED",
+        result=OperationLog.RESULT_SUCCESS if result.success else OperationLog.RESULT_FAILED,
+        target_type="interview_candidate",
+        target_id=candidate.id,
+        target_label=application.name,
+        summary=f"OA推送{'成功' if result.success else '失败'}：{application.name}",
+        details=details,
+        application=application,
+        interview_candidate=candidate,
+        region=application.region,
+        request_id=job.request_id,
+    )
+
+
+def run_oa_push_job(job_id: int) -> OAPushResult:
+    """执行单个已领取任务：驱动 pending -> success/failed 状态机并写审计日志。"""
+    job = OAPushJob.objects.select_related("requested_by").get(pk=job_id)
+    candidate = InterviewCandidate.objects.select_related(
+        "application", "application__job", "application__region"
+    ).get(pk=job.candidate_id)
+
+    skipped = already_pushed_result(candidate)
+    if skipped is not None:
+        _finish_job(job, skipped)
+        return skipped
+
+    try:
+        candidate, result = complete_oa_push(candidate.id, candidate=candidate)
+    except Exception as err:
+        logger.exception("oa_push_job_failed job_id=%s candidate_id=%s", job.id, job.candidate_id)
+        result = OAPushResult(
+            success=False,
+            retryable=True,
+            error_code=OA_PUSH_ERROR_RUNTIME,
+            error_message=f"OA 推送任务异常：{err}",
+        )
+        try:
+            record_oa_push_result(job.candidate_id, result)
+        except Exception:
+            logger.exception("oa_push_job_mark_failed job_id=%s candidate_id=%s", job.id, job.candidate_id)
+        _finish_job(job, result)
+        return result
+
+    _finish_job(job, result)
+    _write_push_log(job, candidate, result)
+    logger.info(
+        "oa_push_job_done job_id=%s candidate_id=%s success=%s error_code=%s",
+        job.id,
+        candidate.id,
+        result.success,
+        result.error_code,
+    )
+    return result
@@ -19,6 +19,8 @@ OPERATION_ACTION_LABELS = {
     "CANCEL_INTERVIEW_SCHEDULE": "取消面试",
     "SAVE_INTERVIEW_RESULT": "记录面试结果",
     "RESEND_INTERVIEW_SMS": "重发面试短信",
+    "INTERVIEW_SMS_SUCCESS": "面试短信发送成功",
+    "INTERVIEW_SMS_FAILED": "面试短信发送失败",
     "REMOVE_FROM_INTERVIEW_POOL": "移出拟面试",
     "BATCH_REMOVE_FROM_INTERVIEW_POOL": "批量移出拟面试",
     "MOVE_TALENT_TO_INTERVIEW": "加入拟面试人员",
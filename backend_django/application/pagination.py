@@ -0,0 +1,179 @@
+"""Keyset 游标分页：按完整排序键定位翻页位置，翻页耗时与页深无关。"""
+from __future__ import annotations
+
+import base64
+import json
+from collections import OrderedDict
+from typing import Any
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    与 DRF CursorPagination 返回结构一致（next/previous/results），但游标记录全部排序键：
+    - ordering 末位须为唯一列（如 id），作为稳定的并列决胜键；
+    - 支持可空排序列，NULL 视为最小值（与 MySQL/SQLite 默认排序一致）；
+    - 游标为 base64 编码的 JSON，前端只需原样回传。
+    """
+
+    ordering: tuple[str, ...] = ()
+    page_size = 30
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "无效的分页游标"
+
+    def get_page_size(self, request) -> int:
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, TypeError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def _fields(self, model) -> list[tuple[Any, bool]]:
+        return [(model._meta.get_field(name.lstrip("-")), name.startswith("-")) for name in self.ordering]
+
+    def encode_cursor(self, values: list[Any], *, reverse: bool) -> str:
+        raw = json.dumps(
+            {"v": [value.isoformat() if hasattr(value, "isoformat") else value for value in values], "r": int(reverse)},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, request, fields) -> tuple[list[Any], bool] | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+            raw_values = payload["v"]
+            if len(raw_values) != len(fields):
+                raise ValueError("cursor length mismatch")
+            values = [None if raw is None else field.to_python(raw) for (field, _), raw in zip(fields, raw_values)]
+            return values, bool(payload.get("r"))
+        except Exception as err:
+            raise NotFound(self.invalid_cursor_message) from err
+
+    @staticmethod
+    def _after(field, value, *, towards_smaller: bool) -> Q:
+        """排序方向上严格位于 value 之后的条件；NULL 视为最小值。"""
+        name = field.attname
+        if towards_smaller:
+            if value is None:
+                return Q(pk__in=[])
+            condition = Q(**{f"{name}__lt": value})
+            return condition | Q(**{f"{name}__isnull": True}) if field.null else condition
+        if value is None:
+            return Q(**{f"{name}__isnull": False})
+        return Q(**{f"{name}__gt": value})
+
+    @staticmethod
+    def _equal(field, value) -> Q:
+        if value is None:
+            return Q(**{f"{field.attname}__isnull": True})
+        return Q(**{field.attname: value})
+
+    @classmethod
+    def _seek_filter(cls, fields, values, *, reverse: bool) -> Q:
+        # (a, b, id) 之后 = a 之后 | (a 相等 & (b 之后 | (b 相等 & id 之后)))
+        condition = None
+        for (field, descending), value in reversed(list(zip(fields, values))):
+            after = cls._after(field, value, towards_smaller=descending != reverse)
+            condition = after if condition is None else after | (cls._equal(field, value) & condition)
+        return condition
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        fields = self._fields(queryset.model)
+        cursor = self.decode_cursor(request, fields)
+        reverse = bool(cursor and cursor[1])
+        if cursor:
+            queryset = queryset.filter(self._seek_filter(fields, cursor[0], reverse=reverse))
+        order_by = [f"-{field.attname}" if descending != reverse else field.attname for field, descending in fields]
+        rows = list(queryset.order_by(*order_by)[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self._fields_cache = fields
+        self.page = rows
+        return rows
+
+    def _position(self, obj) -> list[Any]:
+        return [getattr(obj, field.attname) for field, _ in self._fields_cache]
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+        cursor = self.encode_cursor(self._position(self.page[-1]), reverse=False)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous or not self.page:
+            return None
+        cursor = self.encode_cursor(self._position(self.page[0]), reverse=True)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+
+def keyset_ordering(queryset) -> tuple[str, ...]:
+    """queryset 的排序键（显式 order_by 优先，否则取模型默认排序），末位不是主键时补 id 作决胜键。"""
+    pk_name = queryset.model._meta.pk.attname
+    ordering = [
+        f"-{pk_name}" if name == "-pk" else pk_name if name == "pk" else name
+        for name in (queryset.query.order_by or queryset.model._meta.ordering)
+    ]
+    if not ordering or ordering[-1].lstrip("-") != pk_name:
+        ordering.append(pk_name)
+    return tuple(ordering)
+
+
+def iter_keyset_batches(queryset, *, batch_size: int, ordering: tuple[str, ...] = ()):
+    """
+    按排序键分批 seek 读取：每批 filter(位于上一批末行之后)[:batch_size] 单独查询，预取也按批执行。
+
+    MySQL（PyMySQL）下 QuerySet.iterator() 会先把整个结果集读入客户端内存，
+    分批查询才能让内存占用只与 batch_size 有关、首批行尽早返回。
+    排序列须为模型自身字段；queryset 为 values() 时返回的行需包含这些列。
+    """
+    ordering = tuple(ordering) or keyset_ordering(queryset)
+    fields = [(queryset.model._meta.get_field(name.lstrip("-")), name.startswith("-")) for name in ordering]
+    ordered = queryset.order_by(*ordering)
+    position = None
+    while True:
+        batch_queryset = ordered
+        if position is not None:
+            batch_queryset = ordered.filter(KeysetCursorPagination._seek_filter(fields, position, reverse=False))
+        batch = list(batch_queryset[:batch_size])
+        if batch:
+            yield batch
+        if len(batch) < batch_size:
+            return
+        last = batch[-1]
+        if isinstance(last, dict):
+            position = [last[field.attname] for field, _ in fields]
+        else:
+            position = [getattr(last, field.attname) for field, _ in fields]
@@ -0,0 +1,68 @@
+"""账号地区范围：每个请求只解析一次超管/全局权限/所属地区，视图、序列化器与审计写入共用同一结果。"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+
+from .models import Region, UserProfile
+
+ROLE_SUPERUSER = "superuser"
+ROLE_GLOBAL_ADMIN = "global_admin"
+ROLE_REGIONAL_ADMIN = "regional_admin"
+
+# 未配置 profile 的普通账号按该地区过滤，查询结果为空。
+NO_REGION_SCOPE = -1
+
+_SCOPE_ATTR = "_region_scope"
+
+
+@dataclass
+class RegionScope:
+    """单个账号的地区权限快照；region 首次访问时才读取地区实例。"""
+
+    is_superuser: bool = False
+    can_view_all: bool = False
+    region_id: int | None = None
+    profile: UserProfile | None = field(default=None, repr=False)
+
+    @property
+    def is_global(self) -> bool:
+        return self.is_superuser or self.can_view_all
+
+    @property
+    def filter_region_id(self) -> int | None:
+        """数据过滤用地区ID：None 表示不限地区。"""
+        if self.is_global:
+            return None
+        return self.region_id if self.profile is not None else NO_REGION_SCOPE
+
+    @property
+    def role_name(self) -> str:
+        if self.is_superuser:
+            return ROLE_SUPERUSER
+        if self.can_view_all:
+            return ROLE_GLOBAL_ADMIN
+        return ROLE_REGIONAL_ADMIN
+
+    @cached_property
+    def region(self) -> Region | None:
+        if self.profile is None or not self.region_id:
+            return None
+        return self.profile.region
+
+
+def region_scope_for(user) -> RegionScope:
+    """返回账号的地区范围；结果挂在账号实例上，同一请求内的后续调用不再读取 profile/地区。"""
+    if not user:
+        return RegionScope()
+    scope = getattr(user, _SCOPE_ATTR, None)
+    if scope is None:
+        profile = getattr(user, "profile", None)
+        scope = RegionScope(
+            is_superuser=bool(getattr(user, "is_superuser", False)),
+            can_view_all=bool(profile and profile.can_view_all),
+            region_id=profile.region_id if profile else None,
+            profile=profile,
+        )
+        setattr(user, _SCOPE_ATTR, scope)
+    return scope
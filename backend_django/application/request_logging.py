@@ -4,9 +4,14 @@ from __future__ import annotations
 
 import logging
 import time
+from contextlib import nullcontext
 from uuid import uuid4
 
+from django.db import connection
+
+from . import metrics
 from .audit import request_id_from_request
+from .sql_profiling import SqlProfiler, should_profile_request
 
 logger = logging.getLogger("application.request")
 
@@ -25,13 +30,24 @@ def _user_label(request) -> str:
     return "anonymous"
 
 
+def _route_label(request) -> str:
+    """按路由模板聚合指标，避免把带主键的完整路径作为标签值。"""
+    match = getattr(request, "resolver_match", None)
+    route = getattr(match, "route", "") if match else ""
+    return route or "unmatched"
+
+
 def _trim_text(value: str, max_len: int) -> str:
     text = str(value or "")
     return text[:max_len]
 
 
 class RequestLoggingMiddleware:
-    """记录请求完成/异常日志，并回传 X-Request-ID。"""
+    """
+    记录请求完成/异常日志，并回传 X-Request-ID。
+    开启 SQL 剖析且命中采样时，日志行追加 SQL 统计并回写 Server-Timing 响应头；
+    流式响应在中间件返回后才执行的查询不计入。
+    """
 
     def __init__(self, get_response):
         self.get_response = get_response
@@ -48,8 +64,10 @@ class RequestLoggingMiddleware:
         user_label = _user_label(request)
         ua = _trim_text(request.META.get("HTTP_USER_AGENT", ""), 180)
 
+        profiler = SqlProfiler() if should_profile_request() else None
         try:
-            response = self.get_response(request)
+            with connection.execute_wrapper(profiler) if profiler else nullcontext():
+                response = self.get_response(request)
         except Exception:
             duration_ms = int((time.monotonic() - started_at) * 1000)
             logger.exception(
@@ -64,7 +82,8 @@ class RequestLoggingMiddleware:
             )
             raise
 
-        duration_ms = int((time.monotonic() - started_at) * 1000)
+        elapsed_ms = (time.monotonic() - started_at) * 1000
+        duration_ms = int(elapsed_ms)
         status_code = int(getattr(response, "status_code", 0) or 0)
 
         if status_code >= 500:
@@ -74,17 +93,27 @@ class RequestLoggingMiddleware:
         else:
             level = logging.INFO
 
-        logger.log(
-            level,
-            "backend_request_complete method=%s path=%s status=%s request_id=%s ip=%s user=%s duration_ms=%s ua=%s",
-            method,
-            path,
-            status_code,
-            request_id,
-            ip,
-            user_label,
-            duration_ms,
-            ua,
+        message = "backend_request_complete method=%s path=%s status=%s request_id=%s ip=%s user=%s duration_ms=%s ua=%s"
+        args = [method, path, status_code, request_id, ip, user_label, duration_ms, ua]
+        if profiler:
+            summary = profiler.summary()
+            message += " sql_count=%s sql_ms=%s sql_dup=%s sql_max_repeat=%s sql_slowest=%r"
+            args.extend(
+                [
+                    summary["sql_count"],
+                    summary["sql_ms"],
+                    summary["sql_dup"],
+                    summary["sql_max_repeat"],
+                    summary["sql_slowest"],
+                ]
+            )
+            response["Server-Timing"] = profiler.server_timing(total_ms=elapsed_ms)
+
+        metrics.observe(
+            "hrm_http_request_duration_seconds",
+            elapsed_ms / 1000,
+            {"route": _route_label(request), "method": method, "status": f"{status_code // 100}xx"},
         )
+        logger.log(level, message, *args)
         response["X-Request-ID"] = request_id
         return response
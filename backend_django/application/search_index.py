@@ -0,0 +1,203 @@
+"""应聘记录全文检索：检索字段按二元分词写入倒排索引表，按命中权重排序并生成高亮片段。"""
+from __future__ import annotations
+
+import logging
+import unicodedata
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Application, ApplicationSearchTerm
+
+logger = logging.getLogger(__name__)
+
+# (字段, 展示名, 权重)：姓名/手机号命中排在学校专业与经历描述之前。
+SEARCH_FIELDS = (
+    ("name", "姓名", 10),
+    ("phone", "手机号", 8),
+    ("graduate_school", "毕业院校", 5),
+    ("major", "专业", 5),
+    ("work_history", "工作经历", 3),
+    ("self_evaluation", "自我评价", 1),
+)
+
+# 检索词过长时只取前若干字符，避免展开出过多索引词。
+MAX_QUERY_LENGTH = 32
+SNIPPET_RADIUS = 20
+
+
+def search_index_enabled() -> bool:
+    return bool(getattr(settings, "APPLICATION_SEARCH_INDEX_ENABLED", True))
+
+
+def _flatten(value: Any) -> list[str]:
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in _flatten(item)]
+    if isinstance(value, (list, tuple)):
+        return [text for item in value for text in _flatten(item)]
+    if value is None or isinstance(value, bool):
+        return []
+    text = str(value).strip()
+    return [text] if text else []
+
+
+def field_text(application: Application, field: str) -> str:
+    """检索字段原文；JSON 字段（如工作经历）展开为各项取值拼接。"""
+    return "；".join(_flatten(getattr(application, field, "")))
+
+
+def _fold(char: str) -> str:
+    """
+    单字符折叠：兼容分解后去掉重音等组合符号，再合成并做大小写折叠（全角转半角、é→e、ß→ss）。
+    与 MySQL utf8mb4_unicode_ci 视为相等的写法折叠成同一索引词，避免 (应聘记录, 索引词) 唯一约束冲突。
+    """
+    decomposed = unicodedata.normalize("NFKD", char)
+    stripped = "".join(item for item in decomposed if not unicodedata.combining(item))
+    return unicodedata.normalize("NFKC", stripped).casefold()
+
+
+def _normalize(text: str) -> tuple[str, list[int]]:
+    """字符折叠后去掉空白与标点，同时返回每个字符在原文中的位置，供高亮回映射。"""
+    chars = []
+    positions = []
+    for index, char in enumerate(str(text or "")):
+        for normalized in _fold(char):
+            if normalized.isalnum():
+                chars.append(normalized)
+                positions.append(index)
+    return "".join(chars), positions
+
+
+def normalize_text(text: str) -> str:
+    return _normalize(text)[0]
+
+
+def text_terms(normalized: str) -> set[str]:
+    """二元分词；末字符单独成词，使任意单字都是某个索引词的前缀。"""
+    if not normalized:
+        return set()
+    terms = {normalized[index : index + 2] for index in range(len(normalized) - 1)}
+    terms.add(normalized[-1])
+    return terms
+
+
+def build_terms(application: Application) -> dict[str, int]:
+    weights: dict[str, int] = {}
+    for field, _, weight in SEARCH_FIELDS:
+        for term in text_terms(normalize_text(field_text(application, field))):
+            weights[term] = weights.get(term, 0) + weight
+    return weights
+
+
+def _term_rows(application: Application) -> list[ApplicationSearchTerm]:
+    return [
+        ApplicationSearchTerm(application_id=application.pk, term=term, weight=weight)
+        for term, weight in build_terms(application).items()
+    ]
+
+
+def index_application(application: Application):
+    """重建单条应聘记录的索引词。"""
+    with transaction.atomic():
+        ApplicationSearchTerm.objects.filter(application_id=application.pk).delete()
+        ApplicationSearchTerm.objects.bulk_create(_term_rows(application))
+
+
+def rebuild_search_index(queryset=None, *, batch_size: int = 500) -> int:
+    """按主键分批重建索引，每批一个事务；返回处理的应聘记录数。"""
+    queryset = (queryset if queryset is not None else Application.objects.all()).order_by("id")
+    fields = ["id", *(field for field, _, _ in SEARCH_FIELDS)]
+    processed = 0
+    last_id = 0
+    while True:
+        batch = list(queryset.filter(id__gt=last_id).only(*fields)[:batch_size])
+        if not batch:
+            break
+        with transaction.atomic():
+            ApplicationSearchTerm.objects.filter(application_id__in=[item.pk for item in batch]).delete()
+            ApplicationSearchTerm.objects.bulk_create(
+                [row for item in batch for row in _term_rows(item)],
+                batch_size=2000,
+            )
+        processed += len(batch)
+        last_id = batch[-1].pk
+    return processed
+
+
+@receiver(post_save, sender=Application)
+def _index_saved_application(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or not search_index_enabled():
+        return
+    if update_fields is not None and not set(update_fields) & {field for field, _, _ in SEARCH_FIELDS}:
+        return
+    # 索引写入在保存点内，失败只回滚索引词并记录日志，不影响应聘记录本身的保存；可用 rebuild_search_index 补建。
+    try:
+        index_application(instance)
+    except Exception:
+        logger.warning("application_search_index_failed application_id=%s", instance.pk, exc_info=True)
+
+
+def query_text(keyword: str) -> str:
+    return normalize_text(keyword)[:MAX_QUERY_LENGTH]
+
+
+def rank_applications(queryset, keyword: str):
+    """
+    在给定应聘记录范围内检索，返回 (application_id, score) 行，按得分倒序：
+    - 多字检索词要求全部二元词命中，得分为命中索引词的权重之和；
+    - 单字检索词按索引词前缀匹配。
+    """
+    normalized = query_text(keyword)
+    matches = ApplicationSearchTerm.objects.filter(application__in=queryset.values("id"))
+    if len(normalized) == 1:
+        matches = matches.filter(term__startswith=normalized)
+        ranked = matches.values("application_id").annotate(score=Sum("weight"))
+    else:
+        terms = text_terms(normalized) - {normalized[-1]}
+        ranked = (
+            matches.filter(term__in=terms)
+            .values("application_id")
+            .annotate(matched=Count("term"), score=Sum("weight"))
+            .filter(matched=len(terms))
+        )
+    return ranked.order_by("-score", "-application_id")
+
+
+def highlight_application(application: Application, keyword: str) -> list[dict]:
+    """按检索字段顺序返回命中片段；matches 为关键词在 snippet 中的 [起, 止) 位置。"""
+    normalized_query = query_text(keyword)
+    if not normalized_query:
+        return []
+    highlights = []
+    for field, label, _ in SEARCH_FIELDS:
+        text = field_text(application, field)
+        normalized, positions = _normalize(text)
+        spans = []
+        start = normalized.find(normalized_query)
+        while start >= 0:
+            end = start + len(normalized_query) - 1
+            spans.append((positions[start], positions[end] + 1))
+            start = normalized.find(normalized_query, start + len(normalized_query))
+        if not spans:
+            continue
+        snippet_start = max(spans[0][0] - SNIPPET_RADIUS, 0)
+        snippet_end = min(spans[0][1] + SNIPPET_RADIUS, len(text))
+        highlights.append(
+            {
+                "field": field,
+                "label": label,
+                "snippet": text[snippet_start:snippet_end],
+                "matches": [
+                    [span_start - snippet_start, span_end - snippet_start]
+                    for span_start, span_end in spans
+                    if span_end <= snippet_end
+                ],
+                "truncated_before": snippet_start > 0,
+                "truncated_after": snippet_end < len(text),
+            }
+        )
+    return highlights
@@ -0,0 +1,111 @@
+"""请求级 SQL 剖析：通过 connection.execute_wrapper 统计单个请求的查询次数、耗时、最慢语句与重复查询。"""
+
+from __future__ import annotations
+
+import heapq
+import random
+import time
+from collections import Counter
+from typing import Any
+
+from django.conf import settings
+
+# 日志中单条 SQL 的最大保留长度。
+SQL_TEXT_MAX_LEN = 200
+
+
+def sql_profiling_enabled() -> bool:
+    return bool(getattr(settings, "REQUEST_SQL_PROFILING_ENABLED", False))
+
+
+def sql_profiling_sample_percent() -> int:
+    return min(max(int(getattr(settings, "REQUEST_SQL_PROFILING_SAMPLE_PERCENT", 10) or 0), 0), 100)
+
+
+def sql_profiling_slow_top() -> int:
+    return max(int(getattr(settings, "REQUEST_SQL_PROFILING_SLOW_TOP", 3) or 0), 0)
+
+
+def should_profile_request() -> bool:
+    """开关开启后按采样百分比决定本次请求是否剖析，控制线上开销。"""
+    if not sql_profiling_enabled():
+        return False
+    percent = sql_profiling_sample_percent()
+    if percent >= 100:
+        return True
+    return percent > 0 and random.random() * 100 < percent
+
+
+def _params_key(params: Any) -> str:
+    try:
+        return repr(params)
+    except Exception:
+        return ""
+
+
+class SqlProfiler:
+    """execute_wrapper 回调：只记录统计信息，不修改 SQL 执行行为。"""
+
+    def __init__(self, *, slow_top: int | None = None):
+        self.slow_top = sql_profiling_slow_top() if slow_top is None else max(int(slow_top), 0)
+        self.count = 0
+        self.total_seconds = 0.0
+        self._slowest: list[tuple[float, int, str]] = []
+        self._statements: Counter[str] = Counter()
+        self._exact: Counter[tuple[str, str]] = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self._record(str(sql), params, time.perf_counter() - started)
+
+    def _record(self, sql: str, params: Any, seconds: float):
+        self.count += 1
+        self.total_seconds += seconds
+        self._statements[sql] += 1
+        self._exact[(sql, _params_key(params))] += 1
+        if self.slow_top:
+            item = (seconds, self.count, sql[:SQL_TEXT_MAX_LEN])
+            if len(self._slowest) < self.slow_top:
+                heapq.heappush(self._slowest, item)
+            else:
+                heapq.heappushpop(self._slowest, item)
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_seconds * 1000
+
+    @property
+    def duplicate_count(self) -> int:
+        """SQL 与参数完全相同的重复执行次数（首次不计）。"""
+        return sum(count - 1 for count in self._exact.values() if count > 1)
+
+    @property
+    def max_repeat(self) -> int:
+        """同一 SQL 模板（忽略参数）的最大执行次数；明显大于 1 通常意味着 N+1。"""
+        return max(self._statements.values(), default=0)
+
+    def slowest(self) -> list[dict[str, Any]]:
+        return [
+            {"ms": round(seconds * 1000, 2), "sql": sql}
+            for seconds, _, sql in sorted(self._slowest, key=lambda item: (-item[0], item[1]))
+        ]
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "sql_count": self.count,
+            "sql_ms": round(self.total_ms, 2),
+            "sql_dup": self.duplicate_count,
+            "sql_max_repeat": self.max_repeat,
+            "sql_slowest": self.slowest(),
+        }
+
+    def server_timing(self, *, total_ms: float) -> str:
+        app_ms = max(total_ms - self.total_ms, 0.0)
+        return (
+            f'db;dur={self.total_ms:.2f};desc="{self.count} queries", '
+            f"app;dur={app_ms:.2f}, "
+            f"total;dur={total_ms:.2f}"
+        )
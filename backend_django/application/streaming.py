@@ -0,0 +1,38 @@
+"""流式 JSON 输出：逐行序列化并分块写出数组，内存占用与总行数无关。"""
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator
+
+from rest_framework.utils.encoders import JSONEncoder
+
+# 攒够约 32KB 再写出一块，避免逐行写 socket。
+STREAM_FLUSH_BYTES = 32 * 1024
+_EMPTY = object()
+
+
+def iter_json_array(
+    objects: Iterable[Any],
+    to_representation: Callable[[Any], Any],
+    *,
+    flush_bytes: int = STREAM_FLUSH_BYTES,
+) -> Iterator[bytes]:
+    """把 objects 逐个转换后输出为 JSON 数组字节块；编码方式与 DRF JSONRenderer 默认一致。"""
+    encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    iterator = iter(objects)
+    first = next(iterator, _EMPTY)
+    if first is _EMPTY:
+        yield b"[]"
+        return
+    # 首行立即写出，客户端尽快收到首字节；之后攒够 flush_bytes 再写出一块。
+    yield ("[" + encoder.encode(to_representation(first))).encode("utf-8")
+    buffer: list[str] = []
+    buffered = 0
+    for obj in iterator:
+        chunk = "," + encoder.encode(to_representation(obj))
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= flush_bytes:
+            yield "".join(buffer).encode("utf-8")
+            buffer, buffered = [], 0
+    buffer.append("]")
+    yield "".join(buffer).encode("utf-8")
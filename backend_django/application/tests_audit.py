@@ -0,0 +1,112 @@
+"""操作日志批量写入测试：请求内缓冲、一次写入、事务回滚丢弃与写入失败隔离。"""
+import queue
+import threading
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from .audit import _drain_async_queue_at_exit, _wait_async_queue, operation_log_batch, write_operation_log
+from .models import OperationLog, Region, UserProfile
+
+
+class OperationLogBatchTests(TestCase):
+    def setUp(self):
+        self.region = Region.objects.create(name="测试地区", code="audit-region")
+        self.user = get_user_model().objects.create_user(username="auditor", password="pass123456")
+
+    def _write(self, action: str):
+        write_operation_log(user=self.user, module="system", action=action, region=self.region)
+
+    def _inserts(self, queries) -> list[str]:
+        table = OperationLog._meta.db_table
+        return [item["sql"] for item in queries if item["sql"].startswith("INSERT") and table in item["sql"]]
+
+    def test_logs_in_batch_are_written_with_single_insert(self):
+        with CaptureQueriesContext(connection) as queries:
+            with operation_log_batch():
+                for index in range(5):
+                    self._write(f"action_{index}")
+                self.assertEqual(OperationLog.objects.count(), 0)
+
+        self.assertEqual(len(self._inserts(queries.captured_queries)), 1)
+        self.assertEqual(
+            list(OperationLog.objects.order_by("id").values_list("action", flat=True)),
+            [f"action_{index}" for index in range(5)],
+        )
+
+    def test_logs_from_rolled_back_transaction_are_dropped(self):
+        with operation_log_batch():
+            self._write("kept")
+            try:
+                with transaction.atomic():
+                    self._write("rolled_back")
+                    raise RuntimeError("rollback")
+            except RuntimeError:
+                pass
+            with transaction.atomic():
+                self._write("committed")
+
+        self.assertEqual(
+            sorted(OperationLog.objects.values_list("action", flat=True)),
+            ["committed", "kept"],
+        )
+
+    def test_bulk_failure_falls_back_to_per_row_writes(self):
+        with mock.patch.object(OperationLog.objects, "bulk_create", side_effect=RuntimeError("db down")):
+            with self.assertLogs("application.audit", "WARNING"), operation_log_batch():
+                self._write("first")
+                self._write("second")
+
+        self.assertEqual(OperationLog.objects.count(), 2)
+
+    def test_write_failure_does_not_break_business_transaction(self):
+        with mock.patch.object(OperationLog, "save", side_effect=RuntimeError("db down")):
+            with mock.patch.object(OperationLog.objects, "bulk_create", side_effect=RuntimeError("db down")):
+                with self.assertLogs("application.audit", "WARNING"), operation_log_batch():
+                    self._write("lost")
+        # 日志写入失败被吞掉，当前事务仍可继续使用。
+        self.assertTrue(Region.objects.filter(pk=self.region.pk).exists())
+        self.assertEqual(OperationLog.objects.count(), 0)
+
+    def test_operator_region_is_resolved_once_per_user(self):
+        UserProfile.objects.create(user=self.user, region=self.region, can_view_all=False)
+        user = get_user_model().objects.get(pk=self.user.pk)
+        # profile 1 + 地区 1 + 批量写入（含保存点）3，逐条日志不再重复读取。
+        with self.assertNumQueries(5), operation_log_batch():
+            for index in range(5):
+                write_operation_log(user=user, module="system", action=f"scoped_{index}")
+
+        logs = OperationLog.objects.all()
+        self.assertEqual({log.region_id for log in logs}, {self.region.id})
+        self.assertEqual({log.operator_role for log in logs}, {"regional_admin"})
+        self.assertEqual({log.operator_region_name for log in logs}, {"测试地区"})
+
+
+class OperationLogAsyncExitTests(SimpleTestCase):
+    def test_exit_waits_for_queued_logs_to_be_written(self):
+        work_queue = queue.Queue()
+        work_queue.put(["log"])
+        written = []
+
+        def writer():
+            written.append(work_queue.get())
+            work_queue.task_done()
+
+        threading.Timer(0.05, writer).start()
+        _drain_async_queue_at_exit(work_queue)
+
+        self.assertEqual(written, [["log"]])
+        self.assertEqual(work_queue.unfinished_tasks, 0)
+
+    @override_settings(OPERATION_LOG_ASYNC_EXIT_TIMEOUT_SECONDS=0.05)
+    def test_exit_wait_is_bounded_and_reports_unwritten_batches(self):
+        work_queue = queue.Queue()
+        work_queue.put(["log"])
+
+        self.assertFalse(_wait_async_queue(work_queue, 0.05))
+        with self.assertLogs("application.audit", "ERROR") as captured:
+            _drain_async_queue_at_exit(work_queue)
+        self.assertIn("pending_batches=1", captured.output[0])
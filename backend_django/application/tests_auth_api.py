@@ -8,10 +8,12 @@ from django.core.cache import cache
 from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
+from rest_framework import exceptions
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
 
-from .models import Region
+from .authentication import ExpiringTokenAuthentication
+from .models import Region, UserProfile
 
 
 class AuthHardeningApiTests(APITestCase):
@@ -153,6 +155,64 @@ class AuthHardeningApiTests(APITestCase):
         self.assertEqual(throttled_response.status_code, 429)
 
 
+class AuthTokenCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.region = Region.objects.create(name="认证缓存地区", code="auth-cache")
+        self.other_region = Region.objects.create(name="认证缓存其他地区", code="auth-cache-other")
+        self.user = get_user_model().objects.create_user(username="auth_cache_user", password="StrongPass#123")
+        self.profile = UserProfile.objects.create(user=self.user, region=self.region, can_view_all=False)
+        self.token = Token.objects.create(user=self.user)
+        self.auth = ExpiringTokenAuthentication()
+
+    def test_cache_hit_authenticates_and_scopes_without_queries(self):
+        with self.assertNumQueries(1):
+            self.auth.authenticate_credentials(self.token.key)
+        with self.assertNumQueries(0):
+            user, token = self.auth.authenticate_credentials(self.token.key)
+            self.assertEqual(token.key, self.token.key)
+            self.assertEqual(user.pk, self.user.pk)
+            self.assertFalse(user.is_superuser)
+            self.assertEqual(user.profile.region_id, self.region.id)
+            self.assertFalse(user.profile.can_view_all)
+        # 未缓存字段按需读取。
+        self.assertTrue(user.check_password("StrongPass#123"))
+
+    def test_profile_and_user_changes_invalidate_cache(self):
+        self.auth.authenticate_credentials(self.token.key)
+        self.profile.region = self.other_region
+        self.profile.save()
+        user, _ = self.auth.authenticate_credentials(self.token.key)
+        self.assertEqual(user.profile.region_id, self.other_region.id)
+
+        self.profile.delete()
+        user, _ = self.auth.authenticate_credentials(self.token.key)
+        self.assertIsNone(getattr(user, "profile", None))
+
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+
+    def test_logout_and_user_deletion_revoke_cached_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        self.assertEqual(self.client.get(reverse("auth-me")).status_code, 200)
+        self.assertEqual(self.client.post(reverse("auth-logout"), data={}, format="json").status_code, 200)
+        self.assertEqual(self.client.get(reverse("auth-me")).status_code, 401)
+
+        token = Token.objects.create(user=self.user)
+        self.auth.authenticate_credentials(token.key)
+        self.user.delete()
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials(token.key)
+
+    @override_settings(AUTH_TOKEN_CACHE_ENABLED=False)
+    def test_disabled_cache_queries_every_request(self):
+        self.auth.authenticate_credentials(self.token.key)
+        with self.assertNumQueries(1):
+            self.auth.authenticate_credentials(self.token.key)
+
+
 class OASSOApiTests(APITestCase):
     def setUp(self):
         cache.clear()
@@ -0,0 +1,235 @@
+"""批量操作任务测试：分块执行、逐条结果、断点续跑、地区范围与接口轮询。"""
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from .batch_jobs import claim_batch_jobs, enqueue_batch_job, run_batch_job
+from .models import Application, BatchOperationJob, InterviewCandidate, Job, OperationLog, Region, UserProfile
+
+
+@override_settings(BATCH_JOB_CHUNK_SIZE=2)
+class BatchOperationJobTests(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.region = Region.objects.create(name="批量任务区域", code="batch-job-region")
+        self.other_region = Region.objects.create(name="其他区域", code="batch-job-other")
+        self.job = Job.objects.create(region=self.region, title="批量任务岗位")
+        self.other_job = Job.objects.create(region=self.other_region, title="其他岗位")
+        self.user = user_model.objects.create_user(username="batch_job_tester", password="123456")
+        UserProfile.objects.create(user=self.user, region=self.region, can_view_all=False)
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self._seq = 0
+
+    def _create_application(self, *, job=None) -> Application:
+        self._seq += 1
+        job = job or self.job
+        return Application.objects.create(
+            region=job.region,
+            job=job,
+            name=f"批量候选人{self._seq}",
+            gender="男",
+            phone=f"1380000{self._seq:04d}",
+        )
+
+    def _create_passed_candidate(self, **extra) -> InterviewCandidate:
+        return InterviewCandidate.objects.create(
+            application=self._create_application(),
+            status=InterviewCandidate.STATUS_COMPLETED,
+            result=InterviewCandidate.RESULT_PASS,
+            **extra,
+        )
+
+    def test_interview_pool_add_runs_in_chunks_with_item_outcomes(self):
+        apps = [self._create_application() for _ in range(4)]
+        InterviewCandidate.objects.create(application=apps[0])
+        foreign = self._create_application(job=self.other_job)
+        item_ids = [app.id for app in apps] + [foreign.id]
+        job = enqueue_batch_job(
+            action=BatchOperationJob.ACTION_INTERVIEW_POOL_ADD,
+            item_ids=item_ids,
+            region_scope=self.region.id,
+            user=self.user,
+        )
+        self.assertEqual(claim_batch_jobs(limit=5, worker_name="test"), [job.id])
+
+        job = run_batch_job(job.id)
+
+        self.assertEqual(job.status, BatchOperationJob.STATUS_SUCCESS)
+        self.assertEqual(job.processed, 5)
+        self.assertEqual(job.outcome_counts, {"existing": 1, "added": 3, "missing": 1})
+        self.assertEqual(job.outcomes[str(foreign.id)], "missing")
+        self.assertFalse(InterviewCandidate.objects.filter(application=foreign).exists())
+        self.assertEqual(InterviewCandidate.objects.filter(application__region=self.region).count(), 4)
+        self.assertEqual(OperationLog.objects.filter(action="ADD_TO_INTERVIEW_POOL").count(), 4)
+        summary_log = OperationLog.objects.get(action="BATCH_ADD_TO_INTERVIEW_POOL")
+        self.assertEqual(summary_log.details["batch_job_id"], job.id)
+
+    def test_rows_skipped_by_insert_conflict_are_not_reported_as_added(self):
+        apps = [self._create_application() for _ in range(2)]
+        job = enqueue_batch_job(
+            action=BatchOperationJob.ACTION_INTERVIEW_POOL_ADD,
+            item_ids=[app.id for app in apps],
+            region_scope=None,
+            user=self.user,
+        )
+        claim_batch_jobs(limit=1, worker_name="test")
+        original_bulk_create = InterviewCandidate.objects.bulk_create
+
+        def conflicting_bulk_create(objs, **kwargs):
+            # 模拟首条与并发写入的同一应聘记录冲突、被 ignore_conflicts 跳过。
+            return original_bulk_create([obj for obj in objs if obj.application_id != apps[0].id], **kwargs)
+
+        with mock.patch.object(InterviewCandidate.objects, "bulk_create", side_effect=conflicting_bulk_create):
+            job = run_batch_job(job.id)
+
+        self.assertEqual(job.outcomes, {str(apps[0].id): "existing", str(apps[1].id): "added"})
+        added = {
+            log.details["application_id"]: log.details["added"]
+            for log in OperationLog.objects.filter(action="ADD_TO_INTERVIEW_POOL")
+        }
+        self.assertEqual(added, {apps[0].id: False, apps[1].id: True})
+
+    def test_failed_chunk_keeps_committed_progress_and_resumes(self):
+        candidates = [self._create_passed_candidate() for _ in range(5)]
+        job = enqueue_batch_job(
+            action=BatchOperationJob.ACTION_CONFIRM_HIRE,
+            item_ids=[item.id for item in candidates],
+            region_scope=None,
+            user=self.user,
+        )
+        original_bulk_update = InterviewCandidate.objects.bulk_update
+        calls = {"count": 0}
+
+        def flaky_bulk_update(*args, **kwargs):
+            calls["count"] += 1
+            if calls["count"] == 2:
+                raise RuntimeError("db gone")
+            return original_bulk_update(*args, **kwargs)
+
+        with mock.patch.object(InterviewCandidate.objects, "bulk_update", side_effect=flaky_bulk_update):
+            with self.assertLogs("application.batch_jobs", "ERROR"):
+                failed = run_batch_job(job.id)
+
+        self.assertEqual(failed.status, BatchOperationJob.STATUS_FAILED)
+        self.assertEqual(failed.processed, 2)
+        self.assertEqual(
+            InterviewCandidate.objects.filter(offer_status=InterviewCandidate.OFFER_STATUS_ISSUED).count(),
+            2,
+        )
+
+        resumed = run_batch_job(job.id)
+        self.assertEqual(resumed.status, BatchOperationJob.STATUS_SUCCESS)
+        self.assertEqual(resumed.processed, 5)
+        self.assertEqual(resumed.outcome_counts, {"confirmed": 5})
+        self.assertEqual(OperationLog.objects.filter(action="CONFIRM_HIRE").count(), 5)
+
+    def test_worker_stops_when_job_is_reclaimed_by_another_worker(self):
+        apps = [self._create_application() for _ in range(4)]
+        job = enqueue_batch_job(
+            action=BatchOperationJob.ACTION_INTERVIEW_POOL_ADD,
+            item_ids=[app.id for app in apps],
+            region_scope=None,
+            user=self.user,
+        )
+        claim_batch_jobs(limit=1, worker_name="worker-a")
+        original_bulk_create = InterviewCandidate.objects.bulk_create
+
+        def reclaim_during_chunk(*args, **kwargs):
+            # 模拟本块执行期间任务超时回队并被 worker-b 重新领取。
+            BatchOperationJob.objects.filter(pk=job.pk).update(locked_by="worker-b")
+            return original_bulk_create(*args, **kwargs)
+
+        with mock.patch.object(InterviewCandidate.objects, "bulk_create", side_effect=reclaim_during_chunk):
+            with self.assertLogs("application.batch_jobs", "WARNING"):
+                stopped = run_batch_job(job.id)
+
+        self.assertEqual(stopped.processed, 0)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.processed, job.locked_by), (BatchOperationJob.STATUS_RUNNING, 0, "worker-a"))
+        self.assertFalse(InterviewCandidate.objects.filter(application__in=apps).exists())
+        self.assertFalse(OperationLog.objects.filter(action__contains="INTERVIEW_POOL").exists())
+
+    def test_confirm_hire_reports_ineligible_items_without_blocking_others(self):
+        eligible = self._create_passed_candidate()
+        issued = self._create_passed_candidate(offer_status=InterviewCandidate.OFFER_STATUS_ISSUED)
+        pending = InterviewCandidate.objects.create(application=self._create_application())
+        job = enqueue_batch_job(
+            action=BatchOperationJob.ACTION_CONFIRM_HIRE,
+            item_ids=[eligible.id, issued.id, pending.id],
+            region_scope=self.region.id,
+            user=self.user,
+        )
+
+        job = run_batch_job(job.id)
+
+        self.assertEqual(
+            job.outcomes,
+            {
+                str(eligible.id): "confirmed",
+                str(issued.id): "invalid_offer_status",
+                str(pending.id): "invalid_state",
+            },
+        )
+        eligible.refresh_from_db()
+        self.assertEqual(eligible.offer_status, InterviewCandidate.OFFER_STATUS_ISSUED)
+
+    def test_api_enqueues_and_polls_progress(self):
+        candidates = [InterviewCandidate.objects.create(application=self._create_application()) for _ in range(3)]
+        response = self.client.post(
+            reverse("admin-batch-jobs"),
+            data={"action": "interview_pool_remove", "ids": [item.id for item in candidates]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 202)
+        job_id = response.json()["id"]
+        self.assertEqual(response.json()["status"], BatchOperationJob.STATUS_QUEUED)
+        self.assertEqual(InterviewCandidate.objects.count(), 3)
+
+        run_batch_job(job_id)
+
+        detail = self.client.get(reverse("admin-batch-job-detail", kwargs={"pk": job_id}))
+        self.assertEqual(detail.status_code, 200)
+        payload = detail.json()
+        self.assertEqual(payload["status"], BatchOperationJob.STATUS_SUCCESS)
+        self.assertEqual(payload["processed"], 3)
+        self.assertEqual(payload["outcome_counts"], {"removed": 3})
+        self.assertEqual(InterviewCandidate.objects.count(), 0)
+
+        light = self.client.get(f"{reverse('admin-batch-job-detail', kwargs={'pk': job_id})}?include_outcomes=0")
+        self.assertNotIn("outcomes", light.json())
+        listing = self.client.get(reverse("admin-batch-jobs"))
+        self.assertEqual([item["id"] for item in listing.json()], [job_id])
+
+    @override_settings(BATCH_JOB_QUEUE_ENABLED=False, BATCH_JOB_MAX_ITEMS=3)
+    def test_api_runs_inline_when_queue_disabled_and_enforces_max_items(self):
+        apps = [self._create_application() for _ in range(3)]
+        response = self.client.post(
+            reverse("admin-batch-jobs"),
+            data={"action": "interview_pool_add", "ids": [app.id for app in apps]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], BatchOperationJob.STATUS_SUCCESS)
+        self.assertEqual(response.json()["outcome_counts"], {"added": 3})
+
+        too_many = self.client.post(
+            reverse("admin-batch-jobs"),
+            data={"action": "interview_pool_add", "ids": [1, 2, 3, 4]},
+            format="json",
+        )
+        self.assertEqual(too_many.status_code, 400)
+
+    def test_other_users_cannot_poll_job(self):
+        job = enqueue_batch_job(
+            action=BatchOperationJob.ACTION_INTERVIEW_POOL_ADD,
+            item_ids=[1],
+            region_scope=self.region.id,
+            user=None,
+        )
+        response = self.client.get(reverse("admin-batch-job-detail", kwargs={"pk": job.id}))
+        self.assertEqual(response.status_code, 404)
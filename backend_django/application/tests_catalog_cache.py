@@ -0,0 +1,80 @@
+"""公开目录缓存测试：缓存命中零查询、条件请求 304、模型变更与批量上下架后失效。"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from .models import Job, Region, RegionField
+
+
+class PublicCatalogCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.region = Region.objects.create(name="目录缓存地区", code="catalog-cache")
+        RegionField.objects.create(region=self.region, key="height", label="身高", field_type="text")
+        self.job = Job.objects.create(region=self.region, title="目录缓存岗位")
+
+    def test_cached_catalog_serves_without_queries(self):
+        for url in (reverse("regions"), reverse("jobs"), reverse("job-detail", kwargs={"pk": self.job.id})):
+            with self.subTest(url=url):
+                first = self.client.get(url)
+                self.assertEqual(first.status_code, 200)
+                with self.assertNumQueries(0):
+                    second = self.client.get(url)
+                self.assertEqual(second.json(), first.json())
+                self.assertEqual(second["ETag"], first["ETag"])
+                self.assertIn("no-cache", second["Cache-Control"])
+
+    def test_conditional_request_returns_not_modified(self):
+        first = self.client.get(reverse("jobs"), {"region_id": self.region.id})
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                reverse("jobs"),
+                {"region_id": self.region.id},
+                HTTP_IF_NONE_MATCH=first["ETag"],
+            )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], first["ETag"])
+
+        since = self.client.get(reverse("jobs"), HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        self.assertEqual(since.status_code, 304)
+
+    def test_model_changes_invalidate_catalog(self):
+        first = self.client.get(reverse("jobs"))
+        self.job.title = "目录缓存岗位（更新）"
+        self.job.save()
+
+        response = self.client.get(reverse("jobs"), HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertEqual(response.json()[0]["title"], "目录缓存岗位（更新）")
+
+        RegionField.objects.filter(region=self.region).delete()
+        regions = self.client.get(reverse("regions")).json()
+        self.assertEqual(regions[0]["region_fields"], [])
+
+    def test_batch_status_update_invalidates_catalog(self):
+        admin = get_user_model().objects.create_superuser(username="catalog_admin", password="123456")
+        token, _ = Token.objects.get_or_create(user=admin)
+        self.assertEqual(len(self.client.get(reverse("jobs")).json()), 1)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        response = self.client.post(
+            reverse("admin-jobs-batch-status"),
+            data={"job_ids": [self.job.id], "is_active": False},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.client.credentials()
+
+        self.assertEqual(self.client.get(reverse("jobs")).json(), [])
+        self.assertEqual(self.client.get(reverse("job-detail", kwargs={"pk": self.job.id})).status_code, 404)
+
+    @override_settings(PUBLIC_CATALOG_CACHE_ENABLED=False)
+    def test_disabled_cache_queries_every_request(self):
+        self.client.get(reverse("regions"))
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("regions"))
+        self.assertNotIn("ETag", response)
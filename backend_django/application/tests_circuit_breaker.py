@@ -0,0 +1,177 @@
+"""外部依赖熔断测试：覆盖失败率熔断、半开探测、OA/短信快速失败与管理端元信息接口。"""
+from unittest import mock
+
+import requests
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from .circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    get_circuit_breaker,
+    reset_circuit_breakers,
+)
+from .interview_sms import _send_via_aliyun
+from .models import Region, UserProfile
+from .oa_client import OACircuitOpenError, oa_post
+
+_BREAKER_SETTINGS = {
+    "CIRCUIT_BREAKER_ENABLED": True,
+    "CIRCUIT_BREAKER_WINDOW_SECONDS": 60,
+    "CIRCUIT_BREAKER_MIN_REQUESTS": 4,
+    "CIRCUIT_BREAKER_FAILURE_PERCENT": 50,
+    "CIRCUIT_BREAKER_OPEN_SECONDS": 30,
+    "CIRCUIT_BREAKER_MAX_OPEN_SECONDS": 100,
+}
+_SMS_SETTINGS = {
+    "ALIYUN_SMS_ACCESS_KEY_ID": "ak",
+    "ALIYUN_SMS_ACCESS_KEY_SECRET": "secret",
+    "ALIYUN_SMS_SIGN_NAME": "签名",
+    "ALIYUN_SMS_TEMPLATE_CODE": "SMS_001",
+}
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+@override_settings(**_BREAKER_SETTINGS)
+class CircuitBreakerTests(SimpleTestCase):
+    def setUp(self):
+        # 用例会推进模拟时钟，直接清空缓存，避免残留时间窗计数影响后续用例。
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.clock = mock.patch("application.circuit_breaker.time.time", return_value=1_000_000.0)
+        self.mocked_time = self.clock.start()
+        self.addCleanup(self.clock.stop)
+
+    def _trip(self, breaker):
+        for _ in range(4):
+            breaker.record_failure()
+
+    def test_opens_after_failure_ratio_and_min_requests(self):
+        breaker = get_circuit_breaker("oa:create_request")
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        self.assertEqual(breaker.snapshot()["state"], STATE_CLOSED)
+
+        breaker.record_failure()
+        snapshot = breaker.snapshot()
+        self.assertEqual(snapshot["state"], STATE_OPEN)
+        self.assertEqual(snapshot["retry_after_seconds"], 30)
+        self.assertFalse(breaker.allow_request())
+        # 端点之间互不影响。
+        self.assertTrue(get_circuit_breaker("oa:applytoken").allow_request())
+
+    def test_half_open_allows_single_probe_and_closes_on_success(self):
+        breaker = get_circuit_breaker("oa:create_request")
+        self._trip(breaker)
+        self.mocked_time.return_value += 31
+
+        self.assertEqual(breaker.snapshot()["state"], STATE_HALF_OPEN)
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+
+        breaker.record_success()
+        self.assertEqual(breaker.snapshot()["state"], STATE_CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+    def test_failed_probe_doubles_open_duration_up_to_max(self):
+        breaker = get_circuit_breaker("sms:aliyun")
+        self._trip(breaker)
+        for expected in (60, 100, 100):
+            self.mocked_time.return_value += 200
+            self.assertTrue(breaker.allow_request())
+            breaker.record_failure()
+            snapshot = breaker.snapshot()
+            self.assertEqual(snapshot["state"], STATE_OPEN)
+            self.assertEqual(snapshot["open_seconds"], expected)
+
+    @override_settings(CIRCUIT_BREAKER_ENABLED=False)
+    def test_disabled_breaker_always_allows(self):
+        breaker = get_circuit_breaker("oa:create_request")
+        self._trip(breaker)
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.snapshot()["state"], STATE_CLOSED)
+
+    @mock.patch("application.oa_client.get_oa_session")
+    def test_oa_post_fails_fast_without_http_call_when_open(self, mocked_session):
+        session = mocked_session.return_value
+        session.post.side_effect = requests.ConnectionError("refused")
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                oa_post("https://oa.example.com/x", breaker="oa:create_request")
+        session.post.side_effect = None
+        session.post.return_value = _FakeResponse(503)
+        for _ in range(2):
+            oa_post("https://oa.example.com/x", breaker="oa:create_request")
+        self.assertEqual(session.post.call_count, 4)
+
+        with self.assertRaises(OACircuitOpenError) as ctx:
+            oa_post("https://oa.example.com/x", breaker="oa:create_request")
+        self.assertIsInstance(ctx.exception, requests.RequestException)
+        self.assertEqual(session.post.call_count, 4)
+
+    @override_settings(**_SMS_SETTINGS)
+    @mock.patch("application.interview_sms._get_aliyun_client")
+    def test_sms_fails_fast_when_open(self, mocked_client):
+        mocked_client.return_value.do_action_with_exception.side_effect = OSError("timeout")
+        for _ in range(4):
+            result = _send_via_aliyun("13800000000", {"name": "张三"})
+            self.assertEqual(result.provider_message, "timeout")
+
+        result = _send_via_aliyun("13800000000", {"name": "张三"})
+        self.assertFalse(result.success)
+        self.assertEqual(result.provider_code, "SMS_REQUEST_ERROR")
+        self.assertIn("熔断", result.provider_message)
+        self.assertEqual(mocked_client.return_value.do_action_with_exception.call_count, 4)
+
+    @override_settings(**_SMS_SETTINGS)
+    @mock.patch("application.interview_sms._get_aliyun_client")
+    def test_sms_business_error_does_not_trip(self, mocked_client):
+        mocked_client.return_value.do_action_with_exception.return_value = (
+            b'{"Code": "isv.MOBILE_NUMBER_ILLEGAL", "Message": "bad phone"}'
+        )
+        for _ in range(5):
+            self.assertFalse(_send_via_aliyun("1", {}).success)
+        self.assertEqual(get_circuit_breaker("sms:aliyun").snapshot()["state"], STATE_CLOSED)
+
+
+@override_settings(**_BREAKER_SETTINGS)
+class AdminIntegrationMetaTests(APITestCase):
+    def setUp(self):
+        reset_circuit_breakers()
+        self.addCleanup(reset_circuit_breakers)
+        user_model = get_user_model()
+        self.region = Region.objects.create(name="熔断区域", code="breaker-region")
+        self.global_user = user_model.objects.create_user(username="breaker_global", password="123456")
+        UserProfile.objects.create(user=self.global_user, region=self.region, can_view_all=True)
+        self.region_user = user_model.objects.create_user(username="breaker_region", password="123456")
+        UserProfile.objects.create(user=self.region_user, region=self.region, can_view_all=False)
+
+    def _login(self, user):
+        token, _ = Token.objects.get_or_create(user=user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_meta_returns_breaker_states_for_global_user(self):
+        for _ in range(4):
+            get_circuit_breaker("oa:applytoken").record_failure()
+        self._login(self.global_user)
+        response = self.client.get(reverse("admin-integrations-meta"))
+        self.assertEqual(response.status_code, 200)
+        states = {item["name"]: item for item in response.data["circuit_breakers"]}
+        self.assertEqual(states["oa:applytoken"]["state"], STATE_OPEN)
+        self.assertEqual(states["sms:aliyun"]["state"], STATE_CLOSED)
+        self.assertEqual(response.data["circuit_breaker_config"]["min_requests"], 4)
+
+    def test_meta_is_forbidden_for_region_user(self):
+        self._login(self.region_user)
+        response = self.client.get(reverse("admin-integrations-meta"))
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,151 @@
+"""管理端列表条件请求测试：指纹未变返回 304 且不序列化，数据变更、账号与地区范围不同时 ETag 随之变化。"""
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from .models import Application, ApplicationAttachment, InterviewCandidate, Job, OperationLog, Region, UserProfile
+
+# 认证缓存命中后只剩指纹聚合 1 次。
+_NOT_MODIFIED_QUERIES = 1
+
+
+class AdminListConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.region = Region.objects.create(name="条件请求地区", code="etag-region")
+        self.other_region = Region.objects.create(name="条件请求其他地区", code="etag-other")
+        self.job = Job.objects.create(region=self.region, title="条件请求岗位")
+        self.other_job = Job.objects.create(region=self.other_region, title="其他地区岗位")
+        self.user = self._create_user("etag_tester", self.region)
+        self._login(self.user)
+        self._seq = 0
+
+    def _create_user(self, username: str, region: Region):
+        user = get_user_model().objects.create_user(username=username, password="123456")
+        UserProfile.objects.create(user=user, region=region, can_view_all=False)
+        return user
+
+    def _login(self, user):
+        token, _ = Token.objects.get_or_create(user=user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def _create_candidate(self, *, job=None) -> InterviewCandidate:
+        self._seq += 1
+        job = job or self.job
+        application = Application.objects.create(
+            region=job.region,
+            job=job,
+            name=f"条件请求候选人{self._seq}",
+            gender="男",
+            phone=f"1360000{self._seq:04d}",
+        )
+        return InterviewCandidate.objects.create(application=application)
+
+    def test_unchanged_list_returns_not_modified(self):
+        self._create_candidate()
+        url = reverse("admin-interview-candidates")
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first["ETag"].startswith('W/"'))
+        self.assertIn("no-cache", first["Cache-Control"])
+        self.assertIn("Authorization", first["Vary"])
+
+        with self.assertNumQueries(_NOT_MODIFIED_QUERIES):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], first["ETag"])
+        self.assertFalse(response.content)
+
+    def test_candidate_changes_update_etag(self):
+        candidate = self._create_candidate()
+        url = reverse("admin-interview-candidates")
+        etag = self.client.get(url)["ETag"]
+
+        candidate.status = InterviewCandidate.STATUS_SCHEDULED
+        candidate.save()
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], etag)
+
+        self._create_candidate()
+        added = self.client.get(url, HTTP_IF_NONE_MATCH=changed["ETag"])
+        self.assertEqual(added.status_code, 200)
+        self.assertEqual(len(added.json()), 2)
+
+    def test_query_params_and_scope_are_part_of_etag(self):
+        self._create_candidate()
+        self._create_candidate(job=self.other_job)
+        url = reverse("admin-interview-candidates")
+        etag = self.client.get(url)["ETag"]
+        self.assertNotEqual(self.client.get(url, {"keyword": "候选人"})["ETag"], etag)
+
+        # 不同账号即使结果集相同也不共享 ETag，避免跨账号命中缓存。
+        self._login(self._create_user("etag_peer", self.region))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+        self._login(self._create_user("etag_other", self.other_region))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_related_catalog_changes_update_etag(self):
+        self._create_candidate()
+        for name in ("admin-interview-candidates", "admin-applications"):
+            url = reverse(name)
+            etag = self.client.get(url)["ETag"]
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+            # 岗位改名不触及应聘记录/候选人行，列表中的岗位名仍须刷新。
+            self.job.title = f"{self.job.title}-改名"
+            self.job.save()
+            renamed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(renamed.status_code, 200)
+            self.assertNotEqual(renamed["ETag"], etag)
+
+    def test_deleting_older_attachment_updates_etag(self):
+        media_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(media_dir.cleanup)
+        media_override = override_settings(MEDIA_ROOT=media_dir.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
+        # 应聘记录列表不含已入面试池的记录，两个列表各用一条应聘记录。
+        pooled = self._create_candidate().application
+        applied = self._create_candidate()
+        applied.delete()
+        older_attachments = []
+        for application in (pooled, applied.application):
+            attachments = [
+                ApplicationAttachment.objects.create(
+                    application=application,
+                    category="photo",
+                    file=SimpleUploadedFile(f"photo{index}.jpg", b"data", content_type="image/jpeg"),
+                )
+                for index in range(2)
+            ]
+            older_attachments.append(attachments[0])
+        urls = [reverse("admin-interview-candidates"), reverse("admin-applications")]
+        etags = {url: self.client.get(url)["ETag"] for url in urls}
+
+        # 删除的不是主键最大的附件，最大值不变，须靠附件数与主键和识别。
+        for attachment in older_attachments:
+            attachment.delete()
+        for url in urls:
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etags[url]).status_code, 200)
+
+    def test_operation_log_list_changes_on_new_entry(self):
+        OperationLog.objects.create(module="interviews", action="ADD_TO_INTERVIEW_POOL", region=self.region)
+        url = reverse("admin-operation-logs")
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        OperationLog.objects.create(module="interviews", action="REMOVE_FROM_INTERVIEW_POOL", region=self.region)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    @override_settings(ADMIN_LIST_ETAG_ENABLED=False)
+    def test_disabled_setting_skips_fingerprint(self):
+        self._create_candidate()
+        response = self.client.get(reverse("admin-applications"))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
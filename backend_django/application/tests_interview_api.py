@@ -1,16 +1,22 @@
 """面试接口测试：覆盖拟面试/人才库流转与权限边界的关键行为。"""
+import json
 from datetime import timedelta
 from unittest import mock
 
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase
 
 from .interview_sms import SmsDispatchResult
-from .models import Application, InterviewCandidate, Job, OperationLog, Region, UserProfile
+from .models import Application, InterviewCandidate, InterviewRoundRecord, Job, OperationLog, Region, UserProfile
+from .serializers import InterviewOutcomeFastSerializer, InterviewPassedCandidateListSerializer
 
 
 class InterviewMetaApiTests(APITestCase):
@@ -93,6 +99,7 @@ class InterviewMetaApiTests(APITestCase):
         payload = response.json()
         self.assertIn("details", payload)
 
+    @override_settings(INTERVIEW_SMS_QUEUE_ENABLED=False)
     @mock.patch("application.api_views.interviews.actions_schedule.dispatch_interview_schedule_sms")
     def test_schedule_with_send_sms_calls_dispatch_and_returns_sms_payload(self, mocked_dispatch):
         candidate = self._create_candidate("短信候选人", "13800001119")
@@ -362,6 +369,7 @@ class InterviewMetaApiTests(APITestCase):
         self.assertEqual(snapshot.get("result_note"), "综合评估后进入下一轮")
         self.assertIsNotNone(snapshot.get("result_at"))
 
+    @override_settings(INTERVIEW_SMS_QUEUE_ENABLED=False)
     @mock.patch("application.api_views.interviews.actions_sms.dispatch_interview_schedule_sms")
     def test_resend_sms_endpoint_records_failed_log_result(self, mocked_dispatch):
         interview_at = timezone.now() + timedelta(hours=4)
@@ -519,6 +527,175 @@ class InterviewMetaApiTests(APITestCase):
         self.assertEqual(payload["count"], 2)
         self.assertEqual(len(payload["results"]), 1)
 
+    def _walk_cursor_pages(self, url):
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            payload = response.json()
+            self.assertEqual(set(payload), {"next", "previous", "results"})
+            pages.append(payload)
+            url = payload["next"]
+        return pages
+
+    def test_talent_pool_cursor_pagination_walks_ties_and_nulls_in_order(self):
+        same_result_at = timezone.now() - timedelta(days=1)
+        result_ats = [same_result_at, same_result_at, timezone.now(), None, same_result_at - timedelta(hours=1)]
+        for index, result_at in enumerate(result_ats):
+            candidate = self._create_candidate(
+                f"游标淘汰候选人{index}",
+                f"1380000555{index}",
+                status=InterviewCandidate.STATUS_COMPLETED,
+                result=InterviewCandidate.RESULT_REJECT,
+            )
+            InterviewCandidate.objects.filter(pk=candidate.pk).update(result_at=result_at)
+        expected_ids = list(
+            InterviewCandidate.objects.filter(result=InterviewCandidate.RESULT_REJECT)
+            .order_by("-result_at", "-updated_at", "-id")
+            .values_list("id", flat=True)
+        )
+
+        pages = self._walk_cursor_pages(
+            f"{reverse('admin-talent-pool-candidates')}?pagination=cursor&page_size=2"
+        )
+        self.assertEqual([len(page["results"]) for page in pages], [2, 2, 1])
+        self.assertEqual([item["id"] for page in pages for item in page["results"]], expected_ids)
+        self.assertIsNone(pages[0]["previous"])
+
+        previous = self.client.get(pages[-1]["previous"]).json()
+        self.assertEqual([item["id"] for item in previous["results"]], expected_ids[2:4])
+        self.assertIsNotNone(previous["next"])
+
+    def test_interview_pool_cursor_pagination_and_invalid_cursor(self):
+        same_created_at = timezone.now() - timedelta(days=1)
+        # 待安排与已安排混排：列表只按创建时间倒序、id 正序，不按状态分组。
+        rows = [
+            (same_created_at, None),
+            (timezone.now(), InterviewCandidate.STATUS_SCHEDULED),
+            (same_created_at, InterviewCandidate.STATUS_SCHEDULED),
+            (same_created_at - timedelta(hours=1), None),
+        ]
+        for index, (created_at, status) in enumerate(rows):
+            candidate = self._create_candidate(f"游标拟面试候选人{index}", f"1380000666{index}", status=status)
+            InterviewCandidate.objects.filter(pk=candidate.pk).update(created_at=created_at)
+        expected_ids = list(
+            InterviewCandidate.objects.filter(status__in=InterviewCandidate.IN_PROGRESS_STATUSES)
+            .order_by("-created_at", "id")
+            .values_list("id", flat=True)
+        )
+        pages = self._walk_cursor_pages(
+            f"{reverse('admin-interview-candidates')}?pagination=cursor&page_size=1"
+        )
+        self.assertEqual(len(pages), 4)
+        self.assertEqual([item["id"] for page in pages for item in page["results"]], expected_ids)
+        offset_page = self.client.get(f"{reverse('admin-interview-candidates')}?page=1&page_size=10").json()
+        self.assertEqual([item["id"] for item in offset_page["results"]], expected_ids)
+
+        response = self.client.get(f"{reverse('admin-interview-candidates')}?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(ADMIN_UNPAGINATED_LIST_MAX_ROWS=1)
+    def test_unpaginated_talent_pool_is_capped(self):
+        for index in range(2):
+            self._create_candidate(
+                f"截断淘汰候选人{index}",
+                f"1380000777{index}",
+                status=InterviewCandidate.STATUS_COMPLETED,
+                result=InterviewCandidate.RESULT_REJECT,
+            )
+
+        response = self.client.get(reverse("admin-talent-pool-candidates"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+        self.assertEqual(response["X-Result-Limit"], "1")
+        self.assertEqual(response["X-Result-Truncated"], "true")
+
+    @override_settings(ADMIN_UNPAGINATED_LIST_MAX_ROWS=1, ADMIN_LIST_STREAM_CHUNK_SIZE=2)
+    def test_stream_mode_returns_full_array_without_cap(self):
+        for index in range(3):
+            self._create_candidate(
+                f"流式淘汰候选人{index}",
+                f"1380000888{index}",
+                status=InterviewCandidate.STATUS_COMPLETED,
+                result=InterviewCandidate.RESULT_REJECT,
+            )
+        expected = self.client.get(f"{reverse('admin-talent-pool-candidates')}?page=1&page_size=10").json()
+
+        response = self.client.get(f"{reverse('admin-talent-pool-candidates')}?stream=1")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        payload = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(payload, expected["results"])
+
+    @override_settings(ADMIN_LIST_STREAM_CHUNK_SIZE=1)
+    def test_stream_mode_for_application_list_and_empty_result(self):
+        empty = self.client.get(f"{reverse('admin-applications')}?stream=1")
+        self.assertEqual(b"".join(empty.streaming_content), b"[]")
+
+        job = Job.objects.create(region=self.region, title="流式岗位")
+        for index in range(2):
+            Application.objects.create(
+                region=self.region,
+                job=job,
+                name=f"流式应聘者{index}",
+                gender="女",
+                phone=f"1390000999{index}",
+                wechat=f"wx_stream_{index}",
+            )
+        expected = self.client.get(reverse("admin-applications")).json()
+        response = self.client.get(f"{reverse('admin-applications')}?stream=1")
+        # 每批 1 行：按 (created_at, id) 逐批 seek，不漏行也不重复。
+        with CaptureQueriesContext(connection) as queries:
+            payload = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(payload, expected)
+        self.assertEqual(len(expected), 2)
+        self.assertEqual(sum("LIMIT 1" in query["sql"] for query in queries), 3)
+
+    def test_outcome_fast_serializer_matches_drf_serializer_json(self):
+        interview_at = timezone.now() - timedelta(days=3)
+        rounded = self._create_candidate(
+            "快速序列化候选人",
+            "13800009991",
+            status=InterviewCandidate.STATUS_COMPLETED,
+            result=InterviewCandidate.RESULT_PASS,
+            interview_round=2,
+            is_hired=True,
+            hired_at=timezone.now(),
+            oa_push_last_attempt_at=timezone.now(),
+            oa_push_error_message="超时",
+        )
+        InterviewRoundRecord.objects.create(
+            candidate=rounded,
+            round_no=1,
+            interview_at=interview_at,
+            interviewer="面试官甲",
+            score=88,
+            interviewer_scores=[{"interviewer": "面试官甲", "score": 88}],
+        )
+        InterviewRoundRecord.objects.create(candidate=rounded, round_no=2, interviewer="面试官乙")
+        self._create_candidate(
+            "无轮次候选人",
+            "13800009992",
+            status=InterviewCandidate.STATUS_COMPLETED,
+            result=InterviewCandidate.RESULT_PASS,
+        )
+        queryset = InterviewCandidate.objects.filter(result=InterviewCandidate.RESULT_PASS).order_by("id")
+
+        drf_rows = InterviewPassedCandidateListSerializer(
+            queryset.select_related("application__region", "application__job").prefetch_related("round_records"),
+            many=True,
+        ).data
+        with self.assertNumQueries(2):
+            fast_rows = InterviewOutcomeFastSerializer().serialize(queryset)
+        self.assertEqual(JSONRenderer().render(fast_rows), JSONRenderer().render(drf_rows))
+        self.assertEqual(fast_rows[0]["first_round_score"], 88)
+        self.assertEqual(fast_rows[1]["third_round_interviewer_scores"], [])
+        # 逐行分批 keyset 读取，输出与一次读取一致。
+        single_row_batches = InterviewOutcomeFastSerializer()
+        single_row_batches.batch_size = 1
+        self.assertEqual(list(single_row_batches.iter_rows(queryset)), fast_rows)
+
     def test_batch_add_talent_pool_moves_application_and_hides_from_application_list(self):
         job = Job.objects.create(region=self.region, title="人才库测试岗位")
         application = Application.objects.create(
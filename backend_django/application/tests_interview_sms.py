@@ -0,0 +1,167 @@
+"""面试短信队列测试：覆盖入队复用、worker 发送回写与接口入队行为。"""
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from .interview_flow import InterviewFlowError
+from .interview_sms import SmsDispatchResult
+from .interview_sms_queue import (
+    _ProviderRateLimiter,
+    claim_interview_sms_jobs,
+    enqueue_interview_sms,
+    run_interview_sms_job,
+)
+from .models import Application, InterviewCandidate, InterviewSmsJob, Job, OperationLog, Region, UserProfile
+
+
+class InterviewSmsQueueTests(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.region = Region.objects.create(name="短信队列区域", code="sms-queue-region")
+        self.job = Job.objects.create(region=self.region, title="短信岗位")
+        self.user = user_model.objects.create_user(username="sms_queue_tester", password="123456")
+        UserProfile.objects.create(user=self.user, region=self.region, can_view_all=False)
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def _create_candidate(self, name: str, **extra) -> InterviewCandidate:
+        application = Application.objects.create(
+            region=self.region,
+            job=self.job,
+            name=name,
+            gender="男",
+            phone="13800007771",
+            wechat=f"wx_{name}",
+        )
+        return InterviewCandidate.objects.create(application=application, **extra)
+
+    def _create_scheduled_candidate(self, name: str, **extra) -> InterviewCandidate:
+        return self._create_candidate(
+            name,
+            status=InterviewCandidate.STATUS_SCHEDULED,
+            interview_at=timezone.now() + timedelta(days=1),
+            interviewer="面试官A",
+            **extra,
+        )
+
+    def test_enqueue_marks_sending_and_reuses_queued_job(self):
+        candidate = self._create_scheduled_candidate("入队候选人")
+        queued_candidate, job = enqueue_interview_sms(candidate.id, user=self.user, request_id="req-sms-1")
+        self.assertEqual(queued_candidate.sms_status, InterviewCandidate.SMS_STATUS_SENDING)
+        self.assertEqual(job.provider, "aliyun")
+
+        _, second_job = enqueue_interview_sms(candidate.id, is_retry=True, user=self.user)
+        self.assertEqual(second_job.id, job.id)
+        self.assertEqual(InterviewSmsJob.objects.filter(candidate=candidate).count(), 1)
+
+    def test_enqueue_requires_scheduled_interview(self):
+        candidate = self._create_candidate("未安排候选人")
+        with self.assertRaises(InterviewFlowError):
+            enqueue_interview_sms(candidate.id)
+        self.assertFalse(InterviewSmsJob.objects.filter(candidate=candidate).exists())
+
+    @override_settings(INTERVIEW_SMS_RATE_PER_SECOND=0)
+    @mock.patch("application.interview_sms._send_interview_sms")
+    def test_worker_job_sends_and_records_result(self, mocked_send):
+        mocked_send.return_value = SmsDispatchResult(
+            success=True,
+            provider_code="OK",
+            provider_message="OK",
+            biz_id="biz-queue-1",
+        )
+        candidate = self._create_scheduled_candidate("后台短信候选人")
+        _, job = enqueue_interview_sms(candidate.id, user=self.user, request_id="req-sms-2")
+
+        self.assertEqual(claim_interview_sms_jobs(limit=10, worker_name="test-worker"), [job.id])
+        result = run_interview_sms_job(job.id)
+
+        self.assertTrue(result.success)
+        candidate.refresh_from_db()
+        job.refresh_from_db()
+        self.assertEqual(candidate.sms_status, InterviewCandidate.SMS_STATUS_SUCCESS)
+        self.assertEqual(candidate.sms_message_id, "biz-queue-1")
+        self.assertEqual(job.status, InterviewSmsJob.STATUS_SUCCESS)
+        log = OperationLog.objects.get(action="INTERVIEW_SMS_SUCCESS", target_id=str(candidate.id))
+        self.assertEqual(log.operator_id, self.user.id)
+        self.assertEqual(log.request_id, "req-sms-2")
+
+    @mock.patch("application.interview_sms._send_interview_sms")
+    def test_worker_skips_cancelled_interview(self, mocked_send):
+        candidate = self._create_scheduled_candidate("已取消候选人")
+        _, job = enqueue_interview_sms(candidate.id)
+        InterviewCandidate.objects.filter(pk=candidate.id).update(
+            status=InterviewCandidate.STATUS_PENDING,
+            interview_at=None,
+        )
+
+        claim_interview_sms_jobs(limit=10, worker_name="test-worker")
+        result = run_interview_sms_job(job.id)
+
+        mocked_send.assert_not_called()
+        self.assertFalse(result.success)
+        self.assertEqual(result.provider_code, "INTERVIEW_NOT_SCHEDULED")
+        job.refresh_from_db()
+        self.assertEqual(job.status, InterviewSmsJob.STATUS_FAILED)
+
+    @mock.patch("application.interview_sms._send_interview_sms")
+    def test_schedule_endpoint_enqueues_without_sending(self, mocked_send):
+        candidate = self._create_candidate("安排入队候选人")
+        response = self.client.post(
+            reverse("admin-interview-candidate-schedule", kwargs={"pk": candidate.id}),
+            data={
+                "interview_at": (timezone.now() + timedelta(days=2)).isoformat(),
+                "interviewers": ["面试官A"],
+                "interview_location": "线上会议",
+                "send_sms": True,
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["message"], "面试安排已保存，短信已加入发送队列")
+        self.assertTrue(payload["sms"]["queued"])
+        self.assertEqual(payload["candidate"]["sms_status"], InterviewCandidate.SMS_STATUS_SENDING)
+        mocked_send.assert_not_called()
+        self.assertTrue(
+            InterviewSmsJob.objects.filter(
+                id=payload["sms"]["job_id"],
+                candidate=candidate,
+                status=InterviewSmsJob.STATUS_QUEUED,
+            ).exists()
+        )
+
+    @mock.patch("application.interview_sms._send_interview_sms")
+    def test_resend_endpoint_enqueues_retry(self, mocked_send):
+        candidate = self._create_scheduled_candidate(
+            "重发入队候选人",
+            sms_status=InterviewCandidate.SMS_STATUS_FAILED,
+            sms_retry_count=1,
+        )
+        response = self.client.post(
+            reverse("admin-interview-candidate-resend-sms", kwargs={"pk": candidate.id}),
+            data={},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["message"], "短信已加入重发队列")
+        mocked_send.assert_not_called()
+        job = InterviewSmsJob.objects.get(candidate=candidate)
+        self.assertTrue(job.is_retry)
+        candidate.refresh_from_db()
+        self.assertEqual(candidate.sms_retry_count, 2)
+
+    def test_rate_limiter_waits_when_bucket_is_empty(self):
+        limiter = _ProviderRateLimiter()
+        with mock.patch("application.interview_sms_queue.time.sleep") as mocked_sleep:
+            limiter.acquire("aliyun", 1)
+            mocked_sleep.side_effect = lambda seconds: limiter._buckets.update({"aliyun": (1.0, 0.0)})
+            limiter.acquire("aliyun", 1)
+        mocked_sleep.assert_called_once()
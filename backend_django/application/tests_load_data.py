@@ -0,0 +1,73 @@
+"""压测数据生成测试：状态组合覆盖、轮次快照一致性与种子可复现。"""
+import tempfile
+from datetime import datetime
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .load_data import CANDIDATE_STATES, LoadDataConfig, LoadDataGenerator
+from .models import Application, ApplicationAttachment, InterviewCandidate, OperationLog
+
+
+class LoadDataGeneratorTests(TestCase):
+    def setUp(self):
+        media_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(media_dir.cleanup)
+        media_override = override_settings(MEDIA_ROOT=media_dir.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
+    def _generate(self, prefix: str, **overrides):
+        config = LoadDataConfig(
+            applications=300,
+            regions=2,
+            jobs_per_region=2,
+            interview_ratio=1.0,
+            media_files=2,
+            logs_per_application=1.5,
+            batch_size=120,
+            seed=7,
+            prefix=prefix,
+            anchor=timezone.make_aware(datetime(2024, 6, 1)),
+            **overrides,
+        )
+        return LoadDataGenerator(config).run()
+
+    def test_generates_every_candidate_state_with_consistent_round_records(self):
+        counts = self._generate("cover")
+
+        self.assertEqual(counts["applications"], 300)
+        self.assertEqual(counts["candidates"], 300)
+        self.assertEqual(OperationLog.objects.filter(details__source="load_data").count(), counts["operation_logs"])
+        self.assertTrue(ApplicationAttachment.objects.filter(category="photo").exists())
+        generated = set(InterviewCandidate.objects.values_list("status", "result").distinct())
+        self.assertEqual(generated, set(CANDIDATE_STATES.values()))
+        offer_statuses = set(
+            InterviewCandidate.objects.filter(result=InterviewCandidate.RESULT_PASS).values_list("offer_status", flat=True)
+        )
+        self.assertEqual(offer_statuses, {value for value, _ in InterviewCandidate.OFFER_STATUS_CHOICES})
+
+        for candidate in InterviewCandidate.objects.filter(status=InterviewCandidate.STATUS_COMPLETED).prefetch_related(
+            "round_records"
+        ):
+            records = list(candidate.round_records.all())
+            self.assertEqual([record.round_no for record in records], list(range(1, candidate.interview_round + 1)))
+            self.assertEqual(records[-1].result, candidate.result)
+        # 生成的历史时间不被 auto_now_add 覆盖。
+        self.assertLess(Application.objects.order_by("-created_at").first().created_at, timezone.now())
+        self.assertLess(OperationLog.objects.order_by("-created_at").first().created_at.year, 2025)
+
+    def test_same_seed_reproduces_same_content(self):
+        self._generate("first")
+        self._generate("second")
+
+        def snapshot(prefix):
+            return list(
+                Application.objects.filter(region__code__startswith=f"{prefix}-")
+                .order_by("id")
+                .values_list("name", "phone", "created_at", "interview_candidate__status", "interview_candidate__result")
+            )
+
+        first = snapshot("first")
+        self.assertEqual(len(first), 300)
+        self.assertEqual(first, snapshot("second"))
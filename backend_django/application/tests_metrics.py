@@ -0,0 +1,129 @@
+"""指标注册表与 /api/metrics/ 端点测试：多进程快照合并、文本格式与访问控制。"""
+import json
+import os
+import socket
+import tempfile
+import time
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from . import metrics
+from .auth_security import register_login_failure
+from .metrics import MetricsRegistry, render_prometheus
+from .models import Region, UserProfile
+
+
+class MetricsRegistryTests(SimpleTestCase):
+    def test_collect_merges_snapshots_written_by_other_processes(self):
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_MULTIPROC_DIR=directory):
+            registry = MetricsRegistry(buckets=(0.1, 1.0))
+            registry.inc("hrm_oa_push_total", {"result": "failed", "error_code": "OA_HTTP_ERROR"})
+            registry.observe("hrm_oa_push_duration_seconds", 0.05, {"result": "failed"})
+            other = {
+                "buckets": [0.1, 1.0],
+                "counters": [["hrm_oa_push_total", [["error_code", "OA_HTTP_ERROR"], ["result", "failed"]], 2]],
+                "histograms": [["hrm_oa_push_duration_seconds", [["result", "failed"]], [0, 1, 1], 3.5, 2]],
+            }
+            Path(directory, "worker-b-4242.json").write_text(json.dumps(other), encoding="utf-8")
+
+            collected = registry.collect()
+
+            # 抓取时本进程快照也已落盘，供其他 worker 合并。
+            self.assertEqual(len(list(Path(directory).glob("*.json"))), 2)
+        counters = {name: value for name, _, value in collected["counters"]}
+        self.assertEqual(counters["hrm_oa_push_total"], 3)
+        _, _, bucket_counts, total, count = collected["histograms"][0]
+        self.assertEqual(bucket_counts, [1, 1, 1])
+        self.assertAlmostEqual(total, 3.55)
+        self.assertEqual(count, 3)
+
+    def test_collect_prunes_snapshots_of_exited_processes(self):
+        with tempfile.TemporaryDirectory() as directory, override_settings(
+            METRICS_MULTIPROC_DIR=directory, METRICS_SNAPSHOT_TTL_SECONDS=3600
+        ):
+            registry = MetricsRegistry(buckets=(0.1, 1.0))
+            snapshot = {
+                "buckets": [0.1, 1.0],
+                "counters": [["hrm_login_failures_total", [], 1]],
+                "histograms": [],
+            }
+            # 本机已退出的 pid（超出 pid_max）、超过 TTL 未更新的旧主机快照、仍在更新的其他主机快照。
+            dead_local = Path(directory, f"{socket.gethostname()}-99999999.json")
+            expired_remote = Path(directory, "old-container-7.json")
+            live_remote = Path(directory, "worker-b-4242.json")
+            for path in (dead_local, expired_remote, live_remote):
+                path.write_text(json.dumps(snapshot), encoding="utf-8")
+            stale_at = time.time() - 7200
+            os.utime(expired_remote, (stale_at, stale_at))
+
+            collected = registry.collect()
+
+            self.assertFalse(dead_local.exists())
+            self.assertFalse(expired_remote.exists())
+            self.assertTrue(live_remote.exists())
+        counters = {name: value for name, _, value in collected["counters"]}
+        self.assertEqual(counters["hrm_login_failures_total"], 1)
+
+    def test_render_outputs_cumulative_buckets_with_help_and_type(self):
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.observe("hrm_http_request_duration_seconds", 0.05, {"route": "api/health/", "method": "GET", "status": "2xx"})
+        registry.observe("hrm_http_request_duration_seconds", 0.5, {"route": "api/health/", "method": "GET", "status": "2xx"})
+
+        text = render_prometheus(registry.collect(), buckets=registry.buckets)
+
+        self.assertIn("# TYPE hrm_http_request_duration_seconds histogram", text)
+        labels = 'method="GET",route="api/health/",status="2xx"'
+        self.assertIn(f'hrm_http_request_duration_seconds_bucket{{{labels},le="0.1"}} 1', text)
+        self.assertIn(f'hrm_http_request_duration_seconds_bucket{{{labels},le="1"}} 2', text)
+        self.assertIn(f'hrm_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2', text)
+        self.assertIn(f"hrm_http_request_duration_seconds_count{{{labels}}} 2", text)
+
+
+@override_settings(METRICS_AUTH_TOKEN="scrape-secret")
+class MetricsEndpointTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        metrics.registry.clear()
+        self.addCleanup(metrics.registry.clear)
+        self.client = APIClient()
+        self.region = Region.objects.create(name="指标地区", code="metrics")
+
+    def _login_as(self, username: str, *, global_scope: bool):
+        user = get_user_model().objects.create_user(username=username, password="123456")
+        UserProfile.objects.create(user=user, region=self.region, can_view_all=global_scope)
+        token, _ = Token.objects.get_or_create(user=user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_requires_authentication(self):
+        response = self.client.get("/api/metrics/")
+        self.assertEqual(response.status_code, 401)
+
+    def test_regional_account_is_forbidden(self):
+        self._login_as("metrics_regional", global_scope=False)
+        response = self.client.get("/api/metrics/")
+        self.assertEqual(response.status_code, 403)
+
+    def test_global_account_sees_request_login_and_queue_metrics(self):
+        register_login_failure("someone")
+        self._login_as("metrics_global", global_scope=True)
+        self.client.get("/api/health/")
+
+        response = self.client.get("/api/metrics/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        body = response.content.decode("utf-8")
+        self.assertIn('hrm_http_request_duration_seconds_count{method="GET",route="api/health/",status="2xx"} 1', body)
+        self.assertIn("hrm_login_failures_total 1", body)
+        self.assertIn('hrm_queue_depth{queue="oa_push",status="queued"} 0', body)
+
+    def test_scrape_token_grants_access(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer scrape-secret")
+        self.assertEqual(self.client.get("/api/metrics/").status_code, 200)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer wrong")
+        self.assertEqual(self.client.get("/api/metrics/").status_code, 401)
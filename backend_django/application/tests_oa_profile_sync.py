@@ -26,7 +26,7 @@ class OAProfileSyncTests(TestCase):
             OA_HRM_PROFILE_SYNC_ENABLED=True,
             OA_HRM_PROFILE_SYNC_ONCE=True,
         ):
-            with patch("application.oa_profile_sync.requests.post") as post_mock:
+            with patch("application.oa_profile_sync.oa_post") as post_mock:
                 result = sync_oa_user_real_name(self.user, loginid="oa_sync_user")
         self.assertFalse(result)
         post_mock.assert_not_called()
@@ -54,7 +54,7 @@ class OAProfileSyncTests(TestCase):
             return_value="token-123",
         ):
             with patch("application.oa_profile_sync.encrypt_oa_text_with_spk", return_value="enc-user-id"):
-                with patch("application.oa_profile_sync.requests.post", return_value=response_mock) as post_mock:
+                with patch("application.oa_profile_sync.oa_post", return_value=response_mock) as post_mock:
                     result = sync_oa_user_real_name(self.user, loginid="oa_sync_user")
         self.assertTrue(result)
         self.user.refresh_from_db()
@@ -1,16 +1,41 @@
 """OA 推送能力测试：覆盖状态落库、成功链路与手动重发接口。"""
 from __future__ import annotations
 
+import base64
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 
 from django.contrib.auth import get_user_model
-from django.test import override_settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
 
-from .models import Application, InterviewCandidate, Job, Region, UserProfile
-from .oa_push import OAPushResult, dispatch_oa_push, _TOKEN_CACHE
+from .models import Application, InterviewCandidate, Job, OAPushJob, OperationLog, Region, UserProfile
+from .checks import check_oa_field_mappings
+from .circuit_breaker import reset_circuit_breakers
+from .oa_field_mapping import OAFieldMappingError, compile_oa_field_mapping_plan, get_oa_field_mapping_plan
+from .oa_client import get_oa_session, oa_http_pool_stats, oa_post, reset_oa_session
+from .oa_push import (
+    _TOKEN_CACHE_KEY,
+    _ENCRYPTED_HEADER_CACHE,
+    _ENCRYPTED_HEADER_MAX_ENTRIES,
+    _encrypt_header_value,
+    _load_public_key,
+    OAPushResult,
+    clear_oa_crypto_cache,
+    clear_oa_token_cache,
+    dispatch_oa_push,
+    dispatch_oa_push_many,
+    encrypt_oa_text_with_spk,
+    fetch_oa_token_value,
+)
+from .oa_push_queue import claim_oa_push_jobs, enqueue_oa_push, requeue_stale_oa_push_jobs, run_oa_push_job
 
 
 class _FakeResponse:
@@ -31,8 +56,8 @@ class OAPushTests(APITestCase):
         UserProfile.objects.create(user=self.user, region=self.region, can_view_all=False)
         token, _ = Token.objects.get_or_create(user=self.user)
         self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
-        _TOKEN_CACHE["token"] = ""
-        _TOKEN_CACHE["expires_at"] = None
+        clear_oa_token_cache()
+        clear_oa_crypto_cache()
 
     def _create_passed_candidate(self, name: str = "候选人A") -> InterviewCandidate:
         application = Application.objects.create(
@@ -75,7 +100,7 @@ class OAPushTests(APITestCase):
         OA_PUSH_OTHER_PARAMS={},
     )
     @mock.patch("application.oa_push._encrypt_text_with_spk", return_value="encrypted")
-    @mock.patch("application.oa_push.requests.post")
+    @mock.patch("application.oa_push.oa_post")
     def test_dispatch_success_updates_candidate_status(self, mocked_post, _mocked_encrypt):
         candidate = self._create_passed_candidate(name="推送成功")
         mocked_post.side_effect = [
@@ -105,7 +130,7 @@ class OAPushTests(APITestCase):
         OA_PUSH_OTHER_PARAMS={},
     )
     @mock.patch("application.oa_push._encrypt_text_with_spk", return_value="encrypted")
-    @mock.patch("application.oa_push.requests.post")
+    @mock.patch("application.oa_push.oa_post")
     def test_dispatch_skips_duplicate_when_already_success(self, mocked_post, _mocked_encrypt):
         candidate = self._create_passed_candidate(name="幂等候选人")
         mocked_post.side_effect = [
@@ -122,6 +147,66 @@ class OAPushTests(APITestCase):
         self.assertEqual(second_candidate.oa_push_request_id, "7788")
         self.assertEqual(mocked_post.call_count, first_call_count)
 
+    @override_settings(OA_PUSH_ENABLED=True, OA_PUSH_AUTO_RETRY_TIMES=0)
+    @mock.patch("application.oa_push._push_once")
+    def test_dispatch_many_pushes_concurrently_and_bulk_writes_results(self, mocked_push_once):
+        def _slow_push(candidate):
+            time.sleep(0.2)
+            if candidate.application.name == "批量失败":
+                return OAPushResult(success=False, retryable=False, error_code="OA_PARAM_ERROR", error_message="参数错误")
+            return OAPushResult(success=True, retryable=False, request_id=f"req-{candidate.id}")
+
+        mocked_push_once.side_effect = _slow_push
+        candidates = [self._create_passed_candidate(name=f"批量候选人{index}") for index in range(5)]
+        failed_candidate = self._create_passed_candidate(name="批量失败")
+        pushed_candidate = self._create_passed_candidate(name="批量已推送")
+        pushed_candidate.oa_push_status = InterviewCandidate.OA_PUSH_STATUS_SUCCESS
+        pushed_candidate.oa_push_request_id = "req-old"
+        pushed_candidate.save(update_fields=["oa_push_status", "oa_push_request_id"])
+        ordered_ids = [pushed_candidate.id, failed_candidate.id] + [item.id for item in candidates]
+
+        started = time.monotonic()
+        outcomes = dispatch_oa_push_many(ordered_ids, concurrency=8)
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 0.2 * 6)
+        self.assertEqual([item.id for item, _ in outcomes], ordered_ids)
+        self.assertEqual(mocked_push_once.call_count, 6)
+        self.assertEqual(outcomes[0][1].request_id, "req-old")
+        failed_candidate.refresh_from_db()
+        self.assertEqual(failed_candidate.oa_push_status, InterviewCandidate.OA_PUSH_STATUS_FAILED)
+        self.assertEqual(failed_candidate.oa_push_error_code, "OA_PARAM_ERROR")
+        self.assertEqual(failed_candidate.oa_push_retry_count, 1)
+        for item in candidates:
+            item.refresh_from_db()
+            self.assertEqual(item.oa_push_status, InterviewCandidate.OA_PUSH_STATUS_SUCCESS)
+            self.assertEqual(item.oa_push_request_id, f"req-{item.id}")
+
+    @override_settings(OA_PUSH_QUEUE_ENABLED=False)
+    @mock.patch("application.api_views.interviews.hire.dispatch_oa_push_many")
+    def test_batch_confirm_onboard_inline_uses_bulk_dispatch(self, mocked_dispatch_many):
+        candidate = self._create_passed_candidate(name="批量同步候选人")
+        candidate.offer_status = InterviewCandidate.OFFER_STATUS_CONFIRMED
+        candidate.save(update_fields=["offer_status"])
+        mocked_dispatch_many.side_effect = lambda candidate_ids, is_retry=False: [
+            (
+                InterviewCandidate.objects.select_related("application", "application__region").get(id=candidate_id),
+                OAPushResult(success=True, retryable=False, request_id="req-inline"),
+            )
+            for candidate_id in candidate_ids
+        ]
+
+        response = self.client.post(
+            reverse("admin-passed-candidates-batch-confirm-onboard"),
+            data={"interview_candidate_ids": [candidate.id]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["oa_push"]["success"], 1)
+        mocked_dispatch_many.assert_called_once_with([candidate.id], is_retry=False)
+
+    @override_settings(OA_PUSH_QUEUE_ENABLED=False)
     @mock.patch("application.api_views.interviews.hire.dispatch_oa_push")
     def test_retry_oa_push_endpoint_returns_push_result(self, mocked_dispatch):
         candidate = self._create_passed_candidate(name="接口重发")
@@ -157,3 +242,426 @@ class OAPushTests(APITestCase):
         self.assertEqual(payload.get("message"), "重发失败")
         self.assertFalse(payload.get("oa_push", {}).get("success"))
         self.assertEqual(payload.get("oa_push", {}).get("error_code"), "OA_NETWORK_ERROR")
+
+
+class OAPushQueueTests(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.region = Region.objects.create(name="OA队列区域", code="oa-queue-region")
+        self.job = Job.objects.create(region=self.region, title="队列岗位")
+        self.user = user_model.objects.create_user(username="oa_queue_tester", password="123456")
+        UserProfile.objects.create(user=self.user, region=self.region, can_view_all=False)
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        clear_oa_token_cache()
+        clear_oa_crypto_cache()
+
+    def _create_passed_candidate(self, name: str, **extra) -> InterviewCandidate:
+        application = Application.objects.create(
+            region=self.region,
+            job=self.job,
+            name=name,
+            gender="女",
+            phone="13800009991",
+            wechat=f"wx_{name}",
+        )
+        defaults = {
+            "status": InterviewCandidate.STATUS_COMPLETED,
+            "result": InterviewCandidate.RESULT_PASS,
+            "offer_status": InterviewCandidate.OFFER_STATUS_CONFIRMED,
+        }
+        defaults.update(extra)
+        return InterviewCandidate.objects.create(application=application, **defaults)
+
+    def test_enqueue_marks_pending_and_reuses_active_job(self):
+        candidate = self._create_passed_candidate("入队候选人")
+        queued_candidate, job = enqueue_oa_push(candidate.id, user=self.user, request_id="req-queue-1")
+        self.assertIsNotNone(job)
+        self.assertEqual(queued_candidate.oa_push_status, InterviewCandidate.OA_PUSH_STATUS_PENDING)
+        self.assertEqual(queued_candidate.oa_push_retry_count, 1)
+
+        _, second_job = enqueue_oa_push(candidate.id, is_retry=True, user=self.user)
+        self.assertEqual(second_job.id, job.id)
+        candidate.refresh_from_db()
+        self.assertEqual(candidate.oa_push_retry_count, 1)
+        self.assertEqual(OAPushJob.objects.filter(candidate=candidate).count(), 1)
+
+    def test_enqueue_skips_already_pushed_candidate(self):
+        candidate = self._create_passed_candidate(
+            "已推送候选人",
+            oa_push_status=InterviewCandidate.OA_PUSH_STATUS_SUCCESS,
+            oa_push_request_id="8848",
+        )
+        _, job = enqueue_oa_push(candidate.id, is_retry=True, user=self.user)
+        self.assertIsNone(job)
+        self.assertFalse(OAPushJob.objects.filter(candidate=candidate).exists())
+
+    @override_settings(OA_PUSH_ENABLED=False)
+    def test_worker_job_moves_candidate_from_pending_to_failed(self):
+        candidate = self._create_passed_candidate("后台推送候选人")
+        _, job = enqueue_oa_push(candidate.id, user=self.user, request_id="req-queue-2")
+
+        claimed_ids = claim_oa_push_jobs(limit=10, worker_name="test-worker")
+        self.assertEqual(claimed_ids, [job.id])
+        job.refresh_from_db()
+        self.assertEqual(job.status, OAPushJob.STATUS_RUNNING)
+        self.assertEqual(claim_oa_push_jobs(limit=10, worker_name="test-worker"), [])
+
+        result = run_oa_push_job(job.id)
+        self.assertFalse(result.success)
+        job.refresh_from_db()
+        candidate.refresh_from_db()
+        self.assertEqual(job.status, OAPushJob.STATUS_FAILED)
+        self.assertEqual(job.error_code, "OA_DISABLED")
+        self.assertEqual(candidate.oa_push_status, InterviewCandidate.OA_PUSH_STATUS_FAILED)
+        log = OperationLog.objects.get(action="OA_PUSH_FAILED", interview_candidate=candidate)
+        self.assertEqual(log.operator_id, self.user.id)
+        self.assertEqual(log.request_id, "req-queue-2")
+
+    def test_stale_running_job_is_requeued(self):
+        candidate = self._create_passed_candidate("超时任务候选人")
+        _, job = enqueue_oa_push(candidate.id, user=self.user)
+        claim_oa_push_jobs(limit=1, worker_name="dead-worker")
+        OAPushJob.objects.filter(id=job.id).update(locked_at=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(requeue_stale_oa_push_jobs(stale_seconds=600), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, OAPushJob.STATUS_QUEUED)
+        self.assertEqual(job.locked_by, "")
+
+    @mock.patch("application.api_views.interviews.hire.dispatch_oa_push_many")
+    def test_batch_confirm_onboard_enqueues_without_inline_push(self, mocked_dispatch):
+        candidate = self._create_passed_candidate("批量入队候选人")
+        response = self.client.post(
+            reverse("admin-passed-candidates-batch-confirm-onboard"),
+            data={"interview_candidate_ids": [candidate.id]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["oa_push"]["queued"], 1)
+        mocked_dispatch.assert_not_called()
+        candidate.refresh_from_db()
+        self.assertEqual(candidate.oa_push_status, InterviewCandidate.OA_PUSH_STATUS_PENDING)
+        self.assertTrue(
+            OAPushJob.objects.filter(candidate=candidate, status=OAPushJob.STATUS_QUEUED).exists()
+        )
+
+    def test_retry_endpoint_enqueues_job(self):
+        candidate = self._create_passed_candidate(
+            "重发入队候选人",
+            oa_push_status=InterviewCandidate.OA_PUSH_STATUS_FAILED,
+        )
+        response = self.client.post(
+            reverse("admin-passed-candidate-retry-oa-push", kwargs={"pk": candidate.id}),
+            data={},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload["oa_push"]["queued"])
+        self.assertEqual(payload["candidate"]["oa_push_status"], InterviewCandidate.OA_PUSH_STATUS_PENDING)
+        job = OAPushJob.objects.get(candidate=candidate)
+        self.assertTrue(job.is_retry)
+        self.assertEqual(payload["oa_push"]["job_id"], job.id)
+
+
+_OA_TOKEN_SETTINGS = {
+    "OA_PUSH_ENABLED": True,
+    "OA_PUSH_BASE_URL": "https://oa.example.com",
+    "OA_PUSH_APP_ID": "app-test",
+    "OA_PUSH_SECRIT": "secret-test",
+    "OA_PUSH_SPK": "spk-test",
+    "OA_PUSH_USER_ID": "1001",
+    "OA_PUSH_WORKFLOW_ID": "2001",
+    "OA_PUSH_TOKEN_TTL_SECONDS": 1800,
+    "OA_PUSH_TOKEN_REFRESH_AHEAD_SECONDS": 300,
+    "OA_PUSH_MAIN_FIELD_MAPPINGS": [{"oa_field": "xm", "source": "application.name"}],
+    "OA_PUSH_DETAIL_DATA_TEMPLATE": [],
+    "OA_PUSH_OTHER_PARAMS": {},
+}
+
+
+@override_settings(**_OA_TOKEN_SETTINGS)
+@mock.patch("application.oa_push._encrypt_text_with_spk", return_value="encrypted")
+class OATokenCacheTests(APITestCase):
+    def setUp(self):
+        clear_oa_token_cache()
+        clear_oa_crypto_cache()
+        self.addCleanup(clear_oa_token_cache)
+
+    def _applytoken_calls(self, mocked_post) -> int:
+        return sum(1 for call in mocked_post.call_args_list if str(call.args[0]).endswith("/applytoken"))
+
+    @mock.patch("application.oa_push.oa_post")
+    def test_token_is_fetched_once_and_served_from_shared_cache(self, mocked_post, _mocked_encrypt):
+        mocked_post.return_value = _FakeResponse({"code": 0, "token": "token-shared"})
+
+        self.assertEqual(fetch_oa_token_value(), "token-shared")
+        self.assertEqual(fetch_oa_token_value(), "token-shared")
+        self.assertEqual(mocked_post.call_count, 1)
+        self.assertEqual(cache.get(_TOKEN_CACHE_KEY)["token"], "token-shared")
+
+    @mock.patch("application.oa_push.oa_post")
+    def test_concurrent_refresh_is_single_flight(self, mocked_post, _mocked_encrypt):
+        def _slow_applytoken(*args, **kwargs):
+            time.sleep(0.2)
+            return _FakeResponse({"code": 0, "token": "token-single"})
+
+        mocked_post.side_effect = _slow_applytoken
+        tokens = []
+        threads = [threading.Thread(target=lambda: tokens.append(fetch_oa_token_value())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(tokens, ["token-single"] * 5)
+        self.assertEqual(mocked_post.call_count, 1)
+
+    @mock.patch("application.oa_push.oa_post")
+    def test_proactive_refresh_keeps_old_token_when_refresh_fails(self, mocked_post, _mocked_encrypt):
+        now = timezone.now().timestamp()
+        cache.set(
+            _TOKEN_CACHE_KEY,
+            {"token": "token-old", "expires_at": now + 200, "refresh_at": now - 1},
+            timeout=200,
+        )
+        mocked_post.return_value = _FakeResponse({"code": -1, "msg": "busy"}, status_code=500)
+        self.assertEqual(fetch_oa_token_value(), "token-old")
+
+        mocked_post.return_value = _FakeResponse({"code": 0, "token": "token-new"})
+        self.assertEqual(fetch_oa_token_value(), "token-new")
+        self.assertEqual(mocked_post.call_count, 2)
+
+    @mock.patch("application.oa_push.oa_post")
+    def test_invalid_token_is_evicted_and_refreshed_once(self, mocked_post, _mocked_encrypt):
+        now = timezone.now().timestamp()
+        cache.set(
+            _TOKEN_CACHE_KEY,
+            {"token": "token-stale", "expires_at": now + 1000, "refresh_at": now + 900},
+            timeout=1000,
+        )
+        region = Region.objects.create(name="OA令牌区域", code="oa-token-region")
+        application = Application.objects.create(
+            region=region,
+            job=Job.objects.create(region=region, title="令牌岗位"),
+            name="令牌候选人",
+            gender="男",
+            phone="13800009993",
+            wechat="wx_token",
+        )
+        candidate = InterviewCandidate.objects.create(
+            application=application,
+            status=InterviewCandidate.STATUS_COMPLETED,
+            result=InterviewCandidate.RESULT_PASS,
+            offer_status=InterviewCandidate.OFFER_STATUS_CONFIRMED,
+        )
+        mocked_post.side_effect = [
+            _FakeResponse({"code": "NO_PERMISSION", "errMsg": {"msg": "token不存在或者超时"}}),
+            _FakeResponse({"code": 0, "token": "token-fresh"}),
+            _FakeResponse({"code": "SUCCESS", "data": {"requestid": 6601}, "errMsg": {}}),
+        ]
+
+        _, result = dispatch_oa_push(candidate.id)
+
+        self.assertTrue(result.success)
+        self.assertEqual(self._applytoken_calls(mocked_post), 1)
+        self.assertEqual(mocked_post.call_args_list[2].kwargs["headers"]["token"], "token-fresh")
+        self.assertEqual(cache.get(_TOKEN_CACHE_KEY)["token"], "token-fresh")
+
+
+class OAFieldMappingPlanTests(TestCase):
+    def setUp(self):
+        region = Region.objects.create(name="映射区域", code="oa-mapping-region")
+        application = Application.objects.create(
+            region=region,
+            job=Job.objects.create(region=region, title="映射岗位"),
+            name="映射候选人",
+            gender="女",
+            phone="13800009994",
+            wechat="wx_mapping",
+        )
+        self.candidate = InterviewCandidate.objects.create(
+            application=application,
+            interviewers=["面试官A", "面试官B"],
+            oa_push_payload_snapshot={"workflowId": "2001", "work-history": {"0": "甲公司"}},
+        )
+        self.candidate = InterviewCandidate.objects.select_related(
+            "application", "application__job", "application__region"
+        ).get(pk=self.candidate.pk)
+
+    def test_compiled_plan_resolves_sources_defaults_and_templates(self):
+        plan = compile_oa_field_mapping_plan(
+            [
+                {"oa_field": "xm", "source": "application.name"},
+                {"oa_field": "gw", "source": "application.job.title"},
+                {"oa_field": "dq", "source": "application.region.name"},
+                {"oa_field": "msg", "source": "candidate.interviewers"},
+                {"oa_field": "msgraw", "source": "interviewers", "raw": True},
+                {"oa_field": "lc", "source": "candidate.oa_push_payload_snapshot.workflowId"},
+                {"oa_field": "ll", "source": "candidate.oa_push_payload_snapshot.work-history.0"},
+                {"oa_field": "qs", "source": "candidate.oa_push_payload_snapshot.missing", "default": "无"},
+                {"oa_field": "gs", "source": "constant.总部"},
+                {"oa_field": "kz", "source": ""},
+            ],
+            request_name_template="入职-{name}-{job}-{unknown}",
+            remark_template="{phone}/{candidate_id}",
+        )
+
+        rows = {row["fieldName"]: row["fieldValue"] for row in plan.build_main_data(self.candidate)}
+        self.assertEqual(rows["xm"], "映射候选人")
+        self.assertEqual(rows["gw"], "映射岗位")
+        self.assertEqual(rows["dq"], "映射区域")
+        self.assertEqual(rows["msg"], '["面试官A", "面试官B"]')
+        self.assertEqual(rows["msgraw"], ["面试官A", "面试官B"])
+        self.assertEqual(rows["lc"], "2001")
+        self.assertEqual(rows["ll"], "甲公司")
+        self.assertEqual(rows["qs"], "无")
+        self.assertEqual(rows["gs"], "总部")
+        self.assertEqual(rows["kz"], "")
+        self.assertEqual(plan.render_request_name(self.candidate), "入职-映射候选人-映射岗位-")
+        self.assertEqual(plan.render_remark(self.candidate), f"13800009994/{self.candidate.id}")
+
+    def test_invalid_mappings_raise_clear_errors(self):
+        with self.assertRaisesMessage(OAFieldMappingError, "Application.nmae"):
+            compile_oa_field_mapping_plan([{"oa_field": "xm", "source": "application.nmae"}])
+        with self.assertRaisesMessage(OAFieldMappingError, "oa_field 为空"):
+            compile_oa_field_mapping_plan([{"source": "application.name"}])
+        with self.assertRaisesMessage(OAFieldMappingError, "必须是数组"):
+            compile_oa_field_mapping_plan({"oa_field": "xm"})
+        with self.assertRaisesMessage(OAFieldMappingError, "模板格式错误"):
+            compile_oa_field_mapping_plan(
+                [{"oa_field": "xm", "source": "application.name"}],
+                request_name_template="入职-{name",
+            )
+        with self.assertRaisesMessage(OAFieldMappingError, "不支持下标或属性访问"):
+            compile_oa_field_mapping_plan(
+                [{"oa_field": "xm", "source": "application.name"}],
+                remark_template="{name[0]}",
+            )
+
+    def test_plan_is_cached_until_settings_change(self):
+        with override_settings(OA_PUSH_MAIN_FIELD_MAPPINGS=[{"oa_field": "xm", "source": "application.name"}]):
+            plan = get_oa_field_mapping_plan()
+            self.assertIs(get_oa_field_mapping_plan(), plan)
+            with override_settings(OA_PUSH_MAIN_FIELD_MAPPINGS=[{"oa_field": "sjh", "source": "application.phone"}]):
+                rebuilt = get_oa_field_mapping_plan()
+                self.assertEqual(rebuilt.main_fields[0].oa_field, "sjh")
+            self.assertEqual(get_oa_field_mapping_plan().main_fields[0].oa_field, "xm")
+
+    def test_system_check_reports_bad_mapping_when_enabled(self):
+        bad_mapping = [{"oa_field": "xm", "source": "application.nmae"}]
+        with override_settings(OA_PUSH_ENABLED=True, OA_PUSH_MAIN_FIELD_MAPPINGS=bad_mapping):
+            errors = check_oa_field_mappings(None)
+        self.assertEqual([error.id for error in errors], ["application.E001"])
+        with override_settings(OA_PUSH_ENABLED=False, OA_PUSH_MAIN_FIELD_MAPPINGS=bad_mapping):
+            self.assertEqual(check_oa_field_mappings(None), [])
+
+
+def _generate_spk() -> tuple[object, str]:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    der = private_key.public_key().public_bytes(
+        serialization.Encoding.DER,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_key, base64.b64encode(der).decode("ascii")
+
+
+class OACryptoCacheTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.private_key, cls.spk = _generate_spk()
+
+    def setUp(self):
+        clear_oa_crypto_cache()
+        self.addCleanup(clear_oa_crypto_cache)
+
+    def _decrypt(self, value: str) -> str:
+        from cryptography.hazmat.primitives.asymmetric import padding
+
+        return self.private_key.decrypt(base64.b64decode(value), padding.PKCS1v15()).decode("utf-8")
+
+    def test_public_key_is_parsed_once_and_ciphertext_reused(self):
+        first = _encrypt_header_value(self.spk, "3802")
+        second = _encrypt_header_value(self.spk, "3802")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self._decrypt(first), "3802")
+        self.assertEqual(_load_public_key.cache_info().misses, 1)
+        self.assertEqual(self._decrypt(encrypt_oa_text_with_spk("secret", spk=self.spk)), "secret")
+        self.assertEqual(_load_public_key.cache_info().misses, 1)
+
+    def test_cache_is_bounded_and_skips_public_helper(self):
+        for index in range(_ENCRYPTED_HEADER_MAX_ENTRIES + 5):
+            _encrypt_header_value(self.spk, f"user-{index}")
+        encrypt_oa_text_with_spk("free-text", spk=self.spk)
+
+        self.assertEqual(len(_ENCRYPTED_HEADER_CACHE), _ENCRYPTED_HEADER_MAX_ENTRIES)
+        self.assertNotIn((self.spk, "user-0"), _ENCRYPTED_HEADER_CACHE)
+        self.assertNotIn((self.spk, "free-text"), _ENCRYPTED_HEADER_CACHE)
+
+    @override_settings(OA_PUSH_ENCRYPTED_HEADER_CACHE_SECONDS=0)
+    def test_zero_window_encrypts_every_time(self):
+        first = _encrypt_header_value(self.spk, "3802")
+        second = _encrypt_header_value(self.spk, "3802")
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(self._decrypt(second), "3802")
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        body = b'{"code": "1"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        return
+
+
+class OAHttpClientTests(SimpleTestCase):
+    def setUp(self):
+        reset_oa_session()
+        reset_circuit_breakers()
+        self.addCleanup(reset_oa_session)
+
+    def test_session_is_shared_and_rebuilt_on_pool_config_change(self):
+        session = get_oa_session()
+        self.assertIs(get_oa_session(), session)
+        adapter = session.get_adapter("https://oa.example.com")
+        self.assertEqual(adapter.max_retries.connect, 2)
+        self.assertEqual(adapter.max_retries.read, 0)
+
+        with override_settings(OA_HTTP_POOL_MAXSIZE=32):
+            rebuilt = get_oa_session()
+        self.assertIsNot(rebuilt, session)
+        self.assertEqual(rebuilt.get_adapter("https://oa.example.com")._pool_maxsize, 32)
+
+    def test_keep_alive_connection_is_reused_across_calls(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}/api/ec/dev/auth/applytoken"
+
+        for _ in range(3):
+            response = oa_post(url, breaker="oa:applytoken", data={"a": "1"}, timeout=5)
+            self.assertEqual(response.json(), {"code": "1"})
+
+        stats = oa_http_pool_stats()
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["new_connections"], 1)
+        self.assertEqual(stats["reused"], 2)
+
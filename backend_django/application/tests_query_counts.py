@@ -0,0 +1,208 @@
+"""查询次数回归测试：锁定管理端列表/详情接口的 SQL 次数，数据量增加时不得增长。"""
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from .models import (
+    Application,
+    ApplicationAttachment,
+    InterviewCandidate,
+    InterviewRoundRecord,
+    Job,
+    OperationLog,
+    Region,
+    UserProfile,
+)
+
+# 公共开销：setUp 中已预热认证缓存，Token 认证与地区范围判断不再查询。
+_AUTH_QUERIES = 0
+# 列表条件请求：结果集指纹聚合 1 次。
+_ETAG_QUERIES = 1
+
+
+class AdminEndpointQueryCountTests(APITestCase):
+    def setUp(self):
+        # 附件写入临时目录，避免测试文件落到项目 media/ 下。
+        media_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(media_dir.cleanup)
+        media_override = override_settings(MEDIA_ROOT=media_dir.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        self.region = Region.objects.create(name="查询计数地区", code="query-count")
+        self.job = Job.objects.create(region=self.region, title="查询计数岗位")
+        self.user = get_user_model().objects.create_user(username="query_counter", password="123456")
+        UserProfile.objects.create(user=self.user, region=self.region, can_view_all=False)
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self.client.get(reverse("auth-me"))
+        self._seq = 0
+
+    def _create_application(self, *, attachments: int = 2) -> Application:
+        self._seq += 1
+        application = Application.objects.create(
+            region=self.region,
+            job=self.job,
+            name=f"计数应聘者{self._seq}",
+            gender="男",
+            phone=f"1370000{self._seq:04d}",
+        )
+        for index in range(attachments):
+            ApplicationAttachment.objects.create(
+                application=application,
+                category="photo" if index == 0 else "other",
+                file=SimpleUploadedFile(f"file{index}.jpg", b"data", content_type="image/jpeg"),
+            )
+        return application
+
+    def _create_candidate(self, *, result: str = "", rounds: int = 2) -> InterviewCandidate:
+        application = self._create_application()
+        candidate = InterviewCandidate.objects.create(
+            application=application,
+            status=InterviewCandidate.STATUS_COMPLETED if result else InterviewCandidate.STATUS_PENDING,
+            result=result,
+            result_at=timezone.now() if result else None,
+            interview_round=max(rounds, 1),
+        )
+        for round_no in range(1, rounds + 1):
+            InterviewRoundRecord.objects.create(
+                candidate=candidate,
+                round_no=round_no,
+                interviewer=f"面试官{round_no}",
+                interviewers=[f"面试官{round_no}"],
+                result=InterviewCandidate.RESULT_NEXT_ROUND if round_no < rounds else (result or ""),
+            )
+        return candidate
+
+    def _assert_locked(self, url: str, expected: int, grow):
+        """先锁定查询次数，再追加数据确认次数不随行数增长。"""
+        with self.assertNumQueries(expected):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        for _ in range(3):
+            grow()
+        with self.assertNumQueries(expected):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_application_detail(self):
+        candidate = self._create_candidate(result=InterviewCandidate.RESULT_PASS, rounds=2)
+        application = candidate.application
+        url = reverse("admin-application-detail", kwargs={"pk": application.id})
+
+        def grow():
+            ApplicationAttachment.objects.create(
+                application=application,
+                category="other",
+                file=SimpleUploadedFile("extra.pdf", b"data", content_type="application/pdf"),
+            )
+            InterviewRoundRecord.objects.create(
+                candidate=candidate,
+                round_no=InterviewRoundRecord.objects.filter(candidate=candidate).count() + 1,
+                result=InterviewCandidate.RESULT_PASS,
+            )
+
+        # 主表(含 region/job/interview_candidate) 1 + 附件 1 + 轮次快照 1
+        response = self._assert_locked(url, _AUTH_QUERIES + 3, grow)
+        payload = response.json()
+        self.assertEqual(len(payload["attachments"]), 5)
+        self.assertEqual(payload["latest_interview_result"]["round"], 5)
+        self.assertTrue(payload["photo_url"])
+
+    def test_application_detail_without_candidate(self):
+        application = self._create_application(attachments=1)
+        url = reverse("admin-application-detail", kwargs={"pk": application.id})
+        # 无候选人时不触发轮次预取。
+        with self.assertNumQueries(_AUTH_QUERIES + 2):
+            response = self.client.get(url)
+        self.assertIsNone(response.json()["latest_interview_result"])
+
+    def test_application_list(self):
+        self._create_application()
+        # 主表 1 + 照片附件 1
+        self._assert_locked(reverse("admin-applications"), _AUTH_QUERIES + _ETAG_QUERIES + 2, self._create_application)
+
+    def test_interview_pool_list(self):
+        self._create_candidate(rounds=1)
+        # 主表 1 + 照片附件 1
+        self._assert_locked(
+            reverse("admin-interview-candidates"),
+            _AUTH_QUERIES + _ETAG_QUERIES + 2,
+            lambda: self._create_candidate(rounds=1),
+        )
+
+    def test_outcome_pool_lists(self):
+        for url_name, result in (
+            ("admin-passed-candidates", InterviewCandidate.RESULT_PASS),
+            ("admin-talent-pool-candidates", InterviewCandidate.RESULT_REJECT),
+        ):
+            with self.subTest(url_name=url_name):
+                self._create_candidate(result=result)
+                # 快速路径：values() 行 1 + 轮次快照 1
+                self._assert_locked(
+                    reverse(url_name), _AUTH_QUERIES + _ETAG_QUERIES + 2, lambda: self._create_candidate(result=result)
+                )
+                # 页码分页：count 1 + 定位本页 1 + values() 行 1 + 轮次快照 1
+                self._assert_locked(
+                    f"{reverse(url_name)}?page=1&page_size=2",
+                    _AUTH_QUERIES + _ETAG_QUERIES + 4,
+                    lambda: self._create_candidate(result=result),
+                )
+
+    def test_operation_log_list(self):
+        def grow():
+            OperationLog.objects.create(
+                operator=self.user,
+                operator_username=self.user.username,
+                module="interviews",
+                action="ADD_TO_INTERVIEW_POOL",
+                region=self.region,
+                summary="计数日志",
+            )
+
+        grow()
+        self._assert_locked(reverse("admin-operation-logs"), _AUTH_QUERIES + _ETAG_QUERIES + 1, grow)
+
+    def _post_talent_pool_batch(self, *, size: int):
+        """构造混合状态的一批：新建、待面试迁移、已在库、已通过拦截各占一部分。"""
+        new_apps = [self._create_application(attachments=0) for _ in range(size)]
+        pending = [self._create_candidate(rounds=0) for _ in range(size)]
+        existing = self._create_candidate(result=InterviewCandidate.RESULT_REJECT, rounds=0)
+        passed = self._create_candidate(result=InterviewCandidate.RESULT_PASS, rounds=0)
+        application_ids = [app.id for app in new_apps] + [item.application_id for item in pending]
+        application_ids += [existing.application_id, passed.application_id]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("admin-talent-pool-candidates-batch-add"),
+                data={"application_ids": application_ids},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "moved": size * 2,
+                "existing": 1,
+                "blocked": 1,
+                "blocked_application_ids": [passed.application_id],
+                "total": size * 2 + 2,
+            },
+        )
+        return len(queries.captured_queries)
+
+    def test_talent_pool_batch_add_uses_set_based_writes(self):
+        small = self._post_talent_pool_batch(size=2)
+        large = self._post_talent_pool_batch(size=20)
+        self.assertEqual(small, large)
+        self.assertEqual(
+            InterviewCandidate.objects.filter(result=InterviewCandidate.RESULT_REJECT, note="简历初筛未通过").count(),
+            44,
+        )
@@ -0,0 +1,44 @@
+"""查询计划回归测试：通过数据库 EXPLAIN 校验面试池/结果池列表命中复合索引。"""
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+
+from .api_views import (
+    AdminInterviewCandidateListView,
+    AdminPassedCandidateListView,
+    AdminTalentPoolCandidateListView,
+)
+
+# 各数据库 EXPLAIN 输出中“额外排序”的标记：命中排序索引时不应出现。
+_FILESORT_MARKERS = {
+    "sqlite": "TEMP B-TREE FOR ORDER BY",
+    "mysql": "Using filesort",
+}
+
+
+class InterviewCandidateQueryPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = get_user_model().objects.create_superuser(username="plan_admin", password="123456")
+
+    def _plan(self, view_class) -> str:
+        view = view_class()
+        view.request = SimpleNamespace(user=self.superuser)
+        return view.get_queryset().explain()
+
+    def _assert_index_without_filesort(self, plan: str, index_name: str):
+        self.assertIn(index_name, plan)
+        marker = _FILESORT_MARKERS.get(connection.vendor)
+        if marker:
+            self.assertNotIn(marker, plan)
+
+    def test_outcome_pools_use_outcome_index_without_filesort(self):
+        for view_class in (AdminPassedCandidateListView, AdminTalentPoolCandidateListView):
+            with self.subTest(view=view_class.__name__):
+                self._assert_index_without_filesort(self._plan(view_class), "candidate_outcome")
+
+    def test_interview_pool_uses_status_index(self):
+        # 拟面试池保持默认排序（创建时间倒序、id 正序），按状态索引取行后对流程中的少量候选人排序。
+        self.assertIn("candidate_status_created", self._plan(AdminInterviewCandidateListView))
@@ -1,8 +1,13 @@
 """请求日志中间件测试：验证 request_id 透传与状态日志落盘。"""
 
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 
+from .models import Region
+from .sql_profiling import SqlProfiler
+
 
 class RequestLoggingMiddlewareTests(TestCase):
     def setUp(self):
@@ -28,3 +33,49 @@ class RequestLoggingMiddlewareTests(TestCase):
             response = self.client.get("/api/not-exists/")
         self.assertEqual(response.status_code, 404)
         self.assertTrue(any("status=404" in entry for entry in logs.output))
+
+
+class RequestSqlProfilingTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        Region.objects.create(name="剖析地区", code="profiling")
+        user = get_user_model().objects.create_superuser(username="profiling_admin", password="123456")
+        token, _ = Token.objects.get_or_create(user=user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    @override_settings(REQUEST_SQL_PROFILING_ENABLED=True, REQUEST_SQL_PROFILING_SAMPLE_PERCENT=100)
+    def test_profiled_request_logs_sql_summary_and_server_timing(self):
+        with self.assertLogs("application.request", level="INFO") as logs:
+            response = self.client.get("/api/admin/regions/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("db;dur=", response.headers.get("Server-Timing", ""))
+        complete = next(entry for entry in logs.output if "backend_request_complete" in entry)
+        self.assertIn("sql_count=", complete)
+        self.assertIn("sql_slowest=[{'ms':", complete)
+
+    @override_settings(REQUEST_SQL_PROFILING_ENABLED=True, REQUEST_SQL_PROFILING_SAMPLE_PERCENT=0)
+    def test_unsampled_request_is_not_profiled(self):
+        with self.assertLogs("application.request", level="INFO") as logs:
+            response = self.client.get("/api/admin/regions/")
+        self.assertNotIn("Server-Timing", response.headers)
+        self.assertFalse(any("sql_count=" in entry for entry in logs.output))
+
+    def test_profiling_disabled_by_default(self):
+        response = self.client.get("/api/health/")
+        self.assertNotIn("Server-Timing", response.headers)
+
+    def test_profiler_counts_duplicates_and_repeated_templates(self):
+        profiler = SqlProfiler(slow_top=2)
+
+        def execute(sql, params, many, context):
+            return None
+
+        for params in ((1,), (1,), (2,), (3,)):
+            profiler(execute, "SELECT * FROM t WHERE id = %s", params, False, {})
+        profiler(execute, "SELECT 1", (), False, {})
+
+        summary = profiler.summary()
+        self.assertEqual(summary["sql_count"], 5)
+        self.assertEqual(summary["sql_dup"], 1)
+        self.assertEqual(summary["sql_max_repeat"], 4)
+        self.assertEqual(len(summary["sql_slowest"]), 2)
@@ -0,0 +1,135 @@
+"""应聘记录全文检索测试：保存时维护索引、排序与高亮、地区范围与人员池过滤、重建命令。"""
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from .models import Application, ApplicationSearchTerm, InterviewCandidate, Job, Region, UserProfile
+
+
+class ApplicationSearchTests(APITestCase):
+    def setUp(self):
+        self.region = Region.objects.create(name="检索地区", code="search-region")
+        self.other_region = Region.objects.create(name="检索其他地区", code="search-other")
+        self.job = Job.objects.create(region=self.region, title="检索岗位")
+        self.other_job = Job.objects.create(region=self.other_region, title="其他地区岗位")
+        self.user = get_user_model().objects.create_user(username="search_tester", password="123456")
+        UserProfile.objects.create(user=self.user, region=self.region, can_view_all=False)
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self._seq = 0
+
+    def _create_application(self, *, job=None, **fields) -> Application:
+        self._seq += 1
+        job = job or self.job
+        defaults = {"name": f"应聘者{self._seq}", "gender": "男", "phone": f"1390000{self._seq:04d}"}
+        defaults.update(fields)
+        return Application.objects.create(region=job.region, job=job, **defaults)
+
+    def _search(self, keyword: str, **params):
+        return self.client.get(reverse("admin-applications-search"), {"q": keyword, **params})
+
+    def test_search_ranks_by_field_weight_and_highlights(self):
+        by_evaluation = self._create_application(self_evaluation="性格开朗，曾在华东师范大学交流学习")
+        by_school = self._create_application(graduate_school="华东师范大学", major="汉语言文学")
+        self._create_application(self_evaluation="踏实肯干")
+
+        response = self._search("华东师范")
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["count"], 2)
+        self.assertEqual([item["id"] for item in payload["results"]], [by_school.id, by_evaluation.id])
+
+        top = payload["results"][0]
+        self.assertEqual(top["pool"], "applications")
+        self.assertEqual(top["graduate_school"], "华东师范大学")
+        highlight = top["highlights"][0]
+        self.assertEqual(highlight["field"], "graduate_school")
+        start, end = highlight["matches"][0]
+        self.assertEqual(highlight["snippet"][start:end], "华东师范")
+
+    def test_search_phone_fragment_and_work_history(self):
+        application = self._create_application(
+            phone="138-1234-5678",
+            work_history=[{"company": "星河科技有限公司", "position": "Java 开发"}],
+        )
+        self._create_application()
+
+        by_phone = self._search("12345678").json()
+        self.assertEqual([item["id"] for item in by_phone["results"]], [application.id])
+        snippet = by_phone["results"][0]["highlights"][0]
+        start, end = snippet["matches"][0]
+        self.assertEqual(snippet["snippet"][start:end], "1234-5678")
+
+        by_work = self._search("java").json()
+        self.assertEqual([item["id"] for item in by_work["results"]], [application.id])
+        self.assertEqual(by_work["results"][0]["highlights"][0]["field"], "work_history")
+
+        self.assertEqual(self._search("星").json()["count"], 1)
+
+    def test_search_respects_region_scope_and_pool(self):
+        rejected = self._create_application(name="王小明")
+        InterviewCandidate.objects.create(
+            application=rejected,
+            status=InterviewCandidate.STATUS_COMPLETED,
+            result=InterviewCandidate.RESULT_REJECT,
+        )
+        fresh = self._create_application(name="王小明")
+        self._create_application(job=self.other_job, name="王小明")
+
+        payload = self._search("王小明").json()
+        self.assertEqual({item["id"] for item in payload["results"]}, {rejected.id, fresh.id})
+
+        talent = self._search("王小明", pool="talent_pool").json()
+        self.assertEqual([item["id"] for item in talent["results"]], [rejected.id])
+        self.assertEqual(talent["results"][0]["pool"], "talent_pool")
+
+        self.assertEqual(self._search("王小明", pool="unknown").status_code, 400)
+        self.assertEqual(self._search("  ，").status_code, 400)
+
+    def test_save_reindexes_changed_fields(self):
+        application = self._create_application(major="会计学")
+        self.assertEqual(self._search("会计").json()["count"], 1)
+
+        application.major = "市场营销"
+        application.save()
+        self.assertEqual(self._search("会计").json()["count"], 0)
+        self.assertEqual(self._search("营销").json()["count"], 1)
+
+    def test_accent_variants_fold_to_one_term(self):
+        # utf8mb4_unicode_ci 下 re 与 ré 相等，折叠前同一记录会写出两条“相同”索引词而违反唯一约束。
+        application = self._create_application(self_evaluation="Résumé REVIEW，擅长 Straße 项目")
+        terms = set(ApplicationSearchTerm.objects.filter(application=application).values_list("term", flat=True))
+        self.assertIn("re", terms)
+        self.assertIn("ss", terms)
+        self.assertFalse({"ré", "és", "mé", "ß"} & terms)
+
+        for keyword in ("resume", "RÉSUMÉ", "strasse"):
+            with self.subTest(keyword=keyword):
+                self.assertEqual([item["id"] for item in self._search(keyword).json()["results"]], [application.id])
+
+    def test_index_failure_does_not_fail_application_save(self):
+        with mock.patch.object(
+            ApplicationSearchTerm.objects, "bulk_create", side_effect=IntegrityError("duplicate term")
+        ):
+            with self.assertLogs("application.search_index", "WARNING"):
+                application = self._create_application(major="土木工程")
+
+        self.assertTrue(Application.objects.filter(pk=application.pk).exists())
+        self.assertFalse(ApplicationSearchTerm.objects.filter(application=application).exists())
+
+    def test_rebuild_command_indexes_existing_records(self):
+        with override_settings(APPLICATION_SEARCH_INDEX_ENABLED=False):
+            application = self._create_application(major="机械设计")
+        self.assertFalse(ApplicationSearchTerm.objects.filter(application=application).exists())
+        self.assertEqual(self._search("机械").json()["count"], 0)
+
+        call_command("rebuild_search_index", "--batch-size", "1", stdout=StringIO())
+
+        self.assertEqual([item["id"] for item in self._search("机械").json()["results"]], [application.id])
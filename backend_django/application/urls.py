@@ -4,12 +4,16 @@ from django.urls import path
 from .views import (
     AdminApplicationDetailView,
     AdminApplicationListView,
+    AdminApplicationSearchView,
+    AdminBatchOperationJobDetailView,
+    AdminBatchOperationJobListView,
     AdminInterviewCandidateBatchAddView,
     AdminInterviewCandidateBatchRemoveView,
     AdminInterviewCandidateCancelScheduleView,
     AdminInterviewCandidateDetailView,
     AdminInterviewCandidateListView,
     AdminInterviewMetaView,
+    AdminIntegrationMetaView,
     AdminOperationLogDetailView,
     AdminOperationLogListView,
     AdminOperationLogMetaView,
@@ -47,12 +51,14 @@ from .views import (
     OALoginExchangeView,
     LogoutView,
     MeView,
+    MetricsView,
     RegisterView,
     RegionListView,
 )
 
 urlpatterns = [
     path("health/", HealthCheckView.as_view(), name="health"),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
     path("regions/", RegionListView.as_view(), name="regions"),
     path("jobs/", JobListView.as_view(), name="jobs"),
     path("jobs/<int:pk>/", JobDetailView.as_view(), name="job-detail"),
@@ -87,6 +93,7 @@ urlpatterns = [
     path("admin/jobs/batch-status/", AdminJobBatchStatusView.as_view(), name="admin-jobs-batch-status"),
     path("admin/jobs/<int:pk>/", AdminJobDetailView.as_view(), name="admin-job-detail"),
     path("admin/applications/", AdminApplicationListView.as_view(), name="admin-applications"),
+    path("admin/applications/search/", AdminApplicationSearchView.as_view(), name="admin-applications-search"),
     path(
         "admin/applications/<int:pk>/",
         AdminApplicationDetailView.as_view(),
@@ -117,6 +124,11 @@ urlpatterns = [
         AdminOperationLogMetaView.as_view(),
         name="admin-operation-logs-meta",
     ),
+    path(
+        "admin/integrations/meta/",
+        AdminIntegrationMetaView.as_view(),
+        name="admin-integrations-meta",
+    ),
     path(
         "admin/passed-candidates/",
         AdminPassedCandidateListView.as_view(),
@@ -192,6 +204,12 @@ urlpatterns = [
         AdminInterviewCandidateBatchRemoveView.as_view(),
         name="admin-interview-candidates-batch-remove",
     ),
+    path("admin/batch-jobs/", AdminBatchOperationJobListView.as_view(), name="admin-batch-jobs"),
+    path(
+        "admin/batch-jobs/<int:pk>/",
+        AdminBatchOperationJobDetailView.as_view(),
+        name="admin-batch-job-detail",
+    ),
     path("admin/users/", AdminUserListView.as_view(), name="admin-users"),
     path("admin/users/<int:pk>/", AdminUserDetailView.as_view(), name="admin-user-detail"),
     path(
@@ -31,6 +31,7 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "application.request_logging.RequestLoggingMiddleware",
+    "application.audit.OperationLogBatchMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -86,6 +87,25 @@ DATABASES = {
     }
 }
 
+# 缓存后端：默认进程内 LocMem；多 worker/多主机部署需改为共享后端（如 DatabaseCache 或 RedisCache），
+# 否则 OA token、登录失败锁定等状态只在单个进程内生效。
+CACHE_BACKEND = str(
+    os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache")
+    or "django.core.cache.backends.locmem.LocMemCache"
+).strip()
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKEND,
+        "LOCATION": str(os.getenv("CACHE_LOCATION", "") or "").strip(),
+        "KEY_PREFIX": str(os.getenv("CACHE_KEY_PREFIX", "hrm") or "hrm").strip(),
+        "TIMEOUT": get_int("CACHE_DEFAULT_TIMEOUT_SECONDS", 300),
+    }
+}
+PUBLIC_CATALOG_CACHE_ENABLED = get_bool("PUBLIC_CATALOG_CACHE_ENABLED", True)
+PUBLIC_CATALOG_CACHE_SECONDS = get_int("PUBLIC_CATALOG_CACHE_SECONDS", 300)
+# 应聘记录检索索引：保存时同步维护倒排索引；批量导入关闭后用 rebuild_search_index 命令重建。
+APPLICATION_SEARCH_INDEX_ENABLED = get_bool("APPLICATION_SEARCH_INDEX_ENABLED", True)
+
 AUTH_PASSWORD_MIN_LENGTH = get_int("AUTH_PASSWORD_MIN_LENGTH", 8)
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -104,6 +124,9 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 AUTH_TOKEN_TTL_HOURS = get_int("AUTH_TOKEN_TTL_HOURS", 24)
+# 认证缓存：按 token 摘要缓存账号与区域权限，退出/改密/删号/权限变更时主动失效。
+AUTH_TOKEN_CACHE_ENABLED = get_bool("AUTH_TOKEN_CACHE_ENABLED", True)
+AUTH_TOKEN_CACHE_SECONDS = get_int("AUTH_TOKEN_CACHE_SECONDS", 60)
 AUTH_LOGIN_RATE = os.getenv("AUTH_LOGIN_RATE", "10/min")
 AUTH_LOGIN_MAX_FAILURES = get_int("AUTH_LOGIN_MAX_FAILURES", 5)
 AUTH_LOGIN_LOCK_MINUTES = get_int("AUTH_LOGIN_LOCK_MINUTES", 15)
@@ -120,6 +143,9 @@ OA_HRM_PROFILE_SYNC_ENABLED = get_bool("OA_HRM_PROFILE_SYNC_ENABLED", False)
 OA_HRM_PROFILE_SYNC_ONCE = get_bool("OA_HRM_PROFILE_SYNC_ONCE", True)
 APPLICATION_ATTACHMENT_MAX_FILE_MB = get_int("APPLICATION_ATTACHMENT_MAX_FILE_MB", 10)
 APPLICATION_ATTACHMENT_MAX_TOTAL_MB = get_int("APPLICATION_ATTACHMENT_MAX_TOTAL_MB", 40)
+ADMIN_UNPAGINATED_LIST_MAX_ROWS = get_int("ADMIN_UNPAGINATED_LIST_MAX_ROWS", 2000)
+ADMIN_LIST_ETAG_ENABLED = get_bool("ADMIN_LIST_ETAG_ENABLED", True)
+ADMIN_LIST_STREAM_CHUNK_SIZE = get_int("ADMIN_LIST_STREAM_CHUNK_SIZE", 500)
 
 LANGUAGE_CODE = "zh-hans"
 TIME_ZONE = "Asia/Shanghai"
@@ -167,6 +193,8 @@ OA_PUSH_SPK = str(os.getenv("OA_PUSH_SPK", "") or "").strip()
 OA_PUSH_USER_ID = str(os.getenv("OA_PUSH_USER_ID", "") or "").strip()
 OA_PUSH_WORKFLOW_ID = str(os.getenv("OA_PUSH_WORKFLOW_ID", "") or "").strip()
 OA_PUSH_TOKEN_TTL_SECONDS = get_int("OA_PUSH_TOKEN_TTL_SECONDS", 1800)
+OA_PUSH_TOKEN_REFRESH_AHEAD_SECONDS = get_int("OA_PUSH_TOKEN_REFRESH_AHEAD_SECONDS", 300)
+OA_PUSH_ENCRYPTED_HEADER_CACHE_SECONDS = get_int("OA_PUSH_ENCRYPTED_HEADER_CACHE_SECONDS", 600)
 OA_PUSH_REQUEST_TIMEOUT_SECONDS = get_int("OA_PUSH_REQUEST_TIMEOUT_SECONDS", 10)
 OA_PUSH_REQUEST_NAME_TEMPLATE = str(
     os.getenv("OA_PUSH_REQUEST_NAME_TEMPLATE", "入职确认-{name}") or "入职确认-{name}"
@@ -181,6 +209,21 @@ OA_PUSH_CONTENT_TYPE = str(
     or "application/x-www-form-urlencoded; charset=utf-8"
 ).strip()
 OA_PUSH_AUTO_RETRY_TIMES = get_int("OA_PUSH_AUTO_RETRY_TIMES", 1)
+OA_PUSH_QUEUE_ENABLED = get_bool("OA_PUSH_QUEUE_ENABLED", True)
+OA_PUSH_WORKER_CONCURRENCY = get_int("OA_PUSH_WORKER_CONCURRENCY", 4)
+OA_PUSH_JOB_STALE_SECONDS = get_int("OA_PUSH_JOB_STALE_SECONDS", 600)
+OA_PUSH_BATCH_CONCURRENCY = get_int("OA_PUSH_BATCH_CONCURRENCY", 8)
+OA_HTTP_POOL_CONNECTIONS = get_int("OA_HTTP_POOL_CONNECTIONS", 4)
+OA_HTTP_POOL_MAXSIZE = get_int("OA_HTTP_POOL_MAXSIZE", 10)
+OA_HTTP_POOL_BLOCK = get_bool("OA_HTTP_POOL_BLOCK", False)
+OA_HTTP_CONNECT_RETRIES = get_int("OA_HTTP_CONNECT_RETRIES", 2)
+OA_HTTP_RETRY_BACKOFF_MS = get_int("OA_HTTP_RETRY_BACKOFF_MS", 200)
+CIRCUIT_BREAKER_ENABLED = get_bool("CIRCUIT_BREAKER_ENABLED", True)
+CIRCUIT_BREAKER_WINDOW_SECONDS = get_int("CIRCUIT_BREAKER_WINDOW_SECONDS", 60)
+CIRCUIT_BREAKER_MIN_REQUESTS = get_int("CIRCUIT_BREAKER_MIN_REQUESTS", 5)
+CIRCUIT_BREAKER_FAILURE_PERCENT = get_int("CIRCUIT_BREAKER_FAILURE_PERCENT", 50)
+CIRCUIT_BREAKER_OPEN_SECONDS = get_int("CIRCUIT_BREAKER_OPEN_SECONDS", 30)
+CIRCUIT_BREAKER_MAX_OPEN_SECONDS = get_int("CIRCUIT_BREAKER_MAX_OPEN_SECONDS", 300)
 _oa_push_main_mappings = get_json("OA_PUSH_MAIN_FIELD_MAPPINGS", [])
 OA_PUSH_MAIN_FIELD_MAPPINGS = (
     _oa_push_main_mappings if isinstance(_oa_push_main_mappings, list) else []
@@ -201,8 +244,18 @@ _oa_push_other_params = get_json(
 )
 OA_PUSH_OTHER_PARAMS = _oa_push_other_params if isinstance(_oa_push_other_params, dict) else {}
 
+BATCH_JOB_QUEUE_ENABLED = get_bool("BATCH_JOB_QUEUE_ENABLED", True)
+BATCH_JOB_WORKER_CONCURRENCY = get_int("BATCH_JOB_WORKER_CONCURRENCY", 2)
+BATCH_JOB_STALE_SECONDS = get_int("BATCH_JOB_STALE_SECONDS", 600)
+BATCH_JOB_CHUNK_SIZE = get_int("BATCH_JOB_CHUNK_SIZE", 100)
+BATCH_JOB_MAX_ITEMS = get_int("BATCH_JOB_MAX_ITEMS", 5000)
+
 INTERVIEW_SMS_ENABLED = get_bool("INTERVIEW_SMS_ENABLED", False)
 INTERVIEW_SMS_PROVIDER = str(os.getenv("INTERVIEW_SMS_PROVIDER", "aliyun") or "aliyun").strip().lower()
+INTERVIEW_SMS_QUEUE_ENABLED = get_bool("INTERVIEW_SMS_QUEUE_ENABLED", True)
+INTERVIEW_SMS_WORKER_CONCURRENCY = get_int("INTERVIEW_SMS_WORKER_CONCURRENCY", 4)
+INTERVIEW_SMS_JOB_STALE_SECONDS = get_int("INTERVIEW_SMS_JOB_STALE_SECONDS", 300)
+INTERVIEW_SMS_RATE_PER_SECOND = get_int("INTERVIEW_SMS_RATE_PER_SECOND", 10)
 ALIYUN_SMS_REGION_ID = str(os.getenv("ALIYUN_SMS_REGION_ID", "cn-hangzhou") or "cn-hangzhou").strip()
 ALIYUN_SMS_ACCESS_KEY_ID = str(os.getenv("ALIYUN_SMS_ACCESS_KEY_ID", "") or "").strip()
 ALIYUN_SMS_ACCESS_KEY_SECRET = str(os.getenv("ALIYUN_SMS_ACCESS_KEY_SECRET", "") or "").strip()
@@ -211,6 +264,18 @@ ALIYUN_SMS_TEMPLATE_CODE = str(os.getenv("ALIYUN_SMS_TEMPLATE_CODE", "") or "").
 
 LOG_LEVEL = str(os.getenv("LOG_LEVEL", "INFO") or "INFO").strip().upper()
 REQUEST_LOG_LEVEL = str(os.getenv("REQUEST_LOG_LEVEL", LOG_LEVEL) or LOG_LEVEL).strip().upper()
+REQUEST_SQL_PROFILING_ENABLED = get_bool("REQUEST_SQL_PROFILING_ENABLED", False)
+REQUEST_SQL_PROFILING_SAMPLE_PERCENT = get_int("REQUEST_SQL_PROFILING_SAMPLE_PERCENT", 10)
+REQUEST_SQL_PROFILING_SLOW_TOP = get_int("REQUEST_SQL_PROFILING_SLOW_TOP", 3)
+METRICS_ENABLED = get_bool("METRICS_ENABLED", True)
+METRICS_MULTIPROC_DIR = str(os.getenv("METRICS_MULTIPROC_DIR", "") or "").strip()
+# 多进程快照超过该秒数未更新视为进程已退出，抓取时删除（0 表示只清理本机已退出 pid 的快照）。
+METRICS_SNAPSHOT_TTL_SECONDS = get_int("METRICS_SNAPSHOT_TTL_SECONDS", 86400)
+METRICS_AUTH_TOKEN = str(os.getenv("METRICS_AUTH_TOKEN", "") or "").strip()
+OPERATION_LOG_ASYNC_ENABLED = get_bool("OPERATION_LOG_ASYNC_ENABLED", False)
+OPERATION_LOG_ASYNC_QUEUE_SIZE = get_int("OPERATION_LOG_ASYNC_QUEUE_SIZE", 1000)
+# 进程退出时等待后台线程写完已排队日志的最长秒数，需小于 gunicorn graceful-timeout。
+OPERATION_LOG_ASYNC_EXIT_TIMEOUT_SECONDS = get_int("OPERATION_LOG_ASYNC_EXIT_TIMEOUT_SECONDS", 10)
 
 LOGGING = {
     "version": 1,